@@ -1,19 +1,44 @@
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
+from app.control.db_engine import RoutingSession
 
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={"class_": RoutingSession})
 login_manager = LoginManager()
 
-def create_app():
+def create_app(test_config=None):
     app = Flask(__name__, template_folder="templates", static_folder="static")
     app.config.from_object("app.config.Config")
     if test_config:                    # ADD: allow tests to override settings 
         app.config.update(test_config)
 
+    if app.config.get("PROXY_FIX_X_FOR") or app.config.get("PROXY_FIX_X_PROTO"):
+        # client address/scheme from the trusted proxies' headers (login limiter, logs)
+        from werkzeug.middleware.proxy_fix import ProxyFix
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config["PROXY_FIX_X_FOR"],
+                                x_proto=app.config.get("PROXY_FIX_X_PROTO", 0))
+
+    from app.control.db_engine import configure_engine, install_engine_events
+    configure_engine(app)              # pool settings, replica bind
     db.init_app(app) 
+    install_engine_events(app, db)     # SQLite pragmas on connect
     login_manager.init_app(app)
 
+    from app.control.view_counter import ViewCounter
+    ViewCounter(app)
+
+    from app.control.report_jobs import ReportJobRunner
+    ReportJobRunner(app)
+
+    from app.control.query_instrumentation import QueryInstrumentation
+    QueryInstrumentation(app)
+
+    from app.control.request_metrics import RequestMetrics
+    RequestMetrics(app)
+
+    from app.control.request_profiler import RequestProfiler
+    RequestProfiler(app)
+
     with app.app_context():
         from app.entity.user_profile import UserProfile
         from app.entity.user_account import UserAccount
@@ -22,15 +47,93 @@ def create_app():
         from app.entity.shortlist import Shortlist
         from app.entity.match_record import MatchRecord
         from app.entity.report import Report
+        from app.entity.daily_rollup import DailyRollup
+        from app.entity.cache_version import CacheVersion
+        from app.entity.report_job import ReportJob
+        from app.entity.login_attempt import LoginAttempt
         db.create_all()
         register_blueprints(app)
+    register_commands(app)
+
+    from app.control.request_search import init_search
+    init_search(app)
+
+    from app.control.role_map import init_roles
+    init_roles(app)
+
+    from app.control.login_rate_limiter import init_login_limiter
+    init_login_limiter(app)
 
     login_manager.login_view = "boundary.login"
     @app.get("/health")            # health endpoint so CI has a deterministic check
     def health():
+        # /health?ready=1: readiness (DB answers, pool not saturated) for load balancers
+        from flask import request
+        if request.args.get("ready"):
+            from app.control.request_metrics import readiness
+            ready, details = readiness()
+            return {"status": "ready" if ready else "unavailable", **details}, 200 if ready else 503
         return {"status": "ok"}, 200
     return app
 
+def register_commands(app):
+    import click
+
+    @app.cli.command("rebuild-rollups")
+    def rebuild_rollups():
+        """Recompute the daily report rollups from requests and match records."""
+        from app.control.report_rollup import ReportRollup
+        click.echo(f"Rebuilt {ReportRollup().rebuild()} rollup rows.")
+
+    @app.cli.command("reconcile-shortlists")
+    def reconcile_shortlists():
+        """Remove duplicate shortlist rows and repair Request.shortlistCount drift."""
+        from app.control.shortlist_maintenance import ShortlistMaintenance
+        result = ShortlistMaintenance().reconcile()
+        click.echo(f"Removed {result['duplicates_removed']} duplicates, fixed {result['counters_fixed']} counters.")
+
+    @app.cli.command("rebuild-search-index")
+    def rebuild_search_index():
+        """Repopulate the request keyword search index from the requests table."""
+        from app.control.request_search import get_search_backend
+        backend = get_search_backend()
+        click.echo(f"Indexed {backend.rebuild()} requests ({backend.name}).")
+
+    @app.cli.command("import-users")
+    @click.argument("path", type=click.Path(exists=True, dir_okay=False))
+    @click.option("--workers", type=int, default=None, help="Hashing processes (default: CPU count).")
+    def import_users(path, workers):
+        """Bulk-create user accounts from a CSV or JSONL file (name,email,password,age,phoneNumber,profileID)."""
+        from app.control.useradmin_importUserAccounts_controller import (
+            UserAdminImportUserAccountsController, format_for_filename
+        )
+        controller = UserAdminImportUserAccountsController(workers)
+        with open(path, "rb") as f:
+            rows = controller.parseFile(f, format_for_filename(path))
+        result = controller.importUserAccounts(rows)
+        for e in result["errors"]:
+            click.echo(f"row {e['row']} ({e['email']}): {e['error']}", err=True)
+        click.echo(f"Created {result['created']} accounts, rejected {len(result['errors'])} rows.")
+
+    @app.cli.command("benchmark-hashing")
+    @click.option("--rounds", type=int, default=5, help="Hashes timed per cost (median is reported).")
+    def benchmark_hashing(rounds):
+        """Time password hashing on this host at the configured cost and around it."""
+        from app.control.password_policy import benchmark, get_password_policy
+        policy = get_password_policy()
+        budget_ms = app.config.get("PASSWORD_HASH_BUDGET_MS", 250)
+        click.echo(f"Policy: {policy.method} (budget {budget_ms} ms per login hash)")
+        for cost, seconds in benchmark(policy, rounds):
+            marks = (" <- configured" if cost == policy.cost else "") + (" (over budget)" if seconds * 1000 > budget_ms else "")
+            click.echo(f"  cost {cost:>9}: {seconds * 1000:8.1f} ms/hash{marks}")
+
+    @app.cli.command("create-indexes")
+    def create_indexes():
+        """Create indexes declared on the models that an existing database is missing."""
+        from app.control.index_maintenance import IndexMaintenance
+        created = IndexMaintenance().createMissingIndexes()
+        click.echo("Created: " + ", ".join(created) if created else "All indexes present.")
+
 def register_blueprints(app):
     from app.boundary.routes import boundary_bp
     app.register_blueprint(boundary_bp)
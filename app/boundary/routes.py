@@ -1,6 +1,7 @@
 # app/boundary/routes.py
 from flask import Blueprint, render_template, request, redirect, url_for, flash
 from flask_login import login_required, current_user
+from app.control.role_map import role_required, USER_ADMIN, CSR, PIN, PLATFORM_MANAGER
 from werkzeug.exceptions import NotFound
 
 from app.control.auth_controller import AuthController
@@ -19,7 +20,6 @@ from app.control.useradmin_createUserProfile_controller import UserAdminCreateUs
 from app.control.useradmin_updateUserProfile_controller import UserAdminUpdateUserProfileController
 from app.control.useradmin_suspendUserProfile_controller import UserAdminSuspendUserProfileController
 from app.control.useradmin_activateUserProfile_controller import UserAdminActivateUserProfileController
-from app.control.useradmin_searchUserProfile_controller import UserAdminSearchUserProfileController
 
 # --- CSR controllers ---
 from app.control.csr_searchRequest_controller import CsrSearchRequestController
@@ -30,6 +30,7 @@ from app.control.csr_viewShortlist_controller import CsrViewShortlistController
 from app.control.csr_searchHistory_controller import CsrSearchHistoryController
 from app.control.csr_viewHistory_controller import CsrViewHistoryController
 from app.control.csr_removeShortlist_controller import CsrRemoveShortlistController
+from app.control.date_range import DateRange
 
 # --- PIN controllers ---
 from app.entity.request import Request
@@ -43,6 +44,18 @@ from app.control.pin_trackShortlists_controller import PinTrackShortlistsControl
 
 boundary_bp = Blueprint("boundary", __name__)
 
+def _export_response(export, fmt):
+    # streams an Export (see app/control/export.py) as a file download
+    from flask import Response, abort, stream_with_context
+    from app.control.export import EXPORT_FORMATS, encode
+    if fmt not in EXPORT_FORMATS:
+        abort(400)
+    return Response(
+        stream_with_context(encode(export, fmt)),
+        mimetype=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{export.filename}.{fmt}"'},
+    )
+
 # ----------------------------------
 # HOME & AUTH
 # ----------------------------------
@@ -58,9 +71,12 @@ def login():
     if request.method == "POST":
         email = request.form.get("email")
         password = request.form.get("password")
-        redirect_to, err = AuthController().login(email, password)
+        auth = AuthController()
+        redirect_to, err = auth.login(email, password, request.remote_addr)
         if err:
             flash(err, "danger")
+            if auth.retryAfter:
+                return render_template("auth/login.html"), 429, {"Retry-After": str(auth.retryAfter)}
             return render_template("auth/login.html"), 401
         return redirect(redirect_to or "/")
     return render_template("auth/login.html")
@@ -79,55 +95,73 @@ from app import db
 
 @boundary_bp.route("/admin/dashboard")
 @login_required
+@role_required(USER_ADMIN)
 def admin_dashboard():
-    # Calculate statistics for dashboard
-    total_users = UserAccount.query.count()
-    active_users = UserAccount.query.filter_by(isActive=True).count()
-    suspended_users = UserAccount.query.filter_by(isActive=False).count()
-    total_profiles = UserProfile.query.count()
+    from app.control.dashboard_stats import DashboardStats
 
-    # Pass data to template
-    return render_template(
-        "admin/dashboard.html",
-        total_users=total_users,
-        active_users=active_users,
-        suspended_users=suspended_users,
-        total_profiles=total_profiles
-    )
+    # user/profile totals in one query, shared between admins for a few seconds
+    return render_template("admin/dashboard.html", **DashboardStats().adminStats())
+
+# Recent per-request SQL counts / DB time (query instrumentation ring buffer)
+@boundary_bp.route("/admin/sql-stats")
+@login_required
+@role_required(USER_ADMIN)
+def admin_sql_stats():
+    from app.control.query_instrumentation import get_query_instrumentation
+
+    flagged = request.args.get("flagged") == "1"
+    records = get_query_instrumentation().recentRequests(flagged_only=flagged)
+    return render_template("admin/sql_stats.html", records=records, flagged=flagged)
+
+# Slowest profiled requests (opt-in request profiler)
+@boundary_bp.route("/admin/profiling")
+@login_required
+@role_required(USER_ADMIN)
+def admin_profiling():
+    from app.control.request_profiler import get_request_profiler
+
+    profiler = get_request_profiler()
+    return render_template("admin/profiling.html", enabled=profiler.enabled, captures=profiler.worst())
+
+@boundary_bp.route("/admin/profiling/<name>")
+@login_required
+@role_required(USER_ADMIN)
+def admin_profiling_capture(name):
+    from flask import abort
+    from app.control.request_profiler import get_request_profiler
+
+    try:
+        rows = get_request_profiler().summary(name)
+    except ValueError:
+        abort(404)
+    return render_template("admin/profiling_capture.html", name=name, rows=rows)
+
+@boundary_bp.route("/admin/profiling/<name>/<ext>")
+@login_required
+@role_required(USER_ADMIN)
+def admin_profiling_download(name, ext):
+    from flask import abort, send_file
+    from app.control.request_profiler import get_request_profiler
+
+    try:
+        path = get_request_profiler().path(name, ext)
+    except ValueError:
+        abort(404)
+    return send_file(path, as_attachment=True, download_name=f"{name}.{ext}")
 
 # Users list + search 
 @boundary_bp.route("/admin/users")
 @login_required
+@role_required(USER_ADMIN)
 def admin_users():
-    from app.entity.user_account import UserAccount
     search_query = request.args.get("search", "").strip()
     page = request.args.get("page", 1, type=int)
     per_page = 10
 
-    if search_query:
-        users = UserAdminSearchUserAccountController().searchUserAccountByName(search_query)
-        total = len(users)
-        start = (page - 1) * per_page
-        end = start + per_page
-        pagination_users = users[start:end]
-
-        # Define a simple pagination helper dynamically
-        class Pagination:
-            def __init__(self, page, per_page, total, items):
-                self.page = page
-                self.per_page = per_page
-                self.total = total
-                self.items = items
-                self.pages = (total + per_page - 1) // per_page
-                self.has_prev = page > 1
-                self.has_next = page < self.pages
-                self.prev_num = page - 1
-                self.next_num = page + 1
-
-        pagination = Pagination(page, per_page, total, pagination_users)
-
-    else:
-        pagination = UserAccount.query.paginate(page=page, per_page=per_page, error_out=False)
+    # empty search lists every account (same ordering, same page type)
+    pagination = UserAdminSearchUserAccountController().searchUserAccountByName(
+        search_query, page=page, per_page=per_page
+    )
 
     return render_template(
         "admin/users.html",
@@ -136,9 +170,43 @@ def admin_users():
         search_query=search_query,
     )
 
+# Export the (searched) user list
+@boundary_bp.route("/admin/users/export")
+@login_required
+@role_required(USER_ADMIN)
+def admin_users_export():
+    export = UserAdminSearchUserAccountController().exportUserAccounts(request.args.get("search", "").strip())
+    return _export_response(export, request.args.get("format", "csv"))
+
+# Bulk import (CSV / JSONL upload)
+@boundary_bp.route("/admin/users/import", methods=["GET", "POST"])
+@login_required
+@role_required(USER_ADMIN)
+def admin_import_users():
+    from flask import current_app
+    from app.control.useradmin_importUserAccounts_controller import (
+        UserAdminImportUserAccountsController, format_for_filename
+    )
+
+    result = None
+    if request.method == "POST":
+        upload = request.files.get("file")
+        try:
+            if not upload or not upload.filename:
+                raise ValueError("Choose a file to import.")
+            controller = UserAdminImportUserAccountsController(current_app.config.get("USER_IMPORT_HASH_WORKERS"))
+            rows = controller.parseFile(upload.stream, format_for_filename(upload.filename))
+            result = controller.importUserAccounts(rows)
+            flash(f"Imported {result['created']} accounts, {len(result['errors'])} rows rejected.",
+                  "success" if not result["errors"] else "warning")
+        except ValueError as e:
+            flash(str(e), "danger")
+    return render_template("admin/import_users.html", result=result)
+
 # Create user (GET form + POST submit)
 @boundary_bp.route("/admin/users/create", methods=["GET", "POST"])
 @login_required
+@role_required(USER_ADMIN)
 def admin_create_user():
     from app.entity.user_profile import UserProfile
     profiles = UserProfile.query.filter_by(isActive=True).all()
@@ -166,6 +234,7 @@ def admin_create_user():
 # view user account detail
 @boundary_bp.route("/admin/users/<int:user_id>")
 @login_required
+@role_required(USER_ADMIN)
 def admin_view_user(user_id):
     try:
         user = UserAdminViewUserAccountController().viewUserAccount(user_id)
@@ -182,6 +251,7 @@ def admin_view_user(user_id):
 # Update user account
 @boundary_bp.route("/admin/users/<int:user_id>/edit", methods=["GET", "POST"])
 @login_required
+@role_required(USER_ADMIN)
 def admin_edit_user(user_id):
     from app.entity.user_profile import UserProfile
     from app.entity.user_account import UserAccount
@@ -221,6 +291,7 @@ def admin_edit_user(user_id):
 # Suspend user account
 @boundary_bp.route("/admin/users/<int:user_id>/suspend", methods=["POST"])
 @login_required
+@role_required(USER_ADMIN)
 def admin_suspend_user(user_id):
     try:
         ok = UserAdminSuspendUserAccountController().suspendUserAccount(user_id)
@@ -234,6 +305,7 @@ def admin_suspend_user(user_id):
 # Activate user account
 @boundary_bp.route("/admin/users/<int:user_id>/activate", methods=["POST"])
 @login_required
+@role_required(USER_ADMIN)
 def admin_activate_user(user_id):
     try:
         ok = UserAdminActivateUserAccountController().activateUserAccount(user_id)
@@ -246,6 +318,7 @@ def admin_activate_user(user_id):
 # Profiles list
 @boundary_bp.route("/admin/profiles")
 @login_required
+@role_required(USER_ADMIN)
 def admin_profiles():
     page = request.args.get("page", 1, type=int)
     per_page = 10
@@ -261,6 +334,7 @@ def admin_profiles():
 # Search users by profile ID
 @boundary_bp.route("/admin/search/users-by-profile", methods=["GET"])
 @login_required
+@role_required(USER_ADMIN)
 def admin_search_users_by_profile():
     from app.entity.user_profile import UserProfile
     profile_id = request.args.get("profile_id", type=int)
@@ -268,41 +342,17 @@ def admin_search_users_by_profile():
     if profile_id is not None and profile_id < 1:
         flash("Profile ID must be a positive number.", "warning")
         return redirect(url_for('boundary.admin_profiles'))
-    page = request.args.get("page", 1, type=int)
-    per_page = 10
 
-    users = []
+    # the page lists the profile row only (with its user count), so no user page is fetched
     profile = None
     if profile_id:
         try:
             profile = UserProfile.query.get(profile_id)
-            if profile:
-                users = UserAdminSearchUserProfileController().searchUserByProfile(profile_id)
-            else:
+            if not profile:
                 flash("Profile not found.", "warning")
         except Exception as e:
             flash(str(e), "danger")
 
-    total = len(users)
-    start = (page - 1) * per_page
-    end = start + per_page
-    pagination_users = users[start:end]
-
-    class Pagination:
-        def __init__(self, page, per_page, total, items):
-            self.page = page
-            self.per_page = per_page
-            self.total = total
-            self.items = items
-            self.pages = (total + per_page - 1) // per_page
-            self.has_prev = page > 1
-            self.has_next = page < self.pages
-            self.prev_num = page - 1
-            self.next_num = page + 1
-
-    pagination = Pagination(page, per_page, total, pagination_users)
-    
-    # search second time
     return render_template(
         "admin/profiles.html",
         profiles=[profile],  # show only this one profile row
@@ -314,6 +364,7 @@ def admin_search_users_by_profile():
 # Create profile
 @boundary_bp.route("/admin/profiles/create", methods=["GET", "POST"])
 @login_required
+@role_required(USER_ADMIN)
 def admin_create_profile():
     if request.method == "POST":
         name = request.form.get("profile_name")
@@ -329,6 +380,7 @@ def admin_create_profile():
 # View User Profile
 @boundary_bp.route("/admin/profiles/<int:profile_id>")
 @login_required
+@role_required(USER_ADMIN)
 def admin_view_profile(profile_id):
     profile = UserAdminViewUserProfileController().viewUserProfile(profile_id)
     if not profile:
@@ -341,6 +393,7 @@ def admin_view_profile(profile_id):
 # Edit User profile
 @boundary_bp.route("/admin/profiles/<int:profile_id>/edit", methods=["GET", "POST"])
 @login_required
+@role_required(USER_ADMIN)
 def admin_edit_profile(profile_id):
     profile = UserAdminViewUserProfileController().viewUserProfile(profile_id)
     if not profile:
@@ -375,6 +428,7 @@ def admin_edit_profile(profile_id):
 # Suspend User profile
 @boundary_bp.route("/admin/profiles/<int:profile_id>/suspend")
 @login_required
+@role_required(USER_ADMIN)
 def admin_suspend_profile(profile_id):
     UserAdminSuspendUserProfileController().suspendUserProfile(profile_id)
     flash("Profile suspended.", "warning")
@@ -383,6 +437,7 @@ def admin_suspend_profile(profile_id):
 # Activate User profile
 @boundary_bp.route("/admin/profiles/<int:profile_id>/activate")
 @login_required
+@role_required(USER_ADMIN)
 def admin_activate_profile(profile_id):
     UserAdminActivateUserProfileController().activateUserProfile(profile_id)
     flash("Profile activated.", "success")
@@ -395,80 +450,68 @@ def admin_activate_profile(profile_id):
 from flask_login import login_required, current_user
 from flask import render_template
 from app.entity.request import Request
-from app.entity.shortlist import Shortlist
-from app.entity.match_record import MatchRecord
 from app import db
 
 @boundary_bp.route("/csr/dashboard")
 @login_required
+@role_required(CSR)
 def csr_dashboard():
-    # Count all open requests
-    open_requests_count = Request.query.filter_by(status="open").count()
-
-    # Count requests shortlisted by this CSR
-    shortlist_count = Shortlist.query.filter_by(csrRepID=current_user.userID).count()
+    from app.control.dashboard_stats import DashboardStats
 
-    # Count matches completed by this CSR
-    matches_count = MatchRecord.query.filter_by(csrRepID=current_user.userID).count()
-
-    # Pass the results to the template
-    return render_template(
-        "csr/dashboard.html",
-        open_requests_count=open_requests_count,
-        shortlist_count=shortlist_count,
-        matches_count=matches_count
-    )
+    # open requests (cached, same for every CSR) + this CSR's shortlist and match counts
+    return render_template("csr/dashboard.html", **DashboardStats().csrStats(current_user.userID))
 
 
 @boundary_bp.route("/csr/requests")
 @login_required
+@role_required(CSR)
 def csr_requests():
     from app.control.csr_searchRequest_controller import CsrSearchRequestController
-    from app.entity.category import Category
+    from app.control.category_registry import active_categories
 
     # pagination params
     page = request.args.get("page", 1, type=int)
     per_page = 9
 
-    # selected filter value
+    # selected filter values
     selected_category = request.args.get("category")
+    search = request.args.get("search", "").strip()
 
     # fetch all active categories for dropdown
-    categories = Category.query.filter_by(isActive=True).all()
-
-    # get filtered results
-    results = CsrSearchRequestController().searchRequest(selected_category)
-    
-    # paginate manually (since we already filtered)
-    total = len(results)
-    start = (page - 1) * per_page
-    end = start + per_page
-    paginated = results[start:end]
-
-    class SimplePagination:
-        def __init__(self, page, per_page, total):
-            self.page = page
-            self.per_page = per_page
-            self.total = total
-            self.pages = (total + per_page - 1) // per_page
-            self.has_prev = page > 1
-            self.has_next = page < self.pages
-            self.prev_num = page - 1
-            self.next_num = page + 1
-
-    pagination = SimplePagination(page, per_page, total)
+    categories = active_categories()
+
+    # opt-in cursor mode (?mode=cursor, then after=/before= links)
+    after = request.args.get("after")
+    before = request.args.get("before")
+    if after or before or request.args.get("mode") == "cursor":
+        try:
+            pagination = CsrSearchRequestController().searchRequestByCursor(
+                selected_category, after=after, before=before, per_page=per_page, keyword=search
+            )
+        except ValueError as e:
+            flash(str(e), "warning")
+            pagination = CsrSearchRequestController().searchRequestByCursor(
+                selected_category, per_page=per_page, keyword=search
+            )
+    else:
+        # get one page of filtered results (LIMIT/OFFSET done in SQL), best keyword match first
+        pagination = CsrSearchRequestController().searchRequest(
+            selected_category, page=page, per_page=per_page, keyword=search
+        )
 
     return render_template(
         "csr/requests.html",
-        requests=paginated,
+        requests=pagination.items,
         categories=categories,
         selected_category=selected_category,
+        search=search,
         pagination=pagination
     )
 
 
 @boundary_bp.route("/csr/requests/<int:request_id>")
 @login_required
+@role_required(CSR)
 def csr_view_request(request_id):
     from app.control.csr_viewRequest_controller import CsrViewRequestController
     try:
@@ -481,19 +524,24 @@ def csr_view_request(request_id):
 
 @boundary_bp.route("/csr/requests/<int:request_id>/shortlist", methods=["POST"])
 @login_required
+@role_required(CSR)
 def csr_shortlist_add(request_id):
-    ok = CsrSaveToShortlistController().saveToShortlist(request_id, current_user.userID)
-    if ok:
-        flash("Request added to shortlist.", "success")
-    else:
-        flash("This request is already in your shortlist.", "info")
+    try:
+        ok = CsrSaveToShortlistController().saveToShortlist(request_id, current_user.userID)
+        if ok:
+            flash("Request added to shortlist.", "success")
+        else:
+            flash("This request is already in your shortlist.", "info")
+    except ValueError as e:
+        flash(str(e), "danger")
     return redirect(url_for("boundary.csr_requests"))
 
 @boundary_bp.route("/csr/shortlist")
 @login_required
+@role_required(CSR)
 def csr_shortlist():
     from app.control.csr_searchShortlist_controller import CsrSearchShortlistController
-    from app.entity.category import Category
+    from app.control.category_registry import active_categories
 
     # Pagination setup
     page = request.args.get("page", 1, type=int)
@@ -502,34 +550,16 @@ def csr_shortlist():
     # Get selected category filter
     selected_category = request.args.get("category", type=int)
 
-    # Fetch shortlist filtered by category
-    results = CsrSearchShortlistController().searchShortlistByCategory(current_user.userID, selected_category)
-
-    # Paginate manually
-    total = len(results)
-    start = (page - 1) * per_page
-    end = start + per_page
-    paginated_results = results[start:end]
-
-    # Pagination helper class
-    class SimplePagination:
-        def __init__(self, page, per_page, total):
-            self.page = page
-            self.per_page = per_page
-            self.total = total
-            self.pages = (total + per_page - 1) // per_page
-            self.has_prev = page > 1
-            self.has_next = page < self.pages
-            self.prev_num = page - 1
-            self.next_num = page + 1
-
-    pagination = SimplePagination(page, per_page, total)
+    # Fetch one page of the shortlist filtered by category
+    pagination = CsrSearchShortlistController().searchShortlistByCategory(
+        current_user.userID, selected_category, page=page, per_page=per_page
+    )
 
     # All active categories for dropdown
-    categories = Category.query.filter_by(isActive=True).all()
+    categories = active_categories()
 
     # Extract associated requests for display
-    requests = [s.request for s in paginated_results]
+    requests = [s.request for s in pagination.items]
 
     return render_template(
         "csr/shortlist.html",
@@ -542,9 +572,10 @@ def csr_shortlist():
 
 @boundary_bp.route("/csr/matches")
 @login_required
+@role_required(CSR)
 def csr_matches():
     from app.control.csr_searchHistory_controller import CsrSearchHistoryController
-    from app.entity.category import Category
+    from app.control.category_registry import active_categories
 
     # Get filters
     page = request.args.get("page", 1, type=int)
@@ -554,38 +585,43 @@ def csr_matches():
     end_date = request.args.get("end_date", "").strip()
 
     # Fetch all categories for dropdown
-    categories = Category.query.filter_by(isActive=True).all()
-
-    # Apply filters
-    results = CsrSearchHistoryController().searchHistory(
-        current_user.userID,
-        category_filter,
-        start_date,
-        end_date
-    )
+    categories = active_categories()
+
+    # a bad date is reported and the date filter dropped
+    try:
+        DateRange.fromDates(start_date, end_date)
+    except ValueError as e:
+        flash(str(e), "warning")
+        start_date = end_date = ""
 
-    # Pagination
-    total = len(results)
-    start = (page - 1) * per_page
-    end = start + per_page
-    paginated = results[start:end]
-
-    class SimplePagination:
-        def __init__(self, page, per_page, total):
-            self.page = page
-            self.per_page = per_page
-            self.total = total
-            self.pages = (total + per_page - 1) // per_page
-            self.has_prev = page > 1
-            self.has_next = page < self.pages
-            self.prev_num = page - 1
-            self.next_num = page + 1
-
-    pagination = SimplePagination(page, per_page, total)
+    # opt-in cursor mode (?mode=cursor, then after=/before= links)
+    after = request.args.get("after")
+    before = request.args.get("before")
+    if after or before or request.args.get("mode") == "cursor":
+        try:
+            pagination = CsrSearchHistoryController().searchHistoryByCursor(
+                current_user.userID, category_filter, start_date, end_date,
+                after=after, before=before, per_page=per_page
+            )
+        except ValueError as e:
+            flash(str(e), "warning")
+            pagination = CsrSearchHistoryController().searchHistoryByCursor(
+                current_user.userID, category_filter, start_date, end_date, per_page=per_page
+            )
+    else:
+        # Apply filters and fetch one page
+        pagination = CsrSearchHistoryController().searchHistory(
+            current_user.userID,
+            category_filter,
+            start_date,
+            end_date,
+            page=page,
+            per_page=per_page
+        )
 
     return render_template(
         "csr/matches.html",
-        matches=paginated,
+        matches=pagination.items,
         categories=categories,
         selected_category=category_filter,
         start_date=start_date,
@@ -596,8 +632,28 @@ def csr_matches():
 
 
 
+# Export the filtered history (all pages)
+@boundary_bp.route("/csr/matches/export")
+@login_required
+@role_required(CSR)
+def csr_matches_export():
+    from app.control.csr_searchHistory_controller import CsrSearchHistoryController
+    start_date = request.args.get("start_date", "").strip()
+    end_date = request.args.get("end_date", "").strip()
+    try:
+        DateRange.fromDates(start_date, end_date)
+    except ValueError as e:
+        flash(str(e), "warning")
+        return redirect(url_for("boundary.csr_matches"))
+
+    export = CsrSearchHistoryController().exportHistory(
+        current_user.userID, request.args.get("category", type=int), start_date, end_date
+    )
+    return _export_response(export, request.args.get("format", "csv"))
+
 @boundary_bp.route("/csr/shortlist/<int:request_id>/remove", methods=["POST"])
 @login_required
+@role_required(CSR)
 def csr_shortlist_remove(request_id):
     try:
         CsrRemoveShortlistController().removeFromShortlist(current_user.userID, request_id)
@@ -616,22 +672,12 @@ from sqlalchemy import or_
 
 @boundary_bp.route("/pin/dashboard")
 @login_required
+@role_required(PIN)
 def pin_dashboard():
-    stats = {
-        "total": Request.query.filter_by(pinID=current_user.userID).count(),
-        "draft": Request.query.filter(
-            Request.pinID == current_user.userID,
-            Request.status.ilike("draft")
-        ).count(),
-        "open": Request.query.filter(
-            Request.pinID == current_user.userID,
-            Request.status.ilike("open")
-        ).count(),
-        "completed": Request.query.filter(
-            Request.pinID == current_user.userID,
-            Request.status.ilike("completed")
-        ).count(),
-    }
+    from app.control.dashboard_stats import DashboardStats
+
+    # one GROUP BY status over this PIN's requests
+    stats = DashboardStats().pinStats(current_user.userID)
 
     matches_count = stats["completed"]
 
@@ -643,6 +689,7 @@ def pin_dashboard():
 
 @boundary_bp.route("/pin/requests")
 @login_required
+@role_required(PIN)
 def pin_requests():
     from app.control.pin_searchRequest_controller import PinSearchRequestController
     from app.entity.category import Category
@@ -656,37 +703,20 @@ def pin_requests():
 
     # --- run controller query ---
     controller = PinSearchRequestController()
-    all_requests = controller.searchRequests(current_user.userID, keyword=search_query)
-
-    # --- paginate manually ---
-    total = len(all_requests)
-    start = (page - 1) * per_page
-    end = start + per_page
-    paginated = all_requests[start:end]
-
-    # --- simple pagination helper ---
-    class SimplePagination:
-        def __init__(self, page, per_page, total):
-            self.page = page
-            self.per_page = per_page
-            self.total = total
-            self.pages = (total + per_page - 1) // per_page
-            self.has_prev = page > 1
-            self.has_next = page < self.pages
-            self.prev_num = page - 1
-            self.next_num = page + 1
-
-    pagination = SimplePagination(page, per_page, total)
+    pagination = controller.searchRequests(
+        current_user.userID, keyword=search_query, page=page, per_page=per_page
+    )
 
     return render_template(
         "pin/requests.html",
-        requests=paginated,
+        requests=pagination.items,
         pagination=pagination,
         search_query=search_query,
     )
 
 @boundary_bp.route("/pin/requests/<int:request_id>")
 @login_required
+@role_required(PIN)
 def pin_view_request(request_id):
     from app.control.pin_viewRequest_controller import PinViewRequestController
     try:
@@ -695,15 +725,18 @@ def pin_view_request(request_id):
         flash(str(e), "danger")
         return redirect(url_for("boundary.pin_requests"))
 
-    return render_template("pin/view_request.html", request=req)
+    # include views still buffered by the write-behind counter
+    view_count = PinTrackViewsController().trackViews(request_id)
+    return render_template("pin/view_request.html", request=req, view_count=view_count)
 
 
 
 @boundary_bp.route("/pin/requests/create", methods=["GET", "POST"])
 @login_required
+@role_required(PIN)
 def pin_create_request():
-    from app.entity.category import Category
-    categories = Category.query.filter_by(isActive=True).all()
+    from app.control.category_registry import active_categories
+    categories = active_categories()
 
     if request.method == "POST":
         category_id = request.form.get("category_id")
@@ -728,9 +761,10 @@ def pin_create_request():
 
 @boundary_bp.route("/pin/requests/<int:request_id>/edit", methods=["GET", "POST"])
 @login_required
+@role_required(PIN)
 def pin_edit_request(request_id):
     from app.entity.request import Request
-    from app.entity.category import Category
+    from app.control.category_registry import active_categories
     from app.control.pin_updateRequest_controller import PinUpdateRequestController
 
     req = Request.query.get(request_id)
@@ -738,7 +772,7 @@ def pin_edit_request(request_id):
         raise NotFound("Request not found or unauthorized.")
 
     # fetch active categories for dropdown
-    categories = Category.query.filter_by(isActive=True).all()
+    categories = active_categories()
 
     if request.method == "POST":
         # grab inputs
@@ -769,6 +803,7 @@ def pin_edit_request(request_id):
 
 @boundary_bp.route("/pin/requests/<int:request_id>/delete", methods=["POST"])
 @login_required
+@role_required(PIN)
 def pin_delete_request(request_id):
     from app.control.pin_deleteRequest_controller import PinDeleteRequestController
     try:
@@ -781,6 +816,7 @@ def pin_delete_request(request_id):
 
 @boundary_bp.route("/pin/match-records", methods=["GET"])
 @login_required
+@role_required(PIN)
 def pin_match_records():
     from app.control.pin_searchMatchRecord_controller import PinSearchMatchRecordController
 
@@ -791,33 +827,22 @@ def pin_match_records():
     page = request.args.get("page", 1, type=int)
     per_page = 10
 
+    # a bad date is reported and the date filter dropped
+    try:
+        DateRange.fromDates(start_date, end_date)
+    except ValueError as e:
+        flash(str(e), "warning")
+        start_date = end_date = ""
+
     # Controller call
-    results = PinSearchMatchRecordController().searchMatchRecord(
-        current_user.userID, category_query, start_date, end_date
+    pagination = PinSearchMatchRecordController().searchMatchRecord(
+        current_user.userID, category_query, start_date, end_date,
+        page=page, per_page=per_page
     )
 
-    # Manual pagination
-    total = len(results)
-    start = (page - 1) * per_page
-    end = start + per_page
-    paginated_matches = results[start:end]
-
-    class SimplePagination:
-        def __init__(self, page, per_page, total):
-            self.page = page
-            self.per_page = per_page
-            self.total = total
-            self.pages = (total + per_page - 1) // per_page
-            self.has_prev = page > 1
-            self.has_next = page < self.pages
-            self.prev_num = page - 1
-            self.next_num = page + 1
-
-    pagination = SimplePagination(page, per_page, total)
-
     return render_template(
         "pin/matches.html",
-        matches=paginated_matches,
+        matches=pagination.items,
         pagination=pagination,
         category_query=category_query,
         start_date=start_date,
@@ -825,10 +850,217 @@ def pin_match_records():
     )
 
 
+# Export the filtered match records (all pages)
+@boundary_bp.route("/pin/match-records/export")
+@login_required
+@role_required(PIN)
+def pin_match_records_export():
+    from app.control.pin_searchMatchRecord_controller import PinSearchMatchRecordController
+    start_date = request.args.get("start_date", "").strip()
+    end_date = request.args.get("end_date", "").strip()
+    try:
+        DateRange.fromDates(start_date, end_date)
+    except ValueError as e:
+        flash(str(e), "warning")
+        return redirect(url_for("boundary.pin_match_records"))
+
+    export = PinSearchMatchRecordController().exportMatchRecords(
+        current_user.userID, request.args.get("category", "").strip(), start_date, end_date
+    )
+    return _export_response(export, request.args.get("format", "csv"))
+
 @boundary_bp.route("/pin/requests/<int:request_id>/view-counters")
 @login_required
+@role_required(PIN)
 def pin_request_counters(request_id):
     views = PinTrackViewsController().trackViews(request_id)
     shorts = PinTrackShortlistsController().trackShortlists(request_id)
     flash(f"Views: {views} | Shortlisted: {shorts}", "info")
     return redirect(url_for("boundary.pin_requests"))
+
+
+# ----------------------------------
+# PLATFORM MANAGER ROUTES  (/pm/*)
+# ----------------------------------
+
+from flask import jsonify, abort
+
+@boundary_bp.route("/pm/dashboard")
+@login_required
+@role_required(PLATFORM_MANAGER)
+def pm_dashboard():
+    from app.control.dashboard_stats import DashboardStats
+    return render_template("pm/dashboard.html", summary=DashboardStats().platformStats())
+
+# Categories list + search
+@boundary_bp.route("/pm/categories")
+@login_required
+@role_required(PLATFORM_MANAGER)
+def pm_categories():
+    from app.control.platform_searchCategory_controller import PlatformSearchCategoryController
+
+    q = request.args.get("q", "").strip()
+    page = request.args.get("page", 1, type=int)
+    controller = PlatformSearchCategoryController()
+    pagination = controller.searchCategoryByName(q, page=page, per_page=10)
+    request_counts = controller.requestCounts(pagination.items)
+
+    return render_template("pm/categories.html", categories=pagination.items, pagination=pagination, q=q,
+                           request_counts=request_counts)
+
+@boundary_bp.route("/pm/categories/create", methods=["GET", "POST"])
+@login_required
+@role_required(PLATFORM_MANAGER)
+def pm_create_category():
+    from app.control.platform_createCategory_controller import PlatformCreateCategoryController
+
+    if request.method == "POST":
+        name = (request.form.get("category_name") or "").strip()
+        desc = request.form.get("description")
+        if not name:
+            flash("Category name is required.", "danger")
+        else:
+            try:
+                PlatformCreateCategoryController().create_category(name, desc)
+                flash("Category created.", "success")
+                return redirect(url_for("boundary.pm_categories"))
+            except Exception as e:
+                db.session.rollback()
+                flash(str(e), "danger")
+    return render_template("pm/create_category.html")
+
+@boundary_bp.route("/pm/categories/<int:category_id>/edit", methods=["GET", "POST"])
+@login_required
+@role_required(PLATFORM_MANAGER)
+def pm_edit_category(category_id):
+    from app.entity.category import Category
+    from app.control.platform_updateCategory_controller import PlatformUpdateCategoryController
+
+    category = db.session.get(Category, category_id)
+    if not category:
+        raise NotFound("Category not found.")
+
+    if request.method == "POST":
+        try:
+            PlatformUpdateCategoryController().updateCategory(
+                category_id,
+                (request.form.get("category_name") or "").strip() or category.categoryName,
+                request.form.get("description"),
+            )
+            flash("Category updated.", "success")
+            return redirect(url_for("boundary.pm_categories"))
+        except Exception as e:
+            db.session.rollback()
+            flash(str(e), "danger")
+    return render_template("pm/edit_category.html", category=category)
+
+@boundary_bp.route("/pm/categories/<int:category_id>/suspend", methods=["POST"])
+@login_required
+@role_required(PLATFORM_MANAGER)
+def pm_suspend_category(category_id):
+    from app.control.platform_suspendCategory_controller import PlatformSuspendCategoryController
+    try:
+        PlatformSuspendCategoryController().suspendCategory(category_id)
+        flash("Category suspended.", "success")
+    except ValueError as e:
+        flash(str(e), "danger")
+    return redirect(url_for("boundary.pm_categories"))
+
+@boundary_bp.route("/pm/categories/<int:category_id>/activate", methods=["POST"])
+@login_required
+@role_required(PLATFORM_MANAGER)
+def pm_activate_category(category_id):
+    from app.control.platform_activateCategory_controller import PlatformActivateCategoryController
+    try:
+        PlatformActivateCategoryController().activateCategory(category_id)
+        flash("Category reactivated.", "success")
+    except ValueError as e:
+        flash(str(e), "danger")
+    return redirect(url_for("boundary.pm_categories"))
+
+# Reports list (+ jobs still running)
+@boundary_bp.route("/pm/reports")
+@login_required
+@role_required(PLATFORM_MANAGER)
+def pm_reports():
+    from app.entity.report import Report
+    from app.control.report_jobs import get_report_jobs
+
+    page = request.args.get("page", 1, type=int)
+    pagination = Report.query.order_by(Report.reportID.desc()).paginate(page=page, per_page=10, error_out=False)
+
+    return render_template(
+        "pm/reports.html",
+        reports=pagination.items,
+        pagination=pagination,
+        jobs=get_report_jobs().activeJobs()
+    )
+
+# Queue a report; the job page polls until it is ready
+@boundary_bp.route("/pm/reports/generate", methods=["GET", "POST"])
+@login_required
+@role_required(PLATFORM_MANAGER)
+def pm_generate_report():
+    from app.control.report_jobs import get_report_jobs
+
+    if request.method == "POST":
+        try:
+            job = get_report_jobs().submit(
+                current_user.userID, request.form.get("report_type"), request.form.get("period"),
+                force=request.form.get("force") == "on"
+            )
+            return redirect(url_for("boundary.pm_report_job", job_id=job.jobID))
+        except ValueError as e:
+            flash(str(e), "danger")
+    return render_template("pm/generate_report.html")
+
+@boundary_bp.route("/pm/reports/jobs/<int:job_id>")
+@login_required
+@role_required(PLATFORM_MANAGER)
+def pm_report_job(job_id):
+    from app.control.report_jobs import get_report_jobs
+    try:
+        job = get_report_jobs().status(job_id)
+    except ValueError:
+        raise NotFound("Report job not found.")
+    if job["status"] == "done":
+        return redirect(url_for("boundary.pm_view_report", report_id=job["reportID"]))
+    return render_template("pm/report_job.html", job=job)
+
+@boundary_bp.route("/pm/reports/jobs/<int:job_id>/status")
+@login_required
+@role_required(PLATFORM_MANAGER)
+def pm_report_job_status(job_id):
+    from app.control.report_jobs import get_report_jobs
+    try:
+        job = get_report_jobs().status(job_id)
+    except ValueError:
+        abort(404)
+    if job["reportID"]:
+        job["reportURL"] = url_for("boundary.pm_view_report", report_id=job["reportID"])
+    return jsonify(job)
+
+@boundary_bp.route("/pm/reports/<int:report_id>")
+@login_required
+@role_required(PLATFORM_MANAGER)
+def pm_view_report(report_id):
+    import json
+    from app.entity.report import Report
+
+    report = db.session.get(Report, report_id)
+    if not report:
+        raise NotFound("Report not found.")
+    content = json.loads(report.reportData) if report.reportData else {}
+    return render_template("pm/view_report.html", report=report, content=content)
+
+@boundary_bp.route("/pm/reports/<int:report_id>/export")
+@login_required
+@role_required(PLATFORM_MANAGER)
+def pm_export_report(report_id):
+    from app.entity.report import Report
+    from app.control.report_aggregator import ReportAggregator
+
+    report = db.session.get(Report, report_id)
+    if not report:
+        raise NotFound("Report not found.")
+    return _export_response(ReportAggregator().exportBreakdown(report), request.args.get("format", "csv"))
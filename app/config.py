@@ -0,0 +1,29 @@
+import os
+
+class Config:
+    SECRET_KEY = os.environ.get("SECRET_KEY", "dev-secret-key")
+    SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL", "sqlite:///csr_volunteer.db")
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Connection pool (ignored for in-memory SQLite)
+    DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", 1800))  # seconds; below server idle timeouts
+    DB_POOL_PRE_PING = os.environ.get("DB_POOL_PRE_PING", "1") == "1"
+
+    # SQLite pragmas applied to every new connection (set one to None to skip it)
+    SQLITE_JOURNAL_MODE = os.environ.get("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS = os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL")  # safe with WAL
+    SQLITE_CACHE_SIZE = int(os.environ.get("SQLITE_CACHE_SIZE", -20000))  # negative = KiB
+    SQLITE_MMAP_SIZE = int(os.environ.get("SQLITE_MMAP_SIZE", 268435456))
+    SQLITE_BUSY_TIMEOUT = int(os.environ.get("SQLITE_BUSY_TIMEOUT", 5000))  # ms
+
+    # Optional read replica for search and report reads
+    DATABASE_REPLICA_URL = os.environ.get("DATABASE_REPLICA_URL")
+
+    # Reverse proxies in front of the app: how many of them append to X-Forwarded-For
+    # (and X-Forwarded-Proto). 0 = none, request.remote_addr is the peer address.
+    # Set it to the real count, never higher: each trusted hop is taken from the header.
+    PROXY_FIX_X_FOR = int(os.environ.get("PROXY_FIX_X_FOR", 0))
+    PROXY_FIX_X_PROTO = int(os.environ.get("PROXY_FIX_X_PROTO", 0))
@@ -1,33 +1,49 @@
 from flask_login import login_user, logout_user
-from flask import session
+from flask import current_app, session
+from app import db
 from app.entity.user_account import UserAccount
+from app.control.role_map import ROLE_HOME, remember_role
+from app.control.login_rate_limiter import get_login_limiter
 
 class AuthController:
-    def login(self, email, password):
+    def __init__(self):
+        self.retryAfter = 0  # set when login() refused because of too many failures
+
+    def login(self, email, password, ip=None):
+        # 0) Throttle repeated failures per email / IP before any query or hash check
+        limiter = get_login_limiter()
+        self.retryAfter = limiter.check(email, ip)
+        if self.retryAfter:
+            return None, f"Too many failed login attempts. Try again in {self.retryAfter} seconds."
+
         # 1) Check account exists and is active
         user = UserAccount.query.filter_by(email=email).first()
         if not user or not user.isActive:
+            limiter.recordFailure(email, ip)
             return None, "Account not found or suspended."
 
         # 2) Validate password
         if not user.check_password(password):
+            limiter.recordFailure(email, ip)
             return None, "Invalid credentials."
+        limiter.recordSuccess(email)
+
+        # 2b) Upgrade a hash made under an older/weaker policy while the password is known
+        #     (best effort: if the write fails, log in with the old hash and retry next time)
+        if user.password_needs_rehash():
+            user.password = password
+            try:
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                current_app.logger.exception("Password rehash failed for user %s", user.userID)
 
         # 3) Log in using session cookie only (auto-logout when browser closes)
         login_user(user, remember=False)
 
-        # 4) Determine redirect by role
-        role = (user.profile.profileName if user.profile else "").lower()
-        if role == "useradmin":
-            return "/admin/dashboard", None
-        if role in ("csrrep", "csr", "csr representative"):
-            return "/csr/dashboard", None
-        if role in ("pin", "personinneed", "person-in-need"):
-            return "/pin/dashboard", None
-        if role in ("platformmanager", "platform"):
-            return "/pm/dashboard", None
-
-        return "/", None
+        # 4) Remember the role for route checks and redirect by it (no profile query)
+        role = remember_role(user.profileID)
+        return ROLE_HOME.get(role, "/"), None
 
     def logout(self):
         # Fully remove session + authentication
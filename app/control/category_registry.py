@@ -0,0 +1,86 @@
+"""
+Process-wide cache of active categories for the dropdowns on CSR/PIN pages.
+Entries are immutable CategoryRecord tuples, so they can be shared between
+requests and threads without touching the session.
+Category write controllers call CategoryRegistry.changed() before committing:
+it bumps the "categories" row in cache_versions (same transaction) and drops
+this worker's copy. Other workers compare their cached version with the stored
+one at most every CATEGORY_CACHE_CHECK_INTERVAL seconds (default 5), so most
+page renders run no category query at all.
+"""
+import threading
+import time
+from typing import NamedTuple, Optional
+from flask import current_app
+from app import db
+from app.entity.category import Category
+from app.control import data_version
+
+
+class CategoryRecord(NamedTuple):
+    categoryID: int
+    categoryName: str
+    description: Optional[str]
+
+
+class CategoryRegistry:
+    def __init__(self, check_interval: float = 5.0):
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._records = None
+        self._version = None
+        self._checked_at = 0.0
+
+    def active(self) -> tuple:
+        """Active categories ordered by ID, as CategoryRecord tuples."""
+        now = time.monotonic()
+        with self._lock:
+            records, version, checked_at = self._records, self._version, self._checked_at
+        if records is not None and now - checked_at < self.check_interval:
+            return records
+
+        stored = self._storedVersion()
+        if records is not None and stored == version:
+            with self._lock:
+                self._checked_at = now
+            return records
+
+        records = tuple(
+            CategoryRecord(c.categoryID, c.categoryName, c.description)
+            for c in db.session.query(Category.categoryID, Category.categoryName, Category.description)
+            .filter(Category.isActive.is_(True))
+            .order_by(Category.categoryID)
+        )
+        with self._lock:
+            self._records, self._version, self._checked_at = records, stored, now
+        return records
+
+    def invalidate(self):
+        """Forgets this worker's copy; the next active() call reloads it."""
+        with self._lock:
+            self._records = None
+
+    def _storedVersion(self) -> int:
+        return data_version.current(data_version.CATEGORIES)[0]
+
+    @staticmethod
+    def changed():
+        """Call inside a category write transaction, before commit."""
+        data_version.bump(data_version.CATEGORIES)
+        get_category_registry().invalidate()
+
+
+def get_category_registry() -> CategoryRegistry:
+    """Returns the registry of the current app (created on first use)."""
+    registry = current_app.extensions.get("category_registry")
+    if registry is None:
+        registry = current_app.extensions.setdefault(
+            "category_registry",
+            CategoryRegistry(current_app.config.get("CATEGORY_CACHE_CHECK_INTERVAL", 5.0)),
+        )
+    return registry
+
+
+def active_categories() -> tuple:
+    """Shortcut for get_category_registry().active()."""
+    return get_category_registry().active()
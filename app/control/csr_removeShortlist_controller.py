@@ -2,6 +2,7 @@
 User Story:
 As a CSR Rep, I want to remove service requests from my shortlist so that I can manage saved opportunities.
 """
+from sqlalchemy import delete, update
 from app import db
 from app.entity.shortlist import Shortlist
 from app.entity.request import Request
@@ -9,20 +10,25 @@ from app.entity.request import Request
 class CsrRemoveShortlistController:
     def removeFromShortlist(self, csrRepID: int, requestID: int) -> bool:
         """Removes a shortlist record and returns True if successful."""
-        record = Shortlist.query.filter_by(csrRepID=csrRepID, requestID=requestID).first()
-        if not record:
-            raise ValueError("Shortlist entry not found.")
-
         try:
-            req = record.request  # uses the relationship you added earlier
-            if req and req.shortlistCount and req.shortlistCount > 0:
-                req.shortlistCount -= 1
-
-            db.session.delete(record)
+            deleted = db.session.execute(
+                delete(Shortlist)
+                .where(Shortlist.csrRepID == csrRepID, Shortlist.requestID == requestID)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            if deleted:
+                # atomic decrement, never below zero
+                db.session.execute(
+                    update(Request)
+                    .where(Request.requestID == requestID, Request.shortlistCount > 0)
+                    .values(shortlistCount=Request.shortlistCount - deleted)
+                    .execution_options(synchronize_session=False)
+                )
             db.session.commit()
-            return True
-
         except Exception as e:
             db.session.rollback()
             raise RuntimeError(f"Failed to remove from shortlist: {e}")
 
+        if not deleted:
+            raise ValueError("Shortlist entry not found.")
+        return True
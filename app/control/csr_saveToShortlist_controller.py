@@ -1,3 +1,6 @@
+from sqlalchemy import func, literal, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from app import db
 from app.entity.request import Request
 from app.entity.shortlist import Shortlist
@@ -5,16 +8,42 @@ from app.entity.shortlist import Shortlist
 class CsrSaveToShortlistController:
     def saveToShortlist(self, requestID: int, csrID: int) -> bool:
         """Adds a request to the CSR's shortlist and returns True if successful."""
-        r = Request.query.get(requestID)
-        if not r:
+        try:
+            inserted = self._insertIfAbsent(requestID, csrID)
+            if inserted:
+                # atomic increment; no read-modify-write on the request row
+                db.session.execute(
+                    update(Request)
+                    .where(Request.requestID == requestID)
+                    .values(shortlistCount=func.coalesce(Request.shortlistCount, 0) + 1)
+                    .execution_options(synchronize_session=False)
+                )
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            raise RuntimeError(f"Failed to save to shortlist: {e}")
+
+        if not inserted and not db.session.get(Request, requestID):
             raise ValueError("Request not found.")
+        return inserted
 
-        # check if already shortlisted (optional safeguard)
-        exists = Shortlist.query.filter_by(csrRepID=csrID, requestID=requestID).first()
-        if exists:
-            return False
+    def _insertIfAbsent(self, requestID: int, csrID: int) -> bool:
+        """
+        INSERT ... SELECT from requests, skipped on the (csrRepID, requestID) unique index.
+        Returns False if the request does not exist or is already shortlisted.
+        """
+        source = select(literal(csrID), Request.requestID).where(Request.requestID == requestID)
+        dialect = db.session.get_bind().dialect.name
 
-        r.shortlistCount = (r.shortlistCount or 0) + 1
-        db.session.add(Shortlist(csrRepID=csrID, requestID=requestID))
-        db.session.commit()
-        return True
+        if dialect in ("sqlite", "postgresql"):
+            insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+            stmt = insert(Shortlist).from_select(["csrRepID", "requestID"], source).on_conflict_do_nothing()
+            return db.session.execute(stmt).rowcount == 1
+
+        # generic fallback: let the unique index reject duplicates
+        try:
+            with db.session.begin_nested():
+                stmt = Shortlist.__table__.insert().from_select(["csrRepID", "requestID"], source)
+                return db.session.execute(stmt).rowcount == 1
+        except IntegrityError:
+            return False
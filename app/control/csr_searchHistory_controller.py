@@ -3,14 +3,61 @@ User Story:
 As a CSR Rep, I want to search and view the history of my completed volunteer services,
 filtered by category and date period.
 """
+from app import db
 from app.entity.match_record import MatchRecord
-from datetime import datetime
-from sqlalchemy import func
+from app.entity.request import Request
+from app.entity.category import Category
+from app.entity.user_account import UserAccount
+from app.control.date_range import DateRange
+from app.control.pagination import paginate, keyset_paginate
+from app.control.loading_profiles import MATCH_ROW
+from app.control.export import Export, stream_query
+from app.control.db_engine import reads_from_replica
 
 class CsrSearchHistoryController:
-    def searchHistory(self, userID: int, category_id: int = None, start_date: str = None, end_date: str = None):
-        """Returns completed match records for a CSR representative filtered by category and date."""
-        q = MatchRecord.query.filter(
+    @reads_from_replica
+    def searchHistory(self, userID: int, category_id: int = None, start_date: str = None, end_date: str = None,
+                      page: int = 1, per_page: int = 10):
+        """Returns a page of completed match records for a CSR representative filtered by category and date."""
+        q = self._completedRecords(userID, category_id, start_date, end_date)
+        return paginate(
+            q.order_by(MatchRecord.completedAt.desc(), MatchRecord.matchRecordID.desc()), page, per_page
+        )
+
+    @reads_from_replica
+    def searchHistoryByCursor(self, userID: int, category_id: int = None, start_date: str = None,
+                              end_date: str = None, after: str = None, before: str = None, per_page: int = 10):
+        """Same history as searchHistory, paged by a (completedAt, matchRecordID) cursor."""
+        q = self._completedRecords(userID, category_id, start_date, end_date)
+        return keyset_paginate(
+            q, [MatchRecord.completedAt, MatchRecord.matchRecordID],
+            after=after, before=before, per_page=per_page
+        )
+
+    def exportHistory(self, userID: int, category_id: int = None, start_date: str = None, end_date: str = None):
+        """The whole filtered history as a streamed Export (newest first)."""
+        q = self._filtered(
+            db.session.query(
+                MatchRecord.matchRecordID, MatchRecord.completedAt, Request.title,
+                Category.categoryName, UserAccount.name,
+            )
+            .join(Request, MatchRecord.requestID == Request.requestID)
+            .join(Category, MatchRecord.categoryID == Category.categoryID)
+            .join(UserAccount, MatchRecord.pinID == UserAccount.userID),
+            userID, category_id, start_date, end_date,
+        )
+        return Export(
+            "match_history",
+            ("matchRecordID", "completedAt", "requestTitle", "category", "personInNeed"),
+            stream_query(q.order_by(MatchRecord.completedAt.desc(), MatchRecord.matchRecordID.desc())),
+        )
+
+    def _completedRecords(self, userID, category_id, start_date, end_date):
+        q = self._filtered(MatchRecord.query, userID, category_id, start_date, end_date)
+        return q.options(*MATCH_ROW)
+
+    def _filtered(self, q, userID, category_id, start_date, end_date):
+        q = q.filter(
             MatchRecord.csrRepID == userID,
             MatchRecord.status == "completed"
         )
@@ -19,11 +66,5 @@ class CsrSearchHistoryController:
         if category_id:
             q = q.filter(MatchRecord.categoryID == category_id)
 
-        # Filter by date range (compare DATE only)
-        if start_date:
-            q = q.filter(func.date(MatchRecord.completedAt) >= start_date)
-
-        if end_date:
-            q = q.filter(func.date(MatchRecord.completedAt) <= end_date)
-
-        return q.order_by(MatchRecord.completedAt.desc()).all()
+        # Inclusive date range, applied as a half-open range on completedAt
+        return DateRange.fromDates(start_date, end_date).apply(q, MatchRecord.completedAt)
@@ -4,10 +4,32 @@ As a CSR Rep, I want to search for service requests so that I can find opportuni
 """
 from app.entity.request import Request
 from app.entity.category import Category
+from app.control.pagination import paginate, keyset_paginate
+from app.control.loading_profiles import REQUEST_CARD
+from app.control.request_search import get_search_backend
+from app.control.db_engine import reads_from_replica
 
 class CsrSearchRequestController:
-    def searchRequest(self, category: str):
-        """Returns a list of open requests filtered by category (if provided)."""
+    @reads_from_replica
+    def searchRequest(self, category: str, page: int = 1, per_page: int = 9, keyword: str = None):
+        """Returns a page of open requests filtered by category and keywords (if provided)."""
+        q = self._openRequests(category)
+        if keyword and keyword.strip():
+            q = get_search_backend().ranked(q, keyword)
+        else:
+            q = q.order_by(Request.requestID.desc())
+        return paginate(q, page, per_page)
+
+    @reads_from_replica
+    def searchRequestByCursor(self, category: str, after: str = None, before: str = None, per_page: int = 9,
+                              keyword: str = None):
+        """Same feed as searchRequest (newest first), paged by requestID cursor so deep pages stay cheap."""
+        q = self._openRequests(category)
+        if keyword and keyword.strip():
+            q = get_search_backend().filter(q, keyword)
+        return keyset_paginate(q, [Request.requestID], after=after, before=before, per_page=per_page)
+
+    def _openRequests(self, category: str):
         q = Request.query.join(Category, Request.categoryID == Category.categoryID)
 
         # Filter only active categories and open requests
@@ -16,4 +38,4 @@ class CsrSearchRequestController:
         if category:
             q = q.filter(Category.categoryName.ilike(f"%{category}%"))
 
-        return q.order_by(Request.requestID.desc()).all()
+        return q.options(*REQUEST_CARD)
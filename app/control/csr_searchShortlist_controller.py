@@ -7,15 +7,17 @@ so that I can quickly find saved opportunities related to specific services.
 from app.entity.shortlist import Shortlist
 from app.entity.request import Request
 from app.entity.category import Category
+from app.control.pagination import paginate
+from app.control.loading_profiles import SHORTLIST_CARD
 
 class CsrSearchShortlistController:
-    def searchShortlistByCategory(self, csr_id: int, category_id: int = None):
+    def searchShortlistByCategory(self, csr_id: int, category_id: int = None, page: int = 1, per_page: int = 9):
         """
-        Returns all Shortlist entries for a CSR, optionally filtered by category.
+        Returns a page of Shortlist entries for a CSR, optionally filtered by category.
         """
         q = Shortlist.query.join(Request).filter(Shortlist.csrRepID == csr_id)
 
         if category_id:
             q = q.filter(Request.categoryID == category_id)
 
-        return q.order_by(Shortlist.shortlistID.desc()).all()
+        return paginate(q.options(*SHORTLIST_CARD).order_by(Shortlist.shortlistID.desc()), page, per_page)
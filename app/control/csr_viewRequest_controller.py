@@ -1,12 +1,11 @@
-from app import db
 from app.entity.request import Request
+from app.control.view_counter import get_view_counter
 
 class CsrViewRequestController:
     def viewRequestDetails(self, requestID: int):
-        """Returns a single Request entity and increments its viewCount."""
+        """Returns a single Request entity and counts the view (buffered, written in batches)."""
         r = Request.query.get(requestID)
         if not r:
             raise ValueError("Request not found.")
-        r.viewCount = (r.viewCount or 0) + 1
-        db.session.commit()
+        get_view_counter().increment(requestID)
         return r
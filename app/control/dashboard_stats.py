@@ -0,0 +1,144 @@
+"""
+Dashboard counters, one grouped query per role.
+Per-user counts are always read fresh. Global counters (open requests, user
+and profile totals) are the same for every viewer, so they are shared through
+a small per-app TTL cache (DASHBOARD_CACHE_TTL seconds, default 30; 0 turns
+caching off). Write controllers call invalidate() after they commit, so a
+worker sees its own changes at once and other workers within one TTL.
+"""
+import threading
+import time
+from flask import current_app
+from sqlalchemy import case, func, select
+from app import db
+from app.entity.request import Request
+from app.entity.shortlist import Shortlist
+from app.entity.match_record import MatchRecord
+from app.entity.user_account import UserAccount
+from app.entity.user_profile import UserProfile
+from app.entity.category import Category
+from app.entity.report import Report
+
+OPEN_REQUESTS = "open_requests"
+USER_TOTALS = "user_totals"
+
+PIN_STATUSES = ("draft", "open", "completed")
+
+
+class TtlCache:
+    """Thread-safe key -> value store whose entries expire after `ttl` seconds."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, compute):
+        """Returns the cached value for `key`, calling compute() when missing or expired."""
+        if self.ttl <= 0:
+            return compute()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry[0] > now:
+            return entry[1]
+        value = compute()
+        with self._lock:
+            self._entries[key] = (now + self.ttl, value)
+        return value
+
+    def invalidate(self, *keys):
+        """Drops the given keys (all keys when none are given)."""
+        with self._lock:
+            if not keys:
+                self._entries.clear()
+            for key in keys:
+                self._entries.pop(key, None)
+
+
+def _cache() -> TtlCache:
+    cache = current_app.extensions.get("dashboard_cache")
+    if cache is None:
+        cache = current_app.extensions.setdefault(
+            "dashboard_cache", TtlCache(current_app.config.get("DASHBOARD_CACHE_TTL", 30.0))
+        )
+    return cache
+
+
+def invalidate(*keys):
+    """Forgets cached global counters; write controllers call this after commit."""
+    _cache().invalidate(*keys)
+
+
+class DashboardStats:
+    def pinStats(self, pin_id: int) -> dict:
+        """Request counts for one PIN: total plus draft/open/completed (status compared case-insensitively)."""
+        status = func.lower(Request.status)
+        rows = (
+            db.session.query(status, func.count())
+            .filter(Request.pinID == pin_id)
+            .group_by(status)
+            .all()
+        )
+        by_status = {s: n for s, n in rows}
+        stats = {"total": sum(by_status.values())}
+        for s in PIN_STATUSES:
+            stats[s] = by_status.get(s, 0)
+        return stats
+
+    def csrStats(self, csr_id: int) -> dict:
+        """Open requests platform-wide (cached) plus this CSR's shortlist and match counts."""
+        shortlists = select(func.count()).where(Shortlist.csrRepID == csr_id).scalar_subquery()
+        matches = select(func.count()).where(MatchRecord.csrRepID == csr_id).scalar_subquery()
+        shortlist_count, matches_count = db.session.query(shortlists, matches).one()
+        return {
+            "open_requests_count": self.openRequestCount(),
+            "shortlist_count": shortlist_count,
+            "matches_count": matches_count,
+        }
+
+    def openRequestCount(self) -> int:
+        return _cache().get(OPEN_REQUESTS, lambda: (
+            db.session.query(func.count(Request.requestID))
+            .filter(Request.status == "open")
+            .scalar()
+        ))
+
+    def adminStats(self) -> dict:
+        """User totals by state and the profile count (cached, one query)."""
+        return dict(_cache().get(USER_TOTALS, self._userTotals))
+
+    def _userTotals(self) -> dict:
+        profiles = select(func.count()).select_from(UserProfile).scalar_subquery()
+        total, active, suspended, profile_count = db.session.query(
+            func.count(UserAccount.userID),
+            func.coalesce(func.sum(case((UserAccount.isActive.is_(True), 1), else_=0)), 0),
+            func.coalesce(func.sum(case((UserAccount.isActive.is_(False), 1), else_=0)), 0),
+            profiles,
+        ).one()
+        return {
+            "total_users": total,
+            "active_users": active,
+            "suspended_users": suspended,
+            "total_profiles": profile_count,
+        }
+
+    def platformStats(self) -> dict:
+        """Category, request, match and report totals for the platform manager (one query)."""
+        def count(entity, *where):
+            return select(func.count()).select_from(entity).where(*where).scalar_subquery()
+
+        categories, requests, open_requests, matches, reports = db.session.query(
+            count(Category),
+            count(Request),
+            count(Request, Request.status == "open"),
+            count(MatchRecord),
+            count(Report),
+        ).one()
+        return {
+            "total_categories": categories,
+            "total_requests": requests,
+            "open_requests": open_requests,
+            "total_matches": matches,
+            "total_reports": reports,
+        }
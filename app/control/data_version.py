@@ -0,0 +1,44 @@
+"""
+Write counters in the cache_versions table.
+A writer calls bump(name) once inside its own transaction, so the counter moves
+exactly when the change commits; readers compare current(name) with the value
+they saw earlier to tell whether anything changed (in any worker).
+  categories:  category rows (CategoryRegistry)
+  profiles:    user profile names and status (RoleMap, SessionUserCache)
+  users:       user account fields and status (SessionUserCache)
+  report_data: anything the platform reports are computed from (ReportAggregator)
+"""
+from sqlalchemy import update
+from app import db
+from app.entity.cache_version import CacheVersion
+
+CATEGORIES = "categories"
+PROFILES = "profiles"
+REPORT_DATA = "report_data"
+USERS = "users"
+
+
+def bump(name: str):
+    """Increments the named counter in the current transaction (creating it at 1)."""
+    for pending in db.session.new:  # created earlier in this transaction, not flushed yet
+        if isinstance(pending, CacheVersion) and pending.name == name:
+            pending.version += 1
+            return
+    bumped = db.session.execute(
+        update(CacheVersion)
+        .where(CacheVersion.name == name)
+        .values(version=CacheVersion.version + 1)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not bumped:
+        db.session.add(CacheVersion(name=name, version=1))
+
+
+def current(*names: str) -> tuple:
+    """Current value of each named counter (0 if never bumped), in the order given."""
+    rows = dict(
+        db.session.query(CacheVersion.name, CacheVersion.version)
+        .filter(CacheVersion.name.in_(names))
+        .all()
+    )
+    return tuple(rows.get(n, 0) for n in names)
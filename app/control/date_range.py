@@ -0,0 +1,77 @@
+"""
+Half-open datetime ranges for filtering timestamp columns.
+Date strings are parsed and validated once, then applied as
+`column >= start AND column < end`, which can use an index on the column
+(unlike wrapping it in DATE()). Shared by the match history searches and the
+report generators.
+"""
+from datetime import datetime, timedelta
+from sqlalchemy import and_, true
+
+DATE_FORMAT = "%Y-%m-%d"
+
+
+class DateRange:
+    def __init__(self, start: datetime = None, end: datetime = None):
+        self.start = start  # inclusive
+        self.end = end      # exclusive
+
+    @classmethod
+    def fromDates(cls, start_date: str = None, end_date: str = None) -> "DateRange":
+        """Inclusive 'YYYY-MM-DD' bounds from a form; either may be blank."""
+        start = cls._parse(start_date, "start date")
+        end = cls._parse(end_date, "end date")
+        if start and end and end < start:
+            raise ValueError("End date must not be before start date.")
+        return cls(start, end + timedelta(days=1) if end else None)
+
+    @classmethod
+    def day(cls, day_string: str) -> "DateRange":
+        start = cls._parse(day_string, "day")
+        return cls(start, start + timedelta(days=1))
+
+    @classmethod
+    def week(cls, start_date: str) -> "DateRange":
+        start = cls._parse(start_date, "week start")
+        return cls(start, start + timedelta(days=7))
+
+    @classmethod
+    def month(cls, month_string: str) -> "DateRange":
+        """'YYYY-MM' (example: '2025-10')."""
+        try:
+            start = datetime.strptime(month_string, "%Y-%m")
+        except (TypeError, ValueError):
+            raise ValueError("Invalid month format. Use YYYY-MM.")
+        end = datetime(start.year + 1, 1, 1) if start.month == 12 else datetime(start.year, start.month + 1, 1)
+        return cls(start, end)
+
+    @classmethod
+    def trailingDays(cls, days: int, now: datetime = None) -> "DateRange":
+        """The last `days` days up to now (open-ended)."""
+        return cls((now or datetime.utcnow()) - timedelta(days=days), None)
+
+    def apply(self, query, column):
+        """Adds the range to a query as sargable comparisons on `column`."""
+        if self.start is not None:
+            query = query.filter(column >= self.start)
+        if self.end is not None:
+            query = query.filter(column < self.end)
+        return query
+
+    def condition(self, column):
+        """The range as a single SQL expression (for aggregates and WHERE clauses)."""
+        clauses = []
+        if self.start is not None:
+            clauses.append(column >= self.start)
+        if self.end is not None:
+            clauses.append(column < self.end)
+        return and_(true(), *clauses)
+
+    @staticmethod
+    def _parse(value: str, label: str):
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value.strip(), DATE_FORMAT)
+        except ValueError:
+            raise ValueError(f"Invalid {label}. Use YYYY-MM-DD.")
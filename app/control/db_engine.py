@@ -0,0 +1,185 @@
+"""
+Engine configuration, SQLite connection pragmas, read-replica routing and
+pool statistics.
+
+configure_engine(app), called before db.init_app, turns the DB_* settings of
+app.config into SQLALCHEMY_ENGINE_OPTIONS (explicit SQLALCHEMY_ENGINE_OPTIONS
+entries win). install_engine_events(app, db), called after, creates the engine
+for DATABASE_REPLICA_URL (kept in app.extensions, not as a Flask-SQLAlchemy
+bind, so no models or metadata are tied to it) and applies the SQLITE_*
+pragmas to every new SQLite connection: WAL lets readers run next to the
+single writer and busy_timeout makes a writer wait for the lock instead of
+failing with "database is locked".
+
+Reads inside `with read_replica():` (or methods decorated @reads_from_replica)
+go to the replica when one is configured; writes, flushes and text statements
+always use the primary. Use it only for reads that tolerate replication lag:
+the CSR request/history searches and report aggregation do.
+
+This module is imported by app/__init__ before `db` exists, so it must not
+import `app` at module level.
+"""
+import contextvars
+from contextlib import contextmanager
+from functools import wraps
+from flask import current_app, has_app_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql import Select
+
+REPLICA_BIND = "replica"
+
+# app.config key -> engine option (applied when set and the pool supports it)
+POOL_SETTINGS = {
+    "DB_POOL_SIZE": "pool_size",
+    "DB_MAX_OVERFLOW": "max_overflow",
+    "DB_POOL_TIMEOUT": "pool_timeout",
+    "DB_POOL_RECYCLE": "pool_recycle",
+}
+
+# app.config key -> SQLite pragma
+SQLITE_PRAGMAS = {
+    "SQLITE_JOURNAL_MODE": "journal_mode",
+    "SQLITE_SYNCHRONOUS": "synchronous",
+    "SQLITE_CACHE_SIZE": "cache_size",
+    "SQLITE_MMAP_SIZE": "mmap_size",
+    "SQLITE_BUSY_TIMEOUT": "busy_timeout",
+}
+
+# QueuePool's own default, for engines whose options leave max_overflow out
+DEFAULT_MAX_OVERFLOW = 10
+
+_use_replica = contextvars.ContextVar("use_replica", default=False)
+
+
+def _is_memory_sqlite(url) -> bool:
+    url = make_url(url)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def _options_for(url, config) -> dict:
+    options = {"pool_pre_ping": bool(config.get("DB_POOL_PRE_PING", True))}
+    if _is_memory_sqlite(url):
+        return options  # single shared connection (StaticPool): no pool sizing
+    for key, option in POOL_SETTINGS.items():
+        if config.get(key) is not None:
+            options[option] = config[key]
+    return options
+
+
+def configure_engine(app):
+    """Fills SQLALCHEMY_ENGINE_OPTIONS from the DB_* settings."""
+    config = app.config
+    options = _options_for(config["SQLALCHEMY_DATABASE_URI"], config)
+    options.update(config.get("SQLALCHEMY_ENGINE_OPTIONS") or {})
+    config["SQLALCHEMY_ENGINE_OPTIONS"] = options
+
+
+def install_engine_events(app, db):
+    """Creates the replica engine (if configured) and applies the SQLite pragmas on connect."""
+    replica_url = app.config.get("DATABASE_REPLICA_URL")
+    if replica_url:
+        app.extensions[REPLICA_BIND] = create_engine(replica_url, **_options_for(replica_url, app.config))
+
+    pragmas = [(pragma, app.config[key]) for key, pragma in SQLITE_PRAGMAS.items()
+               if app.config.get(key) is not None]
+    if not pragmas:
+        return
+    with app.app_context():
+        engines = list(db.engines.values())
+    if replica_url:
+        engines.append(app.extensions[REPLICA_BIND])
+    for engine in engines:
+        if engine.dialect.name != "sqlite":
+            continue
+
+        @event.listens_for(engine, "connect")
+        def set_pragmas(dbapi_connection, connection_record, pragmas=pragmas):
+            cursor = dbapi_connection.cursor()
+            try:
+                for pragma, value in pragmas:
+                    cursor.execute(f"PRAGMA {pragma}={value}")
+            finally:
+                cursor.close()
+
+
+class RoutingSession(Session):
+    """db.session class: sends SELECTs issued under read_replica() to the replica engine."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and _use_replica.get() and not self._flushing and isinstance(clause, Select):
+            replica = current_app.extensions.get(REPLICA_BIND) if has_app_context() else None
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
+@contextmanager
+def read_replica():
+    """Route the SELECTs in this block to the replica (no-op without DATABASE_REPLICA_URL)."""
+    token = _use_replica.set(True)
+    try:
+        yield
+    finally:
+        _use_replica.reset(token)
+
+
+def reads_from_replica(method):
+    """Decorator form of read_replica() for controller methods that only read."""
+    @wraps(method)
+    def wrapped(*args, **kwargs):
+        with read_replica():
+            return method(*args, **kwargs)
+    return wrapped
+
+
+def pool_status(engine, max_overflow: int = DEFAULT_MAX_OVERFLOW) -> dict:
+    """
+    Connection pool numbers, or {} for pools without a fixed size (e.g. SQLite in memory).
+    `max_overflow` is the value the engine was created with (see configured_max_overflow);
+    the pool does not expose it publicly.
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {}
+    capacity = pool.size() + max(max_overflow, 0)
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "capacity": capacity,
+        "saturation": pool.checkedout() / capacity if capacity else 0.0,
+    }
+
+
+def configured_max_overflow(config, name: str = "primary") -> int:
+    """max_overflow of an engine as configured: DB_MAX_OVERFLOW, SQLALCHEMY_ENGINE_OPTIONS or a bind's options."""
+    if name == REPLICA_BIND:
+        options = _options_for(config["DATABASE_REPLICA_URL"], config)
+    else:
+        options = dict(config.get("SQLALCHEMY_ENGINE_OPTIONS") or {})
+        bind = (config.get("SQLALCHEMY_BINDS") or {}).get(name)
+        if isinstance(bind, dict):
+            options.update(bind)
+    return options.get("max_overflow", DEFAULT_MAX_OVERFLOW)
+
+
+def get_replica_engine():
+    """The current app's replica engine, or None."""
+    return current_app.extensions.get(REPLICA_BIND)
+
+
+def pool_stats(db) -> dict:
+    """engine name ("primary", bind keys, "replica") -> pool_status, for engines with a sized pool."""
+    engines = {key or "primary": engine for key, engine in db.engines.items()}
+    replica = get_replica_engine()
+    if replica is not None:
+        engines[REPLICA_BIND] = replica
+    stats = {}
+    for name, engine in engines.items():
+        status = pool_status(engine, configured_max_overflow(current_app.config, name))
+        if status:
+            stats[name] = status
+    return stats
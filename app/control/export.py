@@ -0,0 +1,67 @@
+"""
+Streaming exports (CSV / JSON Lines).
+Export controllers return an Export: a file name, the column names and a lazy
+row iterator over a column-only query run with yield_per, so rows are fetched
+in batches and never collected in memory or in the session's identity map.
+encode() turns that into text chunks for a Flask streaming response.
+"""
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Iterable, NamedTuple, Tuple
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+}
+
+YIELD_PER = 500
+
+
+class Export(NamedTuple):
+    filename: str
+    columns: Tuple[str, ...]
+    rows: Iterable
+
+
+def stream_query(query, yield_per: int = YIELD_PER):
+    """Iterates a (column) query in batches of `yield_per` rows."""
+    return iter(query.execution_options(yield_per=yield_per))
+
+
+def _json_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def encode(export: Export, fmt: str, batch_size: int = YIELD_PER):
+    """Yields the export as text chunks of about `batch_size` rows."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError("Unsupported export format.")
+
+    if fmt == "jsonl":
+        lines = []
+        for row in export.rows:
+            lines.append(json.dumps({c: _json_value(v) for c, v in zip(export.columns, row)}))
+            if len(lines) >= batch_size:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
+        return
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(export.columns)
+    pending = 0
+    for row in export.rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= batch_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue()
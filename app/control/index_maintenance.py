@@ -0,0 +1,31 @@
+"""
+Brings the indexes of an existing database in line with the models.
+db.create_all() only creates missing tables, so databases created before an
+index was declared never get it; `flask create-indexes` adds the missing ones
+(CREATE INDEX ... only when absent) without touching data.
+"""
+from sqlalchemy import inspect
+from app import db
+
+
+class IndexMaintenance:
+    def missingIndexes(self) -> list:
+        """Returns declared indexes that are not present in the database."""
+        inspector = inspect(db.engine)
+        existing_tables = set(inspector.get_table_names())
+        missing = []
+        for table in db.metadata.sorted_tables:
+            if table.name not in existing_tables:
+                continue
+            present = {ix["name"] for ix in inspector.get_indexes(table.name)}
+            missing += [ix for ix in table.indexes if ix.name not in present]
+        return missing
+
+    def createMissingIndexes(self) -> list:
+        """Creates every missing declared index and returns their names."""
+        created = []
+        with db.engine.begin() as conn:
+            for index in self.missingIndexes():
+                index.create(bind=conn, checkfirst=True)
+                created.append(index.name)
+        return created
@@ -0,0 +1,41 @@
+"""
+Named eager-loading profiles for the search controllers.
+Each profile lists the relationships a listing template walks per row, so the
+page loads them with the page query (JOINs on many-to-one keys) instead of
+issuing one lazy query per row and relationship.
+"""
+from sqlalchemy.orm import joinedload
+from app.entity.request import Request
+from app.entity.match_record import MatchRecord
+from app.entity.shortlist import Shortlist
+from app.entity.user_account import UserAccount
+
+# csr/requests.html cards: category badge + "Posted by"
+REQUEST_CARD = (
+    joinedload(Request.category),
+    joinedload(Request.person_in_need),
+)
+
+# pin/requests.html rows: category only (the PIN is the current user)
+REQUEST_ROW = (
+    joinedload(Request.category),
+)
+
+# csr/shortlist.html renders the shortlisted request as a card
+SHORTLIST_CARD = (
+    joinedload(Shortlist.request).joinedload(Request.category),
+    joinedload(Shortlist.request).joinedload(Request.person_in_need),
+)
+
+# csr/matches.html and pin/matches.html rows (each shows the other party)
+MATCH_ROW = (
+    joinedload(MatchRecord.request),
+    joinedload(MatchRecord.category),
+    joinedload(MatchRecord.person_in_need),
+    joinedload(MatchRecord.csr_representative),
+)
+
+# admin/users.html rows: profile name column
+USER_ROW = (
+    joinedload(UserAccount.profile),
+)
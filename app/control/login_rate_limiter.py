@@ -0,0 +1,164 @@
+"""
+Sliding-window throttling of failed logins, per email and per client IP.
+AuthController.login asks check() before it queries the account or verifies
+a hash, so repeated guesses cost a counter lookup instead of a scrypt run.
+Only failures are counted; a successful login clears its email's counter.
+
+Config:
+  LOGIN_LIMIT_STORE     "database" (default: the login_attempts table, shared by
+                        all workers) or "memory" (per worker: under N workers the
+                        effective limits are N times the configured ones)
+  LOGIN_LIMIT_PER_EMAIL failures allowed per email in the window (default 5; 0 = off)
+  LOGIN_LIMIT_PER_IP    failures allowed per IP in the window (default 20; 0 = off)
+  LOGIN_LIMIT_WINDOW    window length in seconds (default 300)
+The IP key is request.remote_addr; behind a reverse proxy set PROXY_FIX_X_FOR
+(app.config) so it is the client's address, not the proxy's shared one.
+New stores implement counts/oldest/add/clear and are registered in ATTEMPT_STORES.
+"""
+import threading
+import time
+from collections import OrderedDict, deque
+from flask import current_app
+from sqlalchemy import delete, func
+from app import db
+from app.entity.login_attempt import LoginAttempt
+
+
+class MemoryAttemptStore:
+    """Per-process store: a deque of failure times per key."""
+    name = "memory"
+    MAX_KEYS = 100000  # oldest keys are dropped beyond this, bounding memory under spraying
+
+    def __init__(self):
+        self._attempts = OrderedDict()
+        self._lock = threading.Lock()
+
+    def counts(self, keys, since: float) -> dict:
+        with self._lock:
+            result = {}
+            for key in keys:
+                times = self._attempts.get(key)
+                while times and times[0] < since:
+                    times.popleft()
+                if times is not None and not times:
+                    del self._attempts[key]
+                result[key] = len(times) if times else 0
+            return result
+
+    def oldest(self, key, since: float):
+        with self._lock:
+            times = self._attempts.get(key)
+            return next((t for t in times if t >= since), None) if times else None
+
+    def add(self, keys, now: float, window: float):
+        with self._lock:
+            for key in keys:
+                self._attempts.setdefault(key, deque()).append(now)
+                self._attempts.move_to_end(key)
+            while len(self._attempts) > self.MAX_KEYS:
+                self._attempts.popitem(last=False)
+
+    def clear(self, key):
+        with self._lock:
+            self._attempts.pop(key, None)
+
+
+class DatabaseAttemptStore:
+    """Shared store: one login_attempts row per failure and key."""
+    name = "database"
+    PRUNE_EVERY = 100  # adds between deletes of expired rows
+
+    def __init__(self):
+        self._adds = 0
+
+    def counts(self, keys, since: float) -> dict:
+        rows = (
+            db.session.query(LoginAttempt.key, func.count())
+            .filter(LoginAttempt.key.in_(list(keys)), LoginAttempt.attemptedAt >= since)
+            .group_by(LoginAttempt.key)
+            .all()
+        )
+        result = dict.fromkeys(keys, 0)
+        result.update(rows)
+        return result
+
+    def oldest(self, key, since: float):
+        return (
+            db.session.query(func.min(LoginAttempt.attemptedAt))
+            .filter(LoginAttempt.key == key, LoginAttempt.attemptedAt >= since)
+            .scalar()
+        )
+
+    def add(self, keys, now: float, window: float):
+        db.session.add_all([LoginAttempt(key=key, attemptedAt=now) for key in keys])
+        self._adds += 1
+        if self._adds % self.PRUNE_EVERY == 0:
+            db.session.execute(delete(LoginAttempt).where(LoginAttempt.attemptedAt < now - window))
+        db.session.commit()
+
+    def clear(self, key):
+        db.session.execute(delete(LoginAttempt).where(LoginAttempt.key == key))
+        db.session.commit()
+
+
+ATTEMPT_STORES = {
+    "memory": MemoryAttemptStore,
+    "database": DatabaseAttemptStore,
+}
+
+
+class LoginRateLimiter:
+    def __init__(self, store, per_email: int = 5, per_ip: int = 20, window: float = 300):
+        self.store = store
+        self.limits = {"email": per_email, "ip": per_ip}
+        self.window = window
+
+    @staticmethod
+    def _keys(email, ip) -> dict:
+        keys = {}
+        if email:
+            keys["email"] = "email:" + email.strip().lower()
+        if ip:
+            keys["ip"] = "ip:" + ip
+        return keys
+
+    def check(self, email, ip) -> int:
+        """Seconds until the next attempt is allowed (0 = allowed now)."""
+        keys = {kind: key for kind, key in self._keys(email, ip).items() if self.limits[kind] > 0}
+        if not keys:
+            return 0
+        now = time.time()
+        since = now - self.window
+        counts = self.store.counts(keys.values(), since)
+        wait = 0
+        for kind, key in keys.items():
+            if counts.get(key, 0) >= self.limits[kind]:
+                oldest = self.store.oldest(key, since) or now
+                wait = max(wait, int(oldest + self.window - now) + 1)
+        return wait
+
+    def recordFailure(self, email, ip):
+        keys = [key for kind, key in self._keys(email, ip).items() if self.limits[kind] > 0]
+        if keys:
+            self.store.add(keys, time.time(), self.window)
+
+    def recordSuccess(self, email):
+        key = self._keys(email, None).get("email")
+        if key and self.limits["email"] > 0:
+            self.store.clear(key)
+
+
+def init_login_limiter(app):
+    """Creates the login rate limiter for this app."""
+    limiter = LoginRateLimiter(
+        ATTEMPT_STORES[app.config.get("LOGIN_LIMIT_STORE", "database")](),
+        per_email=app.config.get("LOGIN_LIMIT_PER_EMAIL", 5),
+        per_ip=app.config.get("LOGIN_LIMIT_PER_IP", 20),
+        window=app.config.get("LOGIN_LIMIT_WINDOW", 300),
+    )
+    app.extensions["login_limiter"] = limiter
+    return limiter
+
+
+def get_login_limiter() -> LoginRateLimiter:
+    return current_app.extensions["login_limiter"]
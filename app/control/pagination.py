@@ -0,0 +1,124 @@
+"""
+Shared pagination for the search controllers.
+Pages are cut in SQL (LIMIT/OFFSET plus one COUNT), so a listing only loads
+the rows it shows instead of the whole result set.
+
+Feeds that are scrolled deeply can use keyset (seek) pagination instead:
+the page is found with a WHERE on the last row seen, so every page costs
+the same no matter how far down it is.
+"""
+import base64
+import json
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+from flask_sqlalchemy.pagination import Pagination
+
+DEFAULT_PER_PAGE = 10
+
+
+def paginate(query, page: int = 1, per_page: int = DEFAULT_PER_PAGE) -> Pagination:
+    """Returns one page of the query. Out-of-range pages give an empty page instead of a 404."""
+    return query.paginate(page=page or 1, per_page=per_page, error_out=False)
+
+
+# ----------------------------------
+# Keyset (cursor) pagination
+# ----------------------------------
+
+def _encode_value(v):
+    return {"$dt": v.isoformat()} if isinstance(v, datetime) else v
+
+
+def _decode_value(v):
+    return datetime.fromisoformat(v["$dt"]) if isinstance(v, dict) else v
+
+
+def encode_cursor(values) -> str:
+    """Packs the sort-key values of a row into an opaque, URL-safe token."""
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, size: int) -> list:
+    """Unpacks a token from encode_cursor(). Raises ValueError if it was tampered with."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        values = [_decode_value(v) for v in json.loads(raw)]
+    except Exception:
+        raise ValueError("Invalid page cursor.")
+    if len(values) != size:
+        raise ValueError("Invalid page cursor.")
+    return values
+
+
+def _seek(columns, values, forward: bool):
+    """
+    WHERE clause for rows strictly after (forward) or before the cursor row,
+    with every column sorted descending and NULLs last.
+    The last column must be a unique, non-null key (normally the primary key).
+    """
+    col, val = columns[0], values[0]
+    if len(columns) == 1:
+        return col < val if forward else col > val
+
+    rest = _seek(columns[1:], values[1:], forward)
+    if forward:
+        if val is None:
+            return and_(col.is_(None), rest)
+        return or_(col < val, col.is_(None), and_(col == val, rest))
+    if val is None:
+        return or_(col.is_not(None), and_(col.is_(None), rest))
+    return or_(col > val, and_(col == val, rest))
+
+
+class KeysetPage:
+    """One page of a keyset-paginated query, with cursors for the neighbouring pages."""
+
+    def __init__(self, items, per_page, next_cursor=None, prev_cursor=None):
+        self.items = items
+        self.per_page = per_page
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+        self.has_next = next_cursor is not None
+        self.has_prev = prev_cursor is not None
+
+
+def keyset_paginate(query, columns, after: str = None, before: str = None,
+                    per_page: int = DEFAULT_PER_PAGE) -> KeysetPage:
+    """
+    Returns the page of `query` that follows the `after` cursor (or precedes the
+    `before` cursor), ordered by `columns` descending. Without a cursor it returns
+    the first page. `query` must not be ordered already.
+    """
+    if after and before:
+        raise ValueError("Use either 'after' or 'before', not both.")
+
+    def key(row):
+        return [getattr(row, c.key) for c in columns]
+
+    if before:
+        cursor = decode_cursor(before, len(columns))
+        rows = (
+            query.filter(_seek(columns, cursor, forward=False))
+            .order_by(*[c.asc().nulls_first() for c in columns])
+            .limit(per_page + 1)
+            .all()
+        )
+        more_before = len(rows) > per_page
+        items = list(reversed(rows[:per_page]))
+        next_cursor = encode_cursor(key(items[-1])) if items else before
+        prev_cursor = encode_cursor(key(items[0])) if items and more_before else None
+        return KeysetPage(items, per_page, next_cursor, prev_cursor)
+
+    if after:
+        query = query.filter(_seek(columns, decode_cursor(after, len(columns)), forward=True))
+    rows = (
+        query.order_by(*[c.desc().nulls_last() for c in columns])
+        .limit(per_page + 1)
+        .all()
+    )
+    items = rows[:per_page]
+    next_cursor = encode_cursor(key(items[-1])) if len(rows) > per_page else None
+    prev_cursor = encode_cursor(key(items[0])) if items and after else None
+    return KeysetPage(items, per_page, next_cursor, prev_cursor)
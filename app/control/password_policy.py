@@ -0,0 +1,115 @@
+"""
+Password hashing policy.
+The algorithm and its cost come from config instead of werkzeug's defaults:
+  PASSWORD_HASH_ALGORITHM   "scrypt" (default) or "pbkdf2"
+  PASSWORD_SCRYPT_N/_R/_P   scrypt cost (default 32768 / 8 / 1)
+  PASSWORD_PBKDF2_HASH      pbkdf2 digest (default "sha256")
+  PASSWORD_PBKDF2_ITERATIONS pbkdf2 cost (default 600000)
+UserAccount.password and the bulk import hash with it. AuthController.login
+re-hashes a stored hash that is weaker than (or of another kind than) the
+policy, so raising the cost migrates users as they sign in.
+`flask benchmark-hashing` times hashes on the host to pick the cost against
+the login latency budget (PASSWORD_HASH_BUDGET_MS, default 250).
+"""
+import time
+from typing import NamedTuple
+from flask import current_app, has_app_context
+from werkzeug.security import check_password_hash, generate_password_hash
+
+ALGORITHMS = ("scrypt", "pbkdf2")
+
+
+class PasswordPolicy(NamedTuple):
+    algorithm: str = "scrypt"
+    scrypt_n: int = 2 ** 15
+    scrypt_r: int = 8
+    scrypt_p: int = 1
+    pbkdf2_hash: str = "sha256"
+    pbkdf2_iterations: int = 600000
+
+    @classmethod
+    def fromConfig(cls, config) -> "PasswordPolicy":
+        default = cls()
+        policy = cls(
+            algorithm=config.get("PASSWORD_HASH_ALGORITHM", default.algorithm),
+            scrypt_n=int(config.get("PASSWORD_SCRYPT_N", default.scrypt_n)),
+            scrypt_r=int(config.get("PASSWORD_SCRYPT_R", default.scrypt_r)),
+            scrypt_p=int(config.get("PASSWORD_SCRYPT_P", default.scrypt_p)),
+            pbkdf2_hash=config.get("PASSWORD_PBKDF2_HASH", default.pbkdf2_hash),
+            pbkdf2_iterations=int(config.get("PASSWORD_PBKDF2_ITERATIONS", default.pbkdf2_iterations)),
+        )
+        if policy.algorithm not in ALGORITHMS:
+            raise ValueError(f"Unsupported password hash algorithm '{policy.algorithm}'.")
+        return policy
+
+    @property
+    def method(self) -> str:
+        """werkzeug method string, e.g. 'scrypt:32768:8:1' or 'pbkdf2:sha256:600000'."""
+        if self.algorithm == "scrypt":
+            return f"scrypt:{self.scrypt_n}:{self.scrypt_r}:{self.scrypt_p}"
+        return f"pbkdf2:{self.pbkdf2_hash}:{self.pbkdf2_iterations}"
+
+    def hash(self, raw: str) -> str:
+        return generate_password_hash(raw, method=self.method)
+
+    def verify(self, stored: str, raw: str) -> bool:
+        return check_password_hash(stored, raw)
+
+    def needsRehash(self, stored: str) -> bool:
+        """True when `stored` uses another algorithm/digest or a lower cost than this policy."""
+        parts = (stored or "").split("$", 1)[0].split(":")
+        try:
+            if parts[0] != self.algorithm:
+                return True
+            if self.algorithm == "scrypt":
+                n, r, p = (int(x) for x in parts[1:4])
+                return n < self.scrypt_n or r < self.scrypt_r or p < self.scrypt_p
+            if parts[1] != self.pbkdf2_hash:
+                return True
+            return int(parts[2]) < self.pbkdf2_iterations
+        except (IndexError, ValueError):  # method string without explicit cost
+            return True
+
+    def withCost(self, cost: int) -> "PasswordPolicy":
+        """Same algorithm with another cost (scrypt N / pbkdf2 iterations)."""
+        if self.algorithm == "scrypt":
+            return self._replace(scrypt_n=cost)
+        return self._replace(pbkdf2_iterations=cost)
+
+    @property
+    def cost(self) -> int:
+        return self.scrypt_n if self.algorithm == "scrypt" else self.pbkdf2_iterations
+
+
+def get_password_policy() -> PasswordPolicy:
+    """Policy of the current app (cached in app.extensions); defaults outside an app context."""
+    if not has_app_context():
+        return PasswordPolicy()
+    policy = current_app.extensions.get("password_policy")
+    if policy is None:
+        policy = current_app.extensions.setdefault("password_policy", PasswordPolicy.fromConfig(current_app.config))
+    return policy
+
+
+def time_hash(policy: PasswordPolicy, rounds: int = 5) -> float:
+    """Median seconds per hash with `policy` on this host."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        policy.hash("benchmark-password")
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def benchmark(policy: PasswordPolicy, rounds: int = 5, steps: int = 2) -> list:
+    """
+    Times the policy's cost and `steps` doublings/halvings around it.
+    Returns [(cost, seconds_per_hash), ...] sorted by cost.
+    """
+    costs = {policy.cost}
+    for i in range(1, steps + 1):
+        costs.add(policy.cost * 2 ** i)
+        if policy.cost // 2 ** i >= (2 if policy.algorithm == "scrypt" else 1000):
+            costs.add(policy.cost // 2 ** i)
+    return [(cost, time_hash(policy.withCost(cost), rounds)) for cost in sorted(costs)]
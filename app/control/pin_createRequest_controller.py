@@ -4,6 +4,9 @@ As a PIN, I want to create a service request so that I can get assistance.
 """
 from app import db
 from app.entity.request import Request
+from app.control.report_rollup import ReportRollup
+from app.control.request_search import get_search_backend
+from app.control import dashboard_stats, data_version
 
 class PinCreateRequestController:
     def createRequest(self, requestID:int=None, userID:int=None, categoryID:int=None,
@@ -21,7 +24,12 @@ class PinCreateRequestController:
                 status="open"
             )
             db.session.add(new_request)
+            db.session.flush()  # populate createdAt for the daily rollup
+            ReportRollup().recordRequestCreated(new_request)
+            data_version.bump(data_version.REPORT_DATA)
+            get_search_backend().index(new_request)
             db.session.commit()
+            dashboard_stats.invalidate(dashboard_stats.OPEN_REQUESTS)
             return True
         except Exception as e:
             db.session.rollback()
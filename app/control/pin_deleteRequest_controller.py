@@ -7,6 +7,9 @@ Hard delete: remove row from database.
 """
 from app import db
 from app.entity.request import Request
+from app.control.report_rollup import ReportRollup
+from app.control.request_search import get_search_backend
+from app.control import dashboard_stats, data_version
 
 class PinDeleteRequestController:
     def deleteRequest(self, requestID: int, userID: int) -> bool:
@@ -18,8 +21,12 @@ class PinDeleteRequestController:
             raise PermissionError("Unauthorized: You cannot delete another user's request.")
 
         try:
+            ReportRollup().recordRequestDeleted(r)
+            data_version.bump(data_version.REPORT_DATA)
+            get_search_backend().remove(r.requestID)
             db.session.delete(r)
             db.session.commit()
+            dashboard_stats.invalidate(dashboard_stats.OPEN_REQUESTS)
             return True
         except Exception as e:
             db.session.rollback()
@@ -1,19 +1,44 @@
 # app/control/pin_searchMatchRecord_controller.py
-from sqlalchemy import func
+from sqlalchemy.orm import aliased
 from app import db
 from app.entity.match_record import MatchRecord
 from app.entity.request import Request
 from app.entity.category import Category
+from app.entity.user_account import UserAccount
+from app.control.pagination import paginate
+from app.control.loading_profiles import MATCH_ROW
+from app.control.date_range import DateRange
+from app.control.export import Export, stream_query
 
 class PinSearchMatchRecordController:
-    def searchMatchRecord(self, pin_id: int, category_query: str = "", start_date: str = "", end_date: str = ""):
+    def searchMatchRecord(self, pin_id: int, category_query: str = "", start_date: str = "", end_date: str = "",
+                          page: int = 1, per_page: int = 10):
         """
-        Returns completed match records for a PIN, filtered by optional category text and an inclusive date range.
+        Returns a page of completed match records for a PIN, filtered by optional category text and an inclusive date range.
         """
+        q = self._filtered(db.session.query(MatchRecord), pin_id, category_query, start_date, end_date)
+        return paginate(q.options(*MATCH_ROW).order_by(MatchRecord.completedAt.desc()), page, per_page)
+
+    def exportMatchRecords(self, pin_id: int, category_query: str = "", start_date: str = "", end_date: str = ""):
+        """All filtered match records of a PIN as a streamed Export (newest first)."""
+        csr = aliased(UserAccount)
+        q = self._filtered(
+            db.session.query(
+                MatchRecord.matchRecordID, MatchRecord.completedAt, Request.title,
+                Category.categoryName, csr.name,
+            ),
+            pin_id, category_query, start_date, end_date,
+        ).join(csr, MatchRecord.csrRepID == csr.userID)
+        return Export(
+            "match_records",
+            ("matchRecordID", "completedAt", "requestTitle", "category", "csrRepresentative"),
+            stream_query(q.order_by(MatchRecord.completedAt.desc(), MatchRecord.matchRecordID.desc())),
+        )
+
+    def _filtered(self, q, pin_id, category_query, start_date, end_date):
         # Base: only this PIN's completed records
         q = (
-            db.session.query(MatchRecord)
-            .join(Request, MatchRecord.requestID == Request.requestID)
+            q.join(Request, MatchRecord.requestID == Request.requestID)
             .join(Category, Request.categoryID == Category.categoryID)
             .filter(
                 Request.pinID == pin_id,
@@ -26,10 +51,5 @@ class PinSearchMatchRecordController:
             like = f"%{category_query.strip()}%"
             q = q.filter(Category.categoryName.ilike(like))
 
-        # Inclusive date range (compare DATE only; ignores time)
-        if start_date:
-            q = q.filter(func.date(MatchRecord.completedAt) >= start_date)
-        if end_date:
-            q = q.filter(func.date(MatchRecord.completedAt) <= end_date)
-
-        return q.order_by(MatchRecord.completedAt.desc()).all()
+        # Inclusive date range, applied as a half-open range on completedAt
+        return DateRange.fromDates(start_date, end_date).apply(q, MatchRecord.completedAt)
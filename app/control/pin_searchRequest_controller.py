@@ -3,10 +3,17 @@ User Story:
 As a PIN, I want to search my service requests so that I can locate them easily when I have many open service requests.
 """
 from app.entity.request import Request
+from app.control.pagination import paginate
+from app.control.loading_profiles import REQUEST_ROW
+from app.control.request_search import get_search_backend
 
 class PinSearchRequestController:
-    def searchRequests(self, pin_id:int, keyword:str=None, status:str=None):
+    def searchRequests(self, pin_id:int, keyword:str=None, status:str=None, page:int=1, per_page:int=9):
+        """Returns a page of this PIN's requests, filtered by title/description keywords (best match first) and status."""
         q = Request.query.filter_by(pinID=pin_id)
-        if keyword: q = q.filter(Request.title.ilike(f"%{keyword}%"))
         if status: q = q.filter_by(status=status)
-        return q.order_by(Request.requestID.desc()).all()
+        if keyword and keyword.strip():
+            q = get_search_backend().ranked(q, keyword)
+        else:
+            q = q.order_by(Request.requestID.desc())
+        return paginate(q.options(*REQUEST_ROW), page, per_page)
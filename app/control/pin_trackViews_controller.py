@@ -3,8 +3,12 @@ User Story:
 As a PIN, I want to track the number of views on each of my service requests so that I know the level of interest.
 """
 from app.entity.request import Request
+from app.control.view_counter import get_view_counter
 
 class PinTrackViewsController:
     def trackViews(self, request_id:int) -> int:
+        """Returns persisted views plus views still buffered in the view counter."""
         r = Request.query.get(request_id)
-        return (r.viewCount if r else 0)
+        if not r:
+            return 0
+        return (r.viewCount or 0) + get_view_counter().pending(request_id)
@@ -6,6 +6,9 @@ UML: + updateRequest(requestID: int, newRequestID: int, userID: int,
 """
 from app import db
 from app.entity.request import Request
+from app.control.report_rollup import ReportRollup
+from app.control.request_search import get_search_backend
+from app.control import dashboard_stats, data_version
 
 class PinUpdateRequestController:
     def updateRequest(self,
@@ -25,6 +28,9 @@ class PinUpdateRequestController:
         if r.pinID != userID:
             raise PermissionError("Not authorized to edit this request.")
 
+        old_category_id, old_status = r.categoryID, r.status
+        old_id, old_text = r.requestID, (r.title, r.description)
+
         # handle newRequestID (rare IRL but UML demands)
         if newRequestID and newRequestID != r.requestID:
             # make sure we don't collide
@@ -42,5 +48,13 @@ class PinUpdateRequestController:
         if status:
             r.status = status  # e.g. "Open", "Draft"
 
+        if ReportRollup().recordRequestChanged(r, old_category_id, old_status):
+            data_version.bump(data_version.REPORT_DATA)
+        if r.requestID != old_id or (r.title, r.description) != old_text:
+            search = get_search_backend()
+            search.remove(old_id)
+            search.index(r)
         db.session.commit()
+        if r.status != old_status:
+            dashboard_stats.invalidate(dashboard_stats.OPEN_REQUESTS)
         return True
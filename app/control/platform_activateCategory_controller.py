@@ -5,6 +5,7 @@ so that they can be used again for new requests.
 """
 from app import db
 from app.entity.category import Category
+from app.control.category_registry import CategoryRegistry
 
 class PlatformActivateCategoryController:
     def activateCategory(self, categoryID: int) -> bool:
@@ -13,5 +14,6 @@ class PlatformActivateCategoryController:
         if not category:
             raise ValueError("Category not found.")
         category.isActive = True
+        CategoryRegistry.changed()
         db.session.commit()
         return True
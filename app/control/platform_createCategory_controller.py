@@ -4,8 +4,11 @@ As a Platform Manager, I want to create service categories (transport, health su
 """
 from app import db
 from app.entity.category import Category
+from app.control.category_registry import CategoryRegistry
 
 class PlatformCreateCategoryController:
     def create_category(self, name:str, description:str=None):
         c = Category(categoryName=name, description=description, isActive=True)
-        db.session.add(c); db.session.commit(); return c
+        db.session.add(c)
+        CategoryRegistry.changed()
+        db.session.commit(); return c
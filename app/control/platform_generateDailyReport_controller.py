@@ -3,70 +3,40 @@ User Story:
 As a Platform Manager, I want to generate daily reports so that I can track daily usage.
 + generateDailyReport(date: date): Report
 """
-import json
-from datetime import datetime, timedelta
-from app import db
-from app.entity.report import Report
-from app.entity.user_account import UserAccount
-from app.entity.request import Request
-from app.entity.match_record import MatchRecord
-from app.entity.category import Category
+from datetime import date
+from app.control.report_aggregator import ReportAggregator
+from app.control.date_range import DateRange
 
 class PlatformGenerateDailyReportController:
-    def generateDailyReport(self, manager_id: int, day_string: str):
+    def generateDailyReport(self, manager_id: int, day_string: str, force: bool = False):
         """
         day_string expected format: 'YYYY-MM-DD'
         """
 
-        # parse the day
-        day_start = datetime.strptime(day_string, "%Y-%m-%d")
-        next_day = day_start + timedelta(days=1)
+        # validate the day
+        DateRange.day(day_string)
 
-        # metrics
-        total_users = UserAccount.query.count()
-        total_requests = Request.query.count()
-        open_requests = Request.query.filter_by(status="open").count()
-        closed_requests = Request.query.filter_by(status="closed").count()
+        # reuse the stored report unless the data (or today's 30-day window) moved
+        engine = ReportAggregator()
+        today = date.today()
+        version = engine.dataVersion(as_of=today)
+        if not force:
+            existing = engine.findReport("daily", day_string, version)
+            if existing:
+                return existing
 
-        total_matches = MatchRecord.query.count()
-        recent_matches_30 = (
-            MatchRecord.query
-            .filter(MatchRecord.completedAt >= datetime.utcnow() - timedelta(days=30))
-            .count()
-        )
-
-        # category breakdown
-        breakdown = {}
-        cats = Category.query.all()
-        for c in cats:
-            cat_reqs = Request.query.filter_by(categoryID=c.categoryID).all()
-            breakdown[c.categoryName] = {
-                "total_requests": len(cat_reqs),
-                "open_requests": len([r for r in cat_reqs if r.status == "open"]),
-                "closed_requests": len([r for r in cat_reqs if r.status == "closed"]),
-            }
+        stats = engine.collect(DateRange.trailingDays(30), as_of=today)
 
         data = {
             "summary": {
-                "total_users": total_users,
-                "total_requests": total_requests,
-                "open_requests": open_requests,
-                "closed_requests": closed_requests,
-                "total_matches": total_matches,
-                "recent_matches_30_days": recent_matches_30,
+                "total_users": stats["total_users"],
+                "total_requests": stats["total_requests"],
+                "open_requests": stats["open_requests"],
+                "closed_requests": stats["closed_requests"],
+                "total_matches": stats["total_matches"],
+                "recent_matches_30_days": stats["matches_in_window"],
             },
-            "category_breakdown": breakdown
+            "category_breakdown": stats["category_breakdown"]
         }
 
-        # persist Report row
-        report = Report(
-            reportTitle=f"Daily Report - {day_string}",
-            reportType="daily",
-            generatedBy=manager_id,
-            period=day_string,
-            reportData=json.dumps(data)
-        )
-
-        db.session.add(report)
-        db.session.commit()
-        return report
+        return engine.saveReport(manager_id, f"Daily Report - {day_string}", "daily", day_string, data, stats["data_version"])
@@ -2,15 +2,30 @@
 User Story:
 As a Platform Manager, I want to search service categories by name so that I can quickly find a specific category.
 """
+from sqlalchemy import func
+from app import db
 from app.entity.category import Category
+from app.entity.request import Request
+from app.control.pagination import paginate
 
 class PlatformSearchCategoryController:
-    def searchCategoryByName(self, name: str):
-        """Returns a list of categories matching the given name (case-insensitive)."""
+    def searchCategoryByName(self, name: str, page: int = 1, per_page: int = 10):
+        """Returns a page of categories matching the given name (case-insensitive)."""
         like_pattern = f"%{name or ''}%"
-        return (
+        q = (
             Category.query
             .filter(Category.categoryName.ilike(like_pattern))
             .order_by(Category.categoryName)
-            .all()
+        )
+        return paginate(q, page, per_page)
+
+    def requestCounts(self, categories) -> dict:
+        """categoryID -> number of requests, for a page of categories (one grouped query)."""
+        ids = [c.categoryID for c in categories]
+        if not ids:
+            return {}
+        return dict(
+            db.session.query(Request.categoryID, func.count(Request.requestID))
+            .filter(Request.categoryID.in_(ids))
+            .group_by(Request.categoryID)
         )
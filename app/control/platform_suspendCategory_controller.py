@@ -4,6 +4,7 @@ As a Platform Manager, I want to suspend unused service categories so that inval
 """
 from app import db
 from app.entity.category import Category
+from app.control.category_registry import CategoryRegistry
 
 class PlatformSuspendCategoryController:
     def suspendCategory(self, categoryID: int) -> bool:
@@ -12,5 +13,6 @@ class PlatformSuspendCategoryController:
         if not category:
             raise ValueError("Category not found.")
         category.isActive = False
+        CategoryRegistry.changed()
         db.session.commit()
         return True
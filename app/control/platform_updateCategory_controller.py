@@ -4,6 +4,7 @@ As a Platform Manager, I want to update service categories so that they remain r
 """
 from app import db
 from app.entity.category import Category
+from app.control.category_registry import CategoryRegistry
 
 class PlatformUpdateCategoryController:
     def updateCategory(self, categoryID: int, categoryName: str, description: str):
@@ -15,5 +16,6 @@ class PlatformUpdateCategoryController:
         category.categoryName = categoryName
         category.description = description
 
+        CategoryRegistry.changed()
         db.session.commit()
         return True
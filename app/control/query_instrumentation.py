@@ -0,0 +1,179 @@
+"""
+Per-request SQL instrumentation.
+SQLAlchemy cursor events time every statement (on the primary, any binds and
+the read replica); Flask before/after_request hooks collect them per request
+into a summary: query count, total DB time and the slowest statements
+(literals and parameters redacted, only the parameter count is kept). Each summary goes to:
+  - the "app.sql" logger as one JSON line: at WARNING when a threshold is
+    crossed, at INFO for every request when SQL_LOG_ALL_REQUESTS is set
+  - a `Server-Timing: db;dur=...` response header when SQL_SERVER_TIMING is set
+  - a ring buffer of the last SQL_INSTRUMENTATION_BUFFER requests, shown at
+    /admin/sql-stats
+
+Config (defaults): SQL_INSTRUMENTATION (True), SQL_QUERY_COUNT_WARN (20),
+SQL_DB_TIME_WARN_MS (200), SQL_SLOW_STATEMENT_MS (100),
+SQL_TOP_STATEMENTS (3), SQL_INSTRUMENTATION_BUFFER (200),
+SQL_SERVER_TIMING (False), SQL_LOG_ALL_REQUESTS (False).
+"""
+import heapq
+import json
+import logging
+import re
+import time
+from collections import deque
+from datetime import datetime
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from app import db
+from app.control.db_engine import get_replica_engine
+
+logger = logging.getLogger("app.sql")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def redact(statement: str, parameters=None) -> str:
+    """Statement text with literals replaced by '?' and parameters reduced to a count."""
+    text = _WHITESPACE.sub(" ", statement).strip()
+    text = _NUMBER_LITERAL.sub("?", _STRING_LITERAL.sub("'?'", text))
+    if parameters:
+        n = len(parameters) if isinstance(parameters, (list, tuple, dict)) else 1
+        text += f" [{n} parameters redacted]"
+    return text
+
+
+class RequestQueries:
+    """Statements of one request. Keeps only the `top` slowest ones."""
+    __slots__ = ("count", "total", "top", "_slowest", "_seq")
+
+    def __init__(self, top: int):
+        self.count = 0
+        self.total = 0.0
+        self.top = top
+        self._slowest = []  # min-heap of (seconds, seq, statement, parameters)
+        self._seq = 0
+
+    def add(self, statement, parameters, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self._seq += 1
+        item = (seconds, self._seq, statement, parameters)
+        if len(self._slowest) < self.top:
+            heapq.heappush(self._slowest, item)
+        elif seconds > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, item)
+
+    def slowest(self) -> list:
+        """[(ms, redacted statement), ...] slowest first."""
+        return [
+            (round(seconds * 1000, 3), redact(statement, parameters))
+            for seconds, _, statement, parameters in sorted(self._slowest, reverse=True)
+        ]
+
+
+class QueryInstrumentation:
+    def __init__(self, app=None):
+        self.app = None
+        self.recent = deque()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("SQL_INSTRUMENTATION", True)
+        app.config.setdefault("SQL_QUERY_COUNT_WARN", 20)
+        app.config.setdefault("SQL_DB_TIME_WARN_MS", 200)
+        app.config.setdefault("SQL_SLOW_STATEMENT_MS", 100)
+        app.config.setdefault("SQL_TOP_STATEMENTS", 3)
+        app.config.setdefault("SQL_INSTRUMENTATION_BUFFER", 200)
+        app.config.setdefault("SQL_SERVER_TIMING", False)
+        app.config.setdefault("SQL_LOG_ALL_REQUESTS", False)
+        self.app = app
+        self.recent = deque(maxlen=app.config["SQL_INSTRUMENTATION_BUFFER"])
+        app.extensions["query_instrumentation"] = self
+        if not app.config["SQL_INSTRUMENTATION"]:
+            return
+
+        with app.app_context():
+            engines = list(db.engines.values())
+            replica = get_replica_engine()  # reads routed by read_replica() count too
+        if replica is not None:
+            engines.append(replica)
+        for engine in engines:
+            event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        app.before_request(self._start)
+        app.after_request(self._finish)
+
+    # --- engine events -------------------------------------------------
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        # kept on the statement's execution context, so a statement that fails
+        # (and never reaches after_cursor_execute) leaves nothing behind
+        if context is not None:
+            context._query_start = time.perf_counter()
+
+    @staticmethod
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, "_query_start", None)
+        if start is None:
+            return
+        elapsed = time.perf_counter() - start
+        if has_request_context():
+            queries = g.get("sql_queries")
+            if queries is not None:
+                queries.add(statement, parameters, elapsed)
+
+    # --- request hooks -------------------------------------------------
+
+    def _start(self):
+        g.sql_queries = RequestQueries(current_app.config["SQL_TOP_STATEMENTS"])
+
+    def _finish(self, response):
+        queries = g.get("sql_queries")  # left on g for RequestMetrics
+        if queries is None:
+            return response
+        config = current_app.config
+        db_ms = queries.total * 1000
+        slowest = queries.slowest()
+        flags = []
+        if queries.count >= config["SQL_QUERY_COUNT_WARN"]:
+            flags.append("query_count")
+        if db_ms >= config["SQL_DB_TIME_WARN_MS"]:
+            flags.append("db_time")
+        if slowest and slowest[0][0] >= config["SQL_SLOW_STATEMENT_MS"]:
+            flags.append("slow_statement")
+
+        record = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "method": request.method,
+            "path": request.path,
+            "endpoint": request.endpoint,
+            "status": response.status_code,
+            "queries": queries.count,
+            "db_ms": round(db_ms, 3),
+            "slowest": slowest,
+            "flags": flags,
+        }
+        self.recent.append(record)
+        if flags:
+            logger.warning(json.dumps(record))
+        elif config["SQL_LOG_ALL_REQUESTS"]:
+            logger.info(json.dumps(record))
+        if config["SQL_SERVER_TIMING"]:
+            timing = f'db;dur={db_ms:.1f};desc="{queries.count} queries"'
+            existing = response.headers.get("Server-Timing")
+            response.headers["Server-Timing"] = f"{existing}, {timing}" if existing else timing
+        return response
+
+    def recentRequests(self, flagged_only: bool = False) -> list:
+        """Buffered request summaries, newest first."""
+        records = list(self.recent)
+        records.reverse()
+        return [r for r in records if r["flags"]] if flagged_only else records
+
+
+def get_query_instrumentation() -> QueryInstrumentation:
+    return current_app.extensions["query_instrumentation"]
@@ -0,0 +1,147 @@
+"""
+Shared aggregation engine behind the daily, weekly and monthly report controllers.
+Computes the summary counts and the per-category breakdown with grouped queries
+(conditional aggregates) over the daily rollups, so no request rows are loaded:
+all-time request totals come from the ALL_DAYS rows (one per category and
+status), window counts from the day rows of the window.
+Saved reports carry the data version they were computed at ("data_version" in
+the JSON); generators reuse the latest report for the same type and period
+while that version is unchanged. collect() may read from the replica, so it
+reads the version there too, before the totals, and generators save the report
+under that one: a lagging replica yields a report stamped with its older
+version, which the next request (checking the primary) regenerates.
+"""
+import json
+from datetime import date
+from sqlalchemy import case, func, select
+from app import db
+from app.entity.report import Report
+from app.entity.user_account import UserAccount
+from app.entity.category import Category
+from app.entity.match_record import MatchRecord
+from app.entity.daily_rollup import ALL_DAYS, DailyRollup
+from app.control.date_range import DateRange
+from app.control import data_version
+from app.control.report_rollup import ReportRollup
+from app.control.export import Export
+from app.control.db_engine import reads_from_replica
+
+
+class ReportAggregator:
+    @reads_from_replica
+    def collect(self, match_window: DateRange, as_of: date = None) -> dict:
+        """
+        Returns the request/user/match totals, the category breakdown and the
+        "data_version" they were read at (see dataVersion; pass the same `as_of`).
+        `total_matches` counts every match record (completed or not);
+        `matches_in_window` counts matches completed on the days covered by `match_window`.
+        Reads the rollups, so the cost depends on categories and days in the window, not table size.
+        """
+        version = self._watermark(as_of)  # same database as the totals, read first
+
+        # 1) request counts per category (open/closed via conditional aggregates)
+        per_category = (
+            db.session.query(
+                DailyRollup.categoryID,
+                func.sum(DailyRollup.requestCount),
+                func.sum(case((DailyRollup.status == "open", DailyRollup.requestCount), else_=0)),
+                func.sum(case((DailyRollup.status == "closed", DailyRollup.requestCount), else_=0)),
+            )
+            .filter(DailyRollup.day == ALL_DAYS)
+            .group_by(DailyRollup.categoryID)
+            .all()
+        )
+        counts = {
+            cat_id: (total or 0, opened or 0, closed or 0)
+            for cat_id, total, opened, closed in per_category
+        }
+
+        # 2) scalar totals in one round trip
+        in_window = DateRange(
+            match_window.start and match_window.start.date(),
+            match_window.end and match_window.end.date(),
+        ).condition(DailyRollup.day)
+        total_users, total_matches, matches_in_window = db.session.execute(
+            select(
+                select(func.count(UserAccount.userID)).scalar_subquery(),
+                select(func.count(MatchRecord.matchRecordID)).scalar_subquery(),
+                select(func.coalesce(func.sum(DailyRollup.matchCount), 0))
+                .where(DailyRollup.day > ALL_DAYS, in_window).scalar_subquery(),
+            )
+        ).one()
+
+        # 3) category names (every category is listed, even with no requests)
+        breakdown = {}
+        for cat_id, name in db.session.query(Category.categoryID, Category.categoryName).order_by(Category.categoryID):
+            total, opened, closed = counts.get(cat_id, (0, 0, 0))
+            breakdown[name] = {
+                "total_requests": total,
+                "open_requests": opened,
+                "closed_requests": closed,
+            }
+
+        return {
+            "total_users": total_users,
+            "total_requests": sum(c[0] for c in counts.values()),
+            "open_requests": sum(c[1] for c in counts.values()),
+            "closed_requests": sum(c[2] for c in counts.values()),
+            "total_matches": total_matches,
+            "matches_in_window": matches_in_window,
+            "category_breakdown": breakdown,
+            "data_version": version,
+        }
+
+    def dataVersion(self, as_of: date = None) -> str:
+        """
+        Watermark of everything collect() reads: the report-data and category write
+        counters. Reports whose window is relative to today pass `as_of` so they
+        also expire when the day changes. Builds the rollups first if they never were.
+        """
+        ReportRollup().ensureBuilt()
+        return self._watermark(as_of)
+
+    @staticmethod
+    def _watermark(as_of: date = None) -> str:
+        reports, categories = data_version.current(data_version.REPORT_DATA, data_version.CATEGORIES)
+        version = f"{reports}.{categories}"
+        return f"{version}@{as_of.isoformat()}" if as_of else version
+
+    def findReport(self, report_type: str, period: str, version: str):
+        """Latest saved report for (type, period) if it was computed at `version`, else None."""
+        report = (
+            Report.query.filter_by(reportType=report_type, period=period)
+            .order_by(Report.reportID.desc())
+            .first()
+        )
+        if report and report.reportData and json.loads(report.reportData).get("data_version") == version:
+            return report
+        return None
+
+    def saveReport(self, manager_id: int, title: str, report_type: str, period: str, data: dict,
+                   version: str = None) -> Report:
+        """Persists a generated report and returns the Report row."""
+        if version is not None:
+            data = {**data, "data_version": version}
+        report = Report(
+            reportTitle=title,
+            reportType=report_type,
+            generatedBy=manager_id,
+            period=period,
+            reportData=json.dumps(data)
+        )
+        db.session.add(report)
+        db.session.commit()
+        return report
+
+    def exportBreakdown(self, report: Report) -> Export:
+        """A stored report's category breakdown as one row per category."""
+        breakdown = json.loads(report.reportData or "{}").get("category_breakdown", {})
+        rows = (
+            (name, stats.get("total_requests"), stats.get("open_requests"), stats.get("closed_requests"))
+            for name, stats in breakdown.items()
+        )
+        return Export(
+            f"report_{report.reportID}_categories",
+            ("category", "total_requests", "open_requests", "closed_requests"),
+            rows,
+        )
@@ -0,0 +1,186 @@
+"""
+Background runner for the platform manager's report generators.
+submit() validates the period, records a ReportJob row and hands the job to a
+thread pool (REPORT_JOB_WORKERS threads, default 2; 0 runs jobs inline, e.g.
+for tests and the CLI), so the web request returns at once and the pages poll
+status(). A second request for the same (type, period) while one is queued or
+running gets the existing job back. The finished job points at the Report row
+written by the usual Platform*Report controller.
+A job counts as stale when it has been running for REPORT_JOB_STALE_AFTER
+seconds (default 900; e.g. the process died), or queued for as long without
+starting. Listings leave stale jobs out; submit() marks them failed before it
+looks for an identical job. State changes are conditional updates, so a job
+that was reaped is neither started nor overwritten by its late finish.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import and_, or_, update
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.entity.report_job import ACTIVE_JOB_STATES, ReportJob
+from app.control.date_range import DateRange
+from app.control.platform_generateDailyReport_controller import PlatformGenerateDailyReportController
+from app.control.platform_generateWeeklyReport_controller import PlatformGenerateWeeklyReportController
+from app.control.platform_generateMonthlyReport_controller import PlatformGenerateMonthlyReportController
+
+# report type -> (period validator, generator(manager_id, period, force) -> Report)
+REPORT_TYPES = {
+    "daily": (DateRange.day, lambda m, p, f: PlatformGenerateDailyReportController().generateDailyReport(m, p, f)),
+    "weekly": (DateRange.week, lambda m, p, f: PlatformGenerateWeeklyReportController().generateWeeklyReport(m, p, f)),
+    "monthly": (DateRange.month, lambda m, p, f: PlatformGenerateMonthlyReportController().generateMonthlyReport(m, p, f)),
+}
+
+
+class ReportJobRunner:
+    def __init__(self, app=None):
+        self.app = None
+        self._executor = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("REPORT_JOB_WORKERS", 2)
+        app.config.setdefault("REPORT_JOB_STALE_AFTER", 900)
+        self.app = app
+        self.workers = app.config["REPORT_JOB_WORKERS"]
+        self.stale_after = timedelta(seconds=app.config["REPORT_JOB_STALE_AFTER"])
+        if self.workers > 0:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="report-job")
+        app.extensions["report_jobs"] = self
+
+    def submit(self, manager_id: int, report_type: str, period: str, force: bool = False) -> ReportJob:
+        """
+        Queues a report (or returns the identical one already queued/running).
+        Without `force` the job finishes at once when a stored report is still current.
+        """
+        if report_type not in REPORT_TYPES:
+            raise ValueError("Invalid report type.")
+        period = (period or "").strip()
+        validate, _ = REPORT_TYPES[report_type]
+        validate(period)  # bad periods fail here, not in the background
+
+        self.reapStale()
+        existing = self._activeJob(report_type, period)
+        if existing:
+            return existing
+
+        job = ReportJob(reportType=report_type, period=period, requestedBy=manager_id,
+                        force=force, createdAt=datetime.now())
+        db.session.add(job)
+        try:
+            db.session.commit()
+        except IntegrityError:  # another worker queued it first
+            db.session.rollback()
+            existing = self._activeJob(report_type, period)
+            if existing:
+                return existing
+            raise RuntimeError("Failed to queue report.")
+
+        if self._executor is None:
+            self._run(job.jobID)
+            db.session.refresh(job)
+        else:
+            self._executor.submit(self._runInContext, job.jobID)
+        return job
+
+    def status(self, job_id: int) -> dict:
+        """Job state for polling pages: status, progress, reportID, error."""
+        job = db.session.get(ReportJob, job_id)
+        if not job:
+            raise ValueError("Report job not found.")
+        return {
+            "jobID": job.jobID,
+            "reportType": job.reportType,
+            "period": job.period,
+            "status": job.status,
+            "progress": job.progress,
+            "reportID": job.reportID,
+            "error": job.error,
+        }
+
+    def activeJobs(self):
+        """Queued and running jobs that are not stale, oldest first (read only)."""
+        return (
+            ReportJob.query.filter(ReportJob.status.in_(ACTIVE_JOB_STATES), ~self._stale())
+            .order_by(ReportJob.jobID)
+            .all()
+        )
+
+    def reapStale(self) -> int:
+        """Marks stale queued/running jobs failed; returns how many."""
+        reaped = db.session.execute(
+            update(ReportJob)
+            .where(ReportJob.status.in_(ACTIVE_JOB_STATES), self._stale())
+            .values(status="failed", error="Interrupted before finishing.", finishedAt=datetime.now())
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.session.commit()
+        return reaped
+
+    def _activeJob(self, report_type: str, period: str):
+        return ReportJob.query.filter(
+            ReportJob.reportType == report_type,
+            ReportJob.period == period,
+            ReportJob.status.in_(ACTIVE_JOB_STATES),
+            ~self._stale(),
+        ).first()
+
+    def _stale(self):
+        """Running since, or queued without starting since, more than stale_after ago."""
+        cutoff = datetime.now() - self.stale_after
+        return or_(
+            and_(ReportJob.status == "running", ReportJob.startedAt < cutoff),
+            and_(ReportJob.status == "queued", ReportJob.createdAt < cutoff),
+        )
+
+    def _runInContext(self, job_id: int):
+        with self.app.app_context():
+            try:
+                self._run(job_id)
+            finally:
+                db.session.remove()
+
+    def _run(self, job_id: int):
+        started = db.session.execute(
+            update(ReportJob)
+            .where(ReportJob.jobID == job_id, ReportJob.status == "queued")
+            .values(status="running", progress=10, startedAt=datetime.now())
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.session.commit()
+        if not started:  # reaped while it waited in the queue
+            current_app.logger.warning("Report job %s is no longer queued; not started", job_id)
+            return
+
+        job = db.session.get(ReportJob, job_id)
+        _, generate = REPORT_TYPES[job.reportType]
+        try:
+            report = generate(job.requestedBy, job.period, job.force)
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.exception("Report job %s failed", job_id)
+            self._finish(job_id, "failed", error=str(e))
+            return
+        self._finish(job_id, "done", report_id=report.reportID)
+
+    def _finish(self, job_id: int, status: str, report_id: int = None, error: str = None) -> bool:
+        """Records the outcome unless the job is no longer active (e.g. it was reaped as stale)."""
+        values = {"status": status, "reportID": report_id, "error": error, "finishedAt": datetime.now()}
+        if status == "done":
+            values["progress"] = 100
+        finished = db.session.execute(
+            update(ReportJob)
+            .where(ReportJob.jobID == job_id, ReportJob.status.in_(ACTIVE_JOB_STATES))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        db.session.commit()
+        if not finished:
+            current_app.logger.warning("Report job %s is no longer active; %s result dropped", job_id, status)
+        return bool(finished)
+
+
+def get_report_jobs() -> ReportJobRunner:
+    """Returns the report job runner of the current app."""
+    return current_app.extensions["report_jobs"]
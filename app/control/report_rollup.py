@@ -0,0 +1,170 @@
+"""
+Incremental daily rollups behind the report generators.
+Write controllers call the record* hooks inside their own transaction, so the
+counters commit (or roll back) together with the change they describe; the hooks
+return whether a counter moved, and the controller then bumps the report_data
+version once for the transaction (saved reports are out of date). Match
+records are counted by a before_flush hook whenever one is added or updated
+with a completedAt, whoever writes it.
+Each change updates the row of its day and the ALL_DAYS total row.
+rebuild() recomputes the whole table from requests and match_records; the
+report generators run it on their own when the table has never been built
+(ensureBuilt), and `flask rebuild-rollups` repairs drift.
+"""
+from datetime import date, datetime
+from sqlalchemy import event, func, inspect, update
+from sqlalchemy.dialects import postgresql, sqlite
+from app import db
+from app.entity.daily_rollup import ALL_DAYS, DailyRollup
+from app.entity.request import Request
+from app.entity.match_record import MatchRecord
+from app.control import data_version
+
+
+def _day(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):  # SQLite returns DATE() as text
+        return date.fromisoformat(value[:10])
+    return value or date.today()
+
+
+class ReportRollup:
+    def recordRequestCreated(self, req: Request) -> bool:
+        """Counts a new request. Call after flush so createdAt is populated."""
+        self._bump(req.createdAt, req.categoryID, req.status, requests=1)
+        return True
+
+    def recordRequestChanged(self, req: Request, old_category_id: int, old_status: str) -> bool:
+        """Moves a request between counters after its category and/or status changed."""
+        if old_category_id == req.categoryID and (old_status or "") == (req.status or ""):
+            return False
+        self._bump(req.createdAt, old_category_id, old_status, requests=-1)
+        self._bump(req.createdAt, req.categoryID, req.status, requests=1)
+        return True
+
+    def recordRequestDeleted(self, req: Request) -> bool:
+        """Removes a request (and its cascaded match records) from the counters."""
+        self._bump(req.createdAt, req.categoryID, req.status, requests=-1)
+        for m in req.match_records:
+            if m.completedAt:
+                self._bump(m.completedAt, m.categoryID, m.status, matches=-1)
+        return True
+
+    def recordMatchCompleted(self, match: MatchRecord) -> bool:
+        """Counts a match record once it has a completedAt timestamp."""
+        if not match.completedAt:
+            return False
+        self._bump(match.completedAt, match.categoryID, match.status, matches=1)
+        return True
+
+    def recordMatchChanged(self, match: MatchRecord, old_completed_at, old_category_id: int, old_status: str) -> bool:
+        """Moves a match record between counters after its completion date, category or status changed."""
+        if old_completed_at:
+            self._bump(old_completed_at, old_category_id, old_status, matches=-1)
+        return self.recordMatchCompleted(match) or bool(old_completed_at)
+
+    def ensureBuilt(self) -> bool:
+        """Rebuilds the table if it holds no totals yet but requests exist. Returns True if it did."""
+        built = db.session.query(DailyRollup.rollupID).filter(DailyRollup.day == ALL_DAYS).first()
+        if built or not db.session.query(Request.requestID).first():
+            return False
+        self.rebuild()
+        return True
+
+    def rebuild(self) -> int:
+        """Recomputes every rollup row from the source tables. Returns the number of rows written."""
+        rows = {}
+
+        request_day = func.date(Request.createdAt)
+        for day, cat_id, status, n in (
+            db.session.query(request_day, Request.categoryID, Request.status, func.count(Request.requestID))
+            .group_by(request_day, Request.categoryID, Request.status)
+        ):
+            key = (_day(day), cat_id, status or "")
+            rows.setdefault(key, [0, 0])[0] = n
+
+        match_day = func.date(MatchRecord.completedAt)
+        for day, cat_id, status, n in (
+            db.session.query(match_day, MatchRecord.categoryID, MatchRecord.status, func.count(MatchRecord.matchRecordID))
+            .filter(MatchRecord.completedAt.isnot(None))
+            .group_by(match_day, MatchRecord.categoryID, MatchRecord.status)
+        ):
+            key = (_day(day), cat_id, status or "")
+            rows.setdefault(key, [0, 0])[1] = n
+
+        for (_, cat_id, status), (r, m) in list(rows.items()):
+            totals = rows.setdefault((ALL_DAYS, cat_id, status), [0, 0])
+            totals[0] += r
+            totals[1] += m
+
+        try:
+            DailyRollup.query.delete()
+            db.session.bulk_insert_mappings(DailyRollup, [
+                {"day": d, "categoryID": c, "status": s, "requestCount": r, "matchCount": m}
+                for (d, c, s), (r, m) in rows.items()
+            ])
+            data_version.bump(data_version.REPORT_DATA)
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            raise RuntimeError(f"Failed to rebuild report rollups: {e}")
+        return len(rows)
+
+    def _bump(self, when, category_id: int, status: str, requests: int = 0, matches: int = 0):
+        """Adds to the (day, category, status) counter row and its ALL_DAYS total."""
+        for day in (_day(when), ALL_DAYS):
+            self._add(day, category_id, status, requests, matches)
+
+    def _add(self, day: date, category_id: int, status: str, requests: int, matches: int):
+        """Adds to one counter row, creating it if needed."""
+        key = {"day": day, "categoryID": category_id, "status": status or ""}
+        dialect = db.session.get_bind().dialect.name
+
+        if dialect in ("sqlite", "postgresql"):
+            insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+            stmt = insert(DailyRollup).values(**key, requestCount=requests, matchCount=matches)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["day", "categoryID", "status"],
+                set_={
+                    "requestCount": DailyRollup.requestCount + requests,
+                    "matchCount": DailyRollup.matchCount + matches,
+                },
+            )
+            db.session.execute(stmt)
+            return
+
+        # generic fallback: atomic UPDATE, then INSERT if the row did not exist yet
+        result = db.session.execute(
+            update(DailyRollup)
+            .filter_by(**key)
+            .values(requestCount=DailyRollup.requestCount + requests,
+                    matchCount=DailyRollup.matchCount + matches)
+        )
+        if result.rowcount == 0:
+            db.session.add(DailyRollup(**key, requestCount=requests, matchCount=matches))
+
+
+@event.listens_for(db.session, "before_flush")
+def _count_completed_matches(session, flush_context, instances):
+    """Keeps the match counters in step with match records added or completed through the ORM."""
+    rollup = ReportRollup()
+    changed = False
+    for match in session.new:
+        if isinstance(match, MatchRecord):
+            if match.status is None:  # the column default is only applied by the INSERT
+                match.status = MatchRecord.__table__.c.status.default.arg
+            changed = rollup.recordMatchCompleted(match) or changed
+    for match in session.dirty:
+        if not isinstance(match, MatchRecord):
+            continue
+        attrs = inspect(match).attrs
+        changed = [attrs[name].history for name in ("completedAt", "categoryID", "status")]
+        if not any(h.has_changes() for h in changed):
+            continue
+        old_completed_at, old_category_id, old_status = (
+            h.deleted[0] if h.deleted else h.unchanged[0] if h.unchanged else None for h in changed
+        )
+        changed = rollup.recordMatchChanged(match, old_completed_at, old_category_id, old_status) or changed
+    if changed:
+        data_version.bump(data_version.REPORT_DATA)
@@ -0,0 +1,210 @@
+"""
+Per-endpoint request metrics in Prometheus text format.
+Flask hooks record, per endpoint name (e.g. "boundary.csr_requests"), a latency
+histogram, request counts by status class, 5xx errors and DB time (the latter
+from QueryInstrumentation's per-request totals). Each thread aggregates into
+its own shard, so recording takes no lock; /metrics merges the shards when it
+is scraped. Shards of finished threads (the threaded dev server starts one per
+request) are folded into a base total whenever a new thread registers or
+/metrics is scraped, so only live threads keep a shard.
+Rates come from the counters (e.g. rate(http_requests_total[5m])).
+
+Config: METRICS_ENABLED (True), METRICS_LATENCY_BUCKETS (seconds),
+METRICS_TOKEN (if set, /metrics requires "Authorization: Bearer <token>"),
+HEALTH_POOL_SATURATION (0.9: readiness fails when this share of the pool's
+connections is checked out).
+"""
+import threading
+import time
+from flask import Response, abort, current_app, g, request
+from sqlalchemy import text
+from app import db
+from app.control.db_engine import pool_stats
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNMATCHED = "unmatched"  # requests that matched no route (404s)
+
+
+class _Series:
+    """One endpoint's numbers within one thread's shard."""
+    __slots__ = ("buckets", "count", "seconds", "db_seconds", "statuses", "errors")
+
+    def __init__(self, n_buckets: int):
+        self.buckets = [0] * n_buckets
+        self.count = 0
+        self.seconds = 0.0
+        self.db_seconds = 0.0
+        self.statuses = {}
+        self.errors = 0
+
+
+class RequestMetrics:
+    def __init__(self, app=None):
+        self._local = threading.local()
+        self._shards = {}  # thread -> its shard
+        self._base = {}  # merged shards of finished threads
+        self._shards_lock = threading.Lock()  # only taken when a thread creates its shard, and by scrapes
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("METRICS_ENABLED", True)
+        app.config.setdefault("METRICS_LATENCY_BUCKETS", DEFAULT_BUCKETS)
+        app.config.setdefault("METRICS_TOKEN", None)
+        app.config.setdefault("HEALTH_POOL_SATURATION", 0.9)
+        self.buckets = tuple(sorted(app.config["METRICS_LATENCY_BUCKETS"]))
+        app.extensions["request_metrics"] = self
+        if not app.config["METRICS_ENABLED"]:
+            return
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        app.add_url_rule("/metrics", "metrics", self._metrics_view)
+
+    # --- recording -----------------------------------------------------
+
+    def _shard(self) -> dict:
+        shard = getattr(self._local, "series", None)
+        if shard is None:
+            shard = self._local.series = {}
+            with self._shards_lock:
+                self._foldFinished()
+                self._shards[threading.current_thread()] = shard
+        return shard
+
+    def _foldFinished(self):
+        """Merges the shards of finished threads into the base total (call with the lock held)."""
+        for thread in [t for t in self._shards if not t.is_alive()]:
+            self._merge(self._base, self._shards.pop(thread))
+
+    def _merge(self, into: dict, shard: dict):
+        for endpoint, series in list(shard.items()):
+            total = into.get(endpoint)
+            if total is None:
+                total = into[endpoint] = _Series(len(self.buckets))
+            total.buckets = [a + b for a, b in zip(total.buckets, series.buckets)]
+            total.count += series.count
+            total.seconds += series.seconds
+            total.db_seconds += series.db_seconds
+            total.errors += series.errors
+            for status_class, n in list(series.statuses.items()):
+                total.statuses[status_class] = total.statuses.get(status_class, 0) + n
+
+    def observe(self, endpoint: str, status: int, seconds: float, db_seconds: float = 0.0):
+        shard = self._shard()
+        series = shard.get(endpoint)
+        if series is None:
+            series = shard[endpoint] = _Series(len(self.buckets))
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                series.buckets[i] += 1
+                break
+        series.count += 1
+        series.seconds += seconds
+        series.db_seconds += db_seconds
+        status_class = f"{status // 100}xx"
+        series.statuses[status_class] = series.statuses.get(status_class, 0) + 1
+        if status >= 500:
+            series.errors += 1
+
+    def _start(self):
+        g.metrics_start = time.perf_counter()
+
+    def _finish(self, response):
+        start = g.get("metrics_start")
+        if start is not None:
+            queries = g.get("sql_queries")
+            self.observe(
+                request.endpoint or UNMATCHED,
+                response.status_code,
+                time.perf_counter() - start,
+                queries.total if queries is not None else 0.0,
+            )
+        return response
+
+    # --- exposition ----------------------------------------------------
+
+    def snapshot(self) -> dict:
+        """endpoint -> merged _Series over all threads."""
+        merged = {}
+        with self._shards_lock:
+            self._foldFinished()
+            self._merge(merged, self._base)
+            shards = list(self._shards.values())
+        for shard in shards:
+            self._merge(merged, shard)
+        return merged
+
+    def render(self, database=None) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP http_requests_total Requests handled, by endpoint and status class.",
+            "# TYPE http_requests_total counter",
+        ]
+        merged = sorted(self.snapshot().items())
+        for endpoint, s in merged:
+            for status_class, n in sorted(s.statuses.items()):
+                lines.append(f'http_requests_total{{endpoint="{endpoint}",status="{status_class}"}} {n}')
+
+        lines += [
+            "# HELP http_request_errors_total Requests that ended in a 5xx response.",
+            "# TYPE http_request_errors_total counter",
+        ]
+        lines += [f'http_request_errors_total{{endpoint="{e}"}} {s.errors}' for e, s in merged]
+
+        lines += [
+            "# HELP http_request_duration_seconds Request latency.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for endpoint, s in merged:
+            cumulative = 0
+            for bound, n in zip(self.buckets, s.buckets):
+                cumulative += n
+                lines.append(f'http_request_duration_seconds_bucket{{endpoint="{endpoint}",le="{bound:g}"}} {cumulative}')
+            lines.append(f'http_request_duration_seconds_bucket{{endpoint="{endpoint}",le="+Inf"}} {s.count}')
+            lines.append(f'http_request_duration_seconds_sum{{endpoint="{endpoint}"}} {s.seconds:.6f}')
+            lines.append(f'http_request_duration_seconds_count{{endpoint="{endpoint}"}} {s.count}')
+
+        lines += [
+            "# HELP http_request_db_seconds_total Time spent in SQL statements while handling requests.",
+            "# TYPE http_request_db_seconds_total counter",
+        ]
+        lines += [f'http_request_db_seconds_total{{endpoint="{e}"}} {s.db_seconds:.6f}' for e, s in merged]
+
+        pools = pool_stats(database) if database is not None else {}
+        if pools:
+            lines += [
+                "# HELP db_pool_connections Database connection pool state, per bind.",
+                "# TYPE db_pool_connections gauge",
+            ]
+            for bind, pool in sorted(pools.items()):
+                for key in ("size", "checked_out", "overflow", "capacity"):
+                    lines.append(f'db_pool_connections{{bind="{bind}",state="{key}"}} {pool[key]}')
+        return "\n".join(lines) + "\n"
+
+    def _metrics_view(self):
+        token = current_app.config["METRICS_TOKEN"]
+        if token and request.headers.get("Authorization") != f"Bearer {token}":
+            abort(401)
+        return Response(self.render(db), mimetype="text/plain; version=0.0.4")
+
+
+def readiness() -> tuple:
+    """(ready, details): no pool is saturated and the database answers."""
+    details = {}
+    # pools first: probing a saturated pool would block for its checkout timeout
+    pools = pool_stats(db)
+    if pools:
+        details["pools"] = pools
+        limit = current_app.config.get("HEALTH_POOL_SATURATION", 0.9)
+        if any(pool["saturation"] >= limit for pool in pools.values()):
+            return False, details
+    try:
+        db.session.execute(text("SELECT 1"))
+        details["database"] = "ok"
+    except Exception as e:
+        db.session.rollback()
+        details["database"] = f"error: {e.__class__.__name__}"
+        return False, details
+    finally:
+        db.session.remove()
+    return True, details
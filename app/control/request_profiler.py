@@ -0,0 +1,187 @@
+"""
+Opt-in cProfile capture of individual requests.
+Off unless PROFILING_ENABLED is set; when off no hook is registered, so it
+costs nothing. When on, a request is profiled if
+  - it is sampled (PROFILE_SAMPLE_RATE, 0.0-1.0; default 0), or
+  - a logged-in user admin asks for it with the PROFILE_TRIGGER_HEADER header
+    (default "X-Profile: 1") or the "?_profile=1" query flag.
+Each capture is written to PROFILE_DIR (default <instance>/profiles) as a
+.pstats file (for pstats / snakeviz) and a .collapsed file of folded stacks
+(for flamegraph.pl / speedscope). The file name carries the time, duration
+and endpoint. Only the newest PROFILE_MAX_FILES captures are kept.
+/admin/profiling lists the slowest captures.
+"""
+import cProfile
+import os
+import pstats
+import random
+import re
+import time
+import uuid
+from datetime import datetime
+from typing import NamedTuple
+from flask import current_app, g, request
+
+CAPTURE_NAME = re.compile(r"^(\d{8}T\d{6})_(\d{9})ms_([\w.]+)_([0-9a-f]{6})$")
+MAX_STACK_DEPTH = 64
+
+
+class Capture(NamedTuple):
+    name: str
+    time: datetime
+    duration_ms: int
+    endpoint: str
+
+
+def collapsed_stacks(stats: pstats.Stats) -> list:
+    """
+    Folded stacks ("outer;inner;leaf <microseconds>") rebuilt from cProfile's
+    caller/callee edges. Time of a function called from several places is split
+    by each caller's share, so stacks are approximate (cProfile keeps no full stacks).
+    """
+    entries = stats.stats  # func -> (cc, nc, tt, ct, callers{caller: (cc, nc, tt, ct)})
+    children = {}
+    for func, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            children.setdefault(caller, []).append((func, edge[3]))
+    roots = [f for f, (_, _, _, _, callers) in entries.items() if not any(c in entries for c in callers)]
+
+    def label(func):
+        filename, line, name = func
+        return f"{name} ({os.path.basename(filename)}:{line})" if line else name
+
+    folded = {}
+
+    def walk(func, stack, share, seen):
+        _, _, tt, ct, _ = entries[func]
+        stack = stack + [label(func)]
+        self_us = int(tt * share * 1e6)
+        if self_us:
+            key = ";".join(stack)
+            folded[key] = folded.get(key, 0) + self_us
+        if len(stack) >= MAX_STACK_DEPTH or not ct:
+            return
+        for child, edge_ct in children.get(func, ()):
+            if child in seen or child not in entries:
+                continue  # recursion: the time is already in this frame's subtree
+            child_ct = entries[child][3]
+            child_share = share * (edge_ct / child_ct if child_ct else 0)
+            if child_share * child_ct * 1e6 >= 1:
+                walk(child, stack, child_share, seen | {child})
+
+    for root in roots:
+        walk(root, [], 1.0, {root})
+    return [f"{stack} {us}" for stack, us in sorted(folded.items())]
+
+
+class RequestProfiler:
+    def __init__(self, app=None):
+        self.enabled = False
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("PROFILING_ENABLED", False)
+        app.config.setdefault("PROFILE_SAMPLE_RATE", 0.0)
+        app.config.setdefault("PROFILE_DIR", os.path.join(app.instance_path, "profiles"))
+        app.config.setdefault("PROFILE_MAX_FILES", 50)
+        app.config.setdefault("PROFILE_TRIGGER_HEADER", "X-Profile")
+        app.extensions["request_profiler"] = self
+        self.enabled = bool(app.config["PROFILING_ENABLED"])
+        if not self.enabled:
+            return
+        self.directory = app.config["PROFILE_DIR"]
+        self.sample_rate = app.config["PROFILE_SAMPLE_RATE"]
+        self.max_files = app.config["PROFILE_MAX_FILES"]
+        self.header = app.config["PROFILE_TRIGGER_HEADER"]
+        os.makedirs(self.directory, exist_ok=True)
+        app.before_request(self._start)
+        app.after_request(self._finish)
+
+    def _requested(self) -> bool:
+        if request.headers.get(self.header) != "1" and request.args.get("_profile") != "1":
+            return False
+        from app.control.role_map import USER_ADMIN, current_role
+        return current_role() == USER_ADMIN
+
+    def _start(self):
+        if not (self.sample_rate and random.random() < self.sample_rate) and not self._requested():
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:  # another profiler is active in this thread
+            return
+        g.profile = (profile, time.perf_counter())
+
+    def _finish(self, response):
+        captured = g.pop("profile", None)
+        if captured is None:
+            return response
+        profile, start = captured
+        profile.disable()
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        try:
+            name = self._write(profile, duration_ms, request.endpoint or "unmatched")
+            response.headers["X-Profile-Capture"] = name
+        except OSError as e:
+            current_app.logger.warning("Could not write request profile: %s", e)
+        return response
+
+    def _write(self, profile: cProfile.Profile, duration_ms: int, endpoint: str) -> str:
+        name = f"{datetime.now():%Y%m%dT%H%M%S}_{min(duration_ms, 999999999):09d}ms_{endpoint}_{uuid.uuid4().hex[:6]}"
+        base = os.path.join(self.directory, name)
+        profile.dump_stats(base + ".pstats")
+        with open(base + ".collapsed", "w") as f:
+            f.write("\n".join(collapsed_stacks(pstats.Stats(profile))) + "\n")
+        self._rotate()
+        return name
+
+    def _rotate(self):
+        captures = sorted(self.captures(), key=lambda c: c.name)
+        for capture in captures[:max(len(captures) - self.max_files, 0)]:
+            for ext in (".pstats", ".collapsed"):
+                try:
+                    os.remove(os.path.join(self.directory, capture.name + ext))
+                except FileNotFoundError:
+                    pass
+
+    def captures(self) -> list:
+        """Every capture on disk (unordered)."""
+        if not self.enabled or not os.path.isdir(self.directory):
+            return []
+        result = []
+        for filename in os.listdir(self.directory):
+            stem, ext = os.path.splitext(filename)
+            match = CAPTURE_NAME.match(stem)
+            if ext == ".pstats" and match:
+                result.append(Capture(stem, datetime.strptime(match.group(1), "%Y%m%dT%H%M%S"),
+                                      int(match.group(2)), match.group(3)))
+        return result
+
+    def worst(self, limit: int = 20) -> list:
+        """The slowest captures, slowest first."""
+        return sorted(self.captures(), key=lambda c: c.duration_ms, reverse=True)[:limit]
+
+    def path(self, name: str, ext: str) -> str:
+        """File of a listed capture; ValueError for anything else."""
+        if ext not in ("pstats", "collapsed") or not CAPTURE_NAME.match(name):
+            raise ValueError("Unknown profile capture.")
+        path = os.path.join(self.directory, f"{name}.{ext}")
+        if not os.path.isfile(path):
+            raise ValueError("Unknown profile capture.")
+        return path
+
+    def summary(self, name: str, limit: int = 25) -> list:
+        """Top functions of a capture by cumulative time: [(function, calls, tottime_ms, cumtime_ms), ...]."""
+        stats = pstats.Stats(self.path(name, "pstats"))
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:limit]
+        return [
+            (f"{func[2]} ({os.path.basename(func[0])}:{func[1]})" if func[1] else func[2], nc,
+             round(tt * 1000, 2), round(ct * 1000, 2))
+            for func, (_, nc, tt, ct, _) in rows
+        ]
+
+
+def get_request_profiler() -> RequestProfiler:
+    return current_app.extensions["request_profiler"]
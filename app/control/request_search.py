@@ -0,0 +1,161 @@
+"""
+Keyword search over Request.title and Request.description.
+The backend is chosen per app (REQUEST_SEARCH_BACKEND config, default: FTS5
+on SQLite, LIKE elsewhere) and stored in app.extensions["request_search"].
+The PIN create/update/delete controllers keep the index in sync inside their
+own transaction; `flask rebuild-search-index` repopulates it from scratch.
+New backends (e.g. PostgreSQL tsvector) subclass LikeSearchBackend and are
+registered in SEARCH_BACKENDS.
+"""
+import re
+import sqlite3
+from flask import current_app
+from sqlalchemy import column, false, or_, select, table, text
+from sqlalchemy.exc import OperationalError
+from app import db
+from app.entity.request import Request
+
+
+class LikeSearchBackend:
+    """Portable fallback: substring match, newest first. Needs no index upkeep."""
+    name = "like"
+
+    def install(self, app):
+        return True
+
+    def index(self, req: Request):
+        pass
+
+    def remove(self, request_id: int):
+        pass
+
+    def rebuild(self) -> int:
+        return 0
+
+    def filter(self, query, keyword: str):
+        """Restricts `query` (over Request) to rows matching the keywords."""
+        like = f"%{keyword.strip()}%"
+        return query.filter(or_(Request.title.ilike(like), Request.description.ilike(like)))
+
+    def ranked(self, query, keyword: str):
+        """filter() plus ordering by relevance (best first)."""
+        return self.filter(query, keyword).order_by(Request.requestID.desc())
+
+
+class Fts5SearchBackend(LikeSearchBackend):
+    """SQLite FTS5 table keyed by requestID (rowid); ranked with title-weighted bm25."""
+    name = "fts5"
+    TABLE = "request_fts"
+    TITLE_WEIGHT = 5.0
+
+    _fts = table(TABLE, column("rowid"), column("rank"))
+
+    def install(self, app):
+        """Creates the FTS table if needed (filled from requests on first creation)."""
+        with app.app_context():
+            try:
+                with db.engine.begin() as conn:
+                    exists = conn.execute(
+                        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :n"), {"n": self.TABLE}
+                    ).first()
+                    if exists:
+                        return True
+                    conn.execute(text(
+                        f"CREATE VIRTUAL TABLE {self.TABLE} USING fts5("
+                        "title, description, tokenize = 'unicode61 remove_diacritics 2')"
+                    ))
+                    # title hits weigh more than description hits
+                    conn.execute(text(
+                        f"INSERT INTO {self.TABLE} ({self.TABLE}, rank) VALUES ('rank', 'bm25({self.TITLE_WEIGHT}, 1.0)')"
+                    ))
+                    conn.execute(text(
+                        f"INSERT INTO {self.TABLE} (rowid, title, description) "
+                        "SELECT requestID, title, coalesce(description, '') FROM requests"
+                    ))
+            except OperationalError as e:  # SQLite built without FTS5
+                app.logger.warning("FTS5 unavailable, using LIKE search: %s", e)
+                return False
+        return True
+
+    def index(self, req: Request):
+        self.remove(req.requestID)
+        db.session.execute(
+            text(f"INSERT INTO {self.TABLE} (rowid, title, description) VALUES (:id, :title, :description)"),
+            {"id": req.requestID, "title": req.title, "description": req.description or ""},
+        )
+
+    def remove(self, request_id: int):
+        db.session.execute(text(f"DELETE FROM {self.TABLE} WHERE rowid = :id"), {"id": request_id})
+
+    def rebuild(self) -> int:
+        try:
+            db.session.execute(text(f"DELETE FROM {self.TABLE}"))
+            count = db.session.execute(text(
+                f"INSERT INTO {self.TABLE} (rowid, title, description) "
+                "SELECT requestID, title, coalesce(description, '') FROM requests"
+            )).rowcount
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            raise RuntimeError(f"Failed to rebuild search index: {e}")
+        return count
+
+    def filter(self, query, keyword: str):
+        hits = self._matches(keyword)
+        if hits is None:
+            return query.filter(false())
+        return query.filter(Request.requestID.in_(select(hits.c.rowid)))
+
+    def ranked(self, query, keyword: str):
+        hits = self._matches(keyword)
+        if hits is None:
+            return query.filter(false())
+        return (
+            query.join(hits, Request.requestID == hits.c.rowid)
+            .order_by(hits.c.rank, Request.requestID.desc())
+        )
+
+    def _matches(self, keyword: str):
+        match_query = self._toMatchQuery(keyword)
+        if match_query is None:
+            return None
+        hits = (
+            select(self._fts.c.rowid, self._fts.c.rank)
+            .where(text(f"{self.TABLE} MATCH :fts_query").bindparams(fts_query=match_query))
+            .cte("fts_hits")
+        )
+        # Run the MATCH once. Otherwise SQLite may flatten the join and repeat the
+        # full-text match for every candidate request (seconds instead of ms).
+        if sqlite3.sqlite_version_info >= (3, 35):
+            hits = hits.prefix_with("MATERIALIZED")
+        return hits
+
+    @staticmethod
+    def _toMatchQuery(keyword: str):
+        """User text -> FTS5 query: every word must match, as a prefix ('trans' finds 'transport')."""
+        words = re.findall(r"\w+", keyword)
+        return " ".join(f'"{w}"*' for w in words) if words else None
+
+
+SEARCH_BACKENDS = {
+    "like": LikeSearchBackend,
+    "fts5": Fts5SearchBackend,
+}
+
+
+def init_search(app):
+    """Picks and installs the search backend for this app."""
+    name = app.config.get("REQUEST_SEARCH_BACKEND")
+    if not name:
+        with app.app_context():
+            name = "fts5" if db.engine.dialect.name == "sqlite" else "like"
+    backend = SEARCH_BACKENDS[name]()
+    if not backend.install(app):
+        backend = LikeSearchBackend()
+    app.extensions["request_search"] = backend
+    return backend
+
+
+def get_search_backend():
+    """Returns the request search backend of the current app."""
+    return current_app.extensions["request_search"]
@@ -0,0 +1,151 @@
+"""
+Profile -> role lookup and the role_required route decorator.
+Profile names are free text ("CSR Rep", "Person in Need", ...), so they are
+normalized once into a profileID -> role table held in app.extensions and
+built at startup; a suspended profile maps to no role. Profile write
+controllers call RoleMap.changed() before committing: it bumps the "profiles"
+row in cache_versions and drops this worker's table. Other workers compare
+their table's version with the stored one at most every
+ROLE_MAP_CHECK_INTERVAL seconds (default 5); an unknown profile ID also
+triggers one refresh.
+The session keeps the role together with the profile ID and table version it
+was resolved from, so role_required is normally a dict lookup with no database
+access. It is resolved again when the user's profile changes (the current_user
+snapshot is reloaded once the profile write commits) or when the table moves.
+"""
+import re
+import threading
+import time
+from functools import wraps
+from flask import abort, current_app, session
+from flask_login import current_user
+from app import db
+from app.entity.user_profile import UserProfile
+from app.control import data_version
+
+USER_ADMIN = "useradmin"
+CSR = "csr"
+PIN = "pin"
+PLATFORM_MANAGER = "platform"
+
+# normalized profile name -> role
+ROLE_ALIASES = {
+    "useradmin": USER_ADMIN,
+    "csrrep": CSR,
+    "csr": CSR,
+    "csrrepresentative": CSR,
+    "pin": PIN,
+    "personinneed": PIN,
+    "platformmanager": PLATFORM_MANAGER,
+    "platform": PLATFORM_MANAGER,
+}
+
+ROLE_HOME = {
+    USER_ADMIN: "/admin/dashboard",
+    CSR: "/csr/dashboard",
+    PIN: "/pin/dashboard",
+    PLATFORM_MANAGER: "/pm/dashboard",
+}
+
+SESSION_KEY = "role"
+SESSION_PROFILE_KEY = "role_profile"  # profileID the session's role was resolved from
+SESSION_VERSION_KEY = "role_version"  # RoleMap version it was resolved at
+
+
+def role_for_name(profile_name: str):
+    """'CSR Rep' / 'person-in-need' / ... -> role, or None for profiles without one."""
+    return ROLE_ALIASES.get(re.sub(r"[\s_-]+", "", (profile_name or "").lower()))
+
+
+class RoleMap:
+    def __init__(self, check_interval: float = 5.0):
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._roles = {}
+        self._version = None
+        self._checked_at = 0.0
+
+    def refresh(self):
+        """Rebuilds the table from user_profiles."""
+        version = data_version.current(data_version.PROFILES)[0]
+        rows = db.session.query(UserProfile.profileID, UserProfile.profileName, UserProfile.isActive).all()
+        roles = {profile_id: role_for_name(name) if active else None for profile_id, name, active in rows}
+        with self._lock:
+            self._roles, self._version, self._checked_at = roles, version, time.monotonic()
+
+    def version(self) -> int:
+        """Version of the table, after reloading it if the stored one moved (checked at most every check_interval)."""
+        now = time.monotonic()
+        with self._lock:
+            version, checked_at = self._version, self._checked_at
+        if version is not None and now - checked_at < self.check_interval:
+            return version
+        if version is None or data_version.current(data_version.PROFILES)[0] != version:
+            self.refresh()
+        else:
+            with self._lock:
+                self._checked_at = now
+        return self._version
+
+    def roleFor(self, profile_id: int):
+        self.version()
+        if profile_id not in self._roles:
+            self.refresh()
+        return self._roles.get(profile_id)
+
+    def invalidate(self):
+        """Forgets this worker's table; the next lookup reloads it."""
+        with self._lock:
+            self._version = None
+
+    @staticmethod
+    def changed():
+        """Call inside a user profile write transaction, before commit."""
+        data_version.bump(data_version.PROFILES)
+        get_role_map().invalidate()
+
+
+def init_roles(app):
+    """Builds the role table for this app."""
+    role_map = RoleMap(app.config.get("ROLE_MAP_CHECK_INTERVAL", 5.0))
+    with app.app_context():
+        role_map.refresh()
+    app.extensions["role_map"] = role_map
+    return role_map
+
+
+def get_role_map() -> RoleMap:
+    return current_app.extensions["role_map"]
+
+
+def remember_role(profile_id: int):
+    """Resolves the role of `profile_id` and stores it in the session."""
+    role_map = get_role_map()
+    role = role_map.roleFor(profile_id)
+    session[SESSION_KEY] = role
+    session[SESSION_PROFILE_KEY] = profile_id
+    session[SESSION_VERSION_KEY] = role_map.version()
+    return role
+
+
+def current_role():
+    """Role of the logged-in user, from the session unless their profile or the role table changed."""
+    if not current_user.is_authenticated:
+        return None
+    if (SESSION_KEY not in session
+            or session.get(SESSION_PROFILE_KEY) != current_user.profileID
+            or session.get(SESSION_VERSION_KEY) != get_role_map().version()):
+        return remember_role(current_user.profileID)
+    return session[SESSION_KEY]
+
+
+def role_required(*roles):
+    """Route decorator: 403 unless the user's role is one of `roles`. Place under @login_required."""
+    def decorator(view):
+        @wraps(view)
+        def wrapped(*args, **kwargs):
+            if current_role() not in roles:
+                abort(403)
+            return view(*args, **kwargs)
+        return wrapped
+    return decorator
@@ -0,0 +1,135 @@
+"""
+Per-worker cache behind the Flask-Login user loader.
+The account and its profile are read with one joined query and kept as a
+compact SessionUser snapshot (column values only, no session attached) for
+SESSION_USER_CACHE_TTL seconds (default 10; 0 disables caching).
+Every snapshot carries the "users" and "profiles" cache_versions counters it
+was loaded under. User account write controllers call SessionUserCache.changed()
+before committing (profile writes already bump "profiles" through RoleMap), and
+a hit is only served while both counters are unchanged. They are re-read at most
+every SESSION_USER_CACHE_CHECK_INTERVAL seconds (default 0: on every hit, one
+primary-key lookup instead of the joined load), so suspension takes effect at
+once in every worker. A load that overlaps an invalidation in this worker is
+returned but not stored. Suspended accounts are not loaded (the session ends).
+"""
+import threading
+import time
+from typing import NamedTuple, Optional
+from flask import current_app
+from flask_login import UserMixin
+from sqlalchemy.orm import joinedload
+from app.entity.user_account import UserAccount
+from app.control import data_version
+
+
+class ProfileSnapshot(NamedTuple):
+    profileID: int
+    profileName: str
+    description: Optional[str]
+    isActive: bool
+
+
+class SessionUser(UserMixin):
+    """Read-only stand-in for UserAccount as current_user (the fields templates and routes use)."""
+    __slots__ = ("userID", "name", "email", "age", "phoneNumber", "isActive", "profileID", "profile")
+
+    def __init__(self, account: UserAccount):
+        self.userID = account.userID
+        self.name = account.name
+        self.email = account.email
+        self.age = account.age
+        self.phoneNumber = account.phoneNumber
+        self.isActive = account.isActive
+        self.profileID = account.profileID
+        p = account.profile
+        self.profile = ProfileSnapshot(p.profileID, p.profileName, p.description, p.isActive) if p else None
+
+    def get_id(self):
+        return str(self.userID)
+
+
+class SessionUserCache:
+    def __init__(self, ttl: float = 10.0, check_interval: float = 0.0):
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._version = None
+        self._checked_at = 0.0
+        self._generation = 0  # moved by every invalidation in this worker
+
+    def get(self, user_id: int) -> Optional[SessionUser]:
+        """Snapshot of an active account, or None if it does not exist or is suspended."""
+        if self.ttl <= 0:
+            return self._load(user_id)
+
+        now = time.monotonic()
+        version = self.version(now)
+        with self._lock:
+            entry = self._entries.get(user_id)
+            generation = self._generation
+        if entry and entry[0] > now and entry[1] == version:
+            return entry[2]
+
+        user = self._load(user_id)
+        with self._lock:
+            if self._generation == generation:
+                self._entries[user_id] = (now + self.ttl, version, user)
+        return user
+
+    def version(self, now: float = None) -> tuple:
+        """Stored ("users", "profiles") counters (re-read at most every check_interval)."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            version, checked_at = self._version, self._checked_at
+        if version is not None and now - checked_at < self.check_interval:
+            return version
+        version = data_version.current(data_version.USERS, data_version.PROFILES)
+        with self._lock:
+            self._version, self._checked_at = version, now
+        return version
+
+    def invalidate(self, user_id: int = None):
+        """Drops one user's snapshot (all snapshots when no id is given)."""
+        with self._lock:
+            self._generation += 1
+            self._version = None
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+    def invalidateProfile(self, profile_id: int):
+        """Drops the snapshots of every cached user holding this profile."""
+        with self._lock:
+            self._generation += 1
+            self._version = None
+            for user_id, (_, _, user) in list(self._entries.items()):
+                if user is not None and user.profileID == profile_id:
+                    del self._entries[user_id]
+
+    @staticmethod
+    def changed():
+        """Call inside a user account write transaction, before commit."""
+        data_version.bump(data_version.USERS)
+
+    def _load(self, user_id: int) -> Optional[SessionUser]:
+        account = (
+            UserAccount.query.options(joinedload(UserAccount.profile))
+            .filter_by(userID=user_id)
+            .first()
+        )
+        return SessionUser(account) if account and account.isActive else None
+
+
+def get_session_user_cache() -> SessionUserCache:
+    """Returns the cache of the current app (created on first use)."""
+    cache = current_app.extensions.get("session_user_cache")
+    if cache is None:
+        cache = current_app.extensions.setdefault(
+            "session_user_cache", SessionUserCache(
+                current_app.config.get("SESSION_USER_CACHE_TTL", 10.0),
+                current_app.config.get("SESSION_USER_CACHE_CHECK_INTERVAL", 0.0),
+            )
+        )
+    return cache
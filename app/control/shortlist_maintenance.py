@@ -0,0 +1,45 @@
+"""
+Repairs shortlist data that the request paths rely on:
+duplicate (csrRepID, requestID) rows left from before the unique index existed,
+and Request.shortlistCount values that drifted from the real shortlist rows.
+Run with `flask reconcile-shortlists`; it is safe to run at any time.
+"""
+from sqlalchemy import delete, func, select, update
+from app import db
+from app.entity.request import Request
+from app.entity.shortlist import Shortlist
+
+
+class ShortlistMaintenance:
+    def reconcile(self) -> dict:
+        """Removes duplicates, ensures the unique index exists and fixes drifted counters."""
+        try:
+            keep = select(func.min(Shortlist.shortlistID)).group_by(Shortlist.csrRepID, Shortlist.requestID)
+            duplicates = db.session.execute(
+                delete(Shortlist)
+                .where(Shortlist.shortlistID.not_in(keep))
+                .execution_options(synchronize_session=False)
+            ).rowcount
+
+            # existing databases were created without the index; create_all() does not add it
+            for index in Shortlist.__table__.indexes:
+                index.create(bind=db.session.connection(), checkfirst=True)
+
+            actual = (
+                select(func.count(Shortlist.shortlistID))
+                .where(Shortlist.requestID == Request.requestID)
+                .scalar_subquery()
+            )
+            fixed = db.session.execute(
+                update(Request)
+                .where(func.coalesce(Request.shortlistCount, -1) != actual)
+                .values(shortlistCount=actual)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            raise RuntimeError(f"Failed to reconcile shortlists: {e}")
+
+        return {"duplicates_removed": duplicates, "counters_fixed": fixed}
@@ -4,6 +4,8 @@ As a user admin, I want to activate suspended user account so that users can reg
 """
 from app import db
 from app.entity.user_account import UserAccount
+from app.control.session_user_cache import SessionUserCache, get_session_user_cache
+from app.control import dashboard_stats
 
 class UserAdminActivateUserAccountController:
     def activateUserAccount(self, userID: int) -> bool:
@@ -14,7 +16,10 @@ class UserAdminActivateUserAccountController:
 
         user.isActive = True
         try:
+            SessionUserCache.changed()
             db.session.commit()
+            get_session_user_cache().invalidate(userID)
+            dashboard_stats.invalidate(dashboard_stats.USER_TOTALS)
             return True
         except Exception as e:
             db.session.rollback()
@@ -4,6 +4,8 @@ As a user admin, I want to activate suspended user profiles so that valid user p
 """
 from app import db
 from app.entity.user_profile import UserProfile
+from app.control.role_map import RoleMap
+from app.control.session_user_cache import get_session_user_cache
 
 class UserAdminActivateUserProfileController:
     def activateUserProfile(self, profile_id: int):
@@ -12,7 +14,9 @@ class UserAdminActivateUserProfileController:
             raise ValueError("Profile not found.")
         # Match the template's field name
         p.isActive = True
+        RoleMap.changed()
         db.session.commit()
+        get_session_user_cache().invalidateProfile(profile_id)
         return True
 
 
@@ -5,6 +5,7 @@ As a user admin, I want to create user account so that new users can access the
 from app import db
 from app.entity.user_account import UserAccount
 from app.entity.user_profile import UserProfile
+from app.control import dashboard_stats, data_version
 
 
 class UserAdminCreateUserAccountController:
@@ -34,7 +35,9 @@ class UserAdminCreateUserAccountController:
             user.password = password
 
             db.session.add(user)
+            data_version.bump(data_version.REPORT_DATA)  # reports count users
             db.session.commit()
+            dashboard_stats.invalidate(dashboard_stats.USER_TOTALS)
             return True
         except Exception as e:
             db.session.rollback()
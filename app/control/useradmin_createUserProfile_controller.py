@@ -4,8 +4,14 @@ As a user admin, I want to create user profiles so that users can have the right
 """
 from app import db
 from app.entity.user_profile import UserProfile
+from app.control.role_map import RoleMap
+from app.control import dashboard_stats
 
 class UserAdminCreateUserProfileController:
     def createUserProfile(self, profile_name:str, description:str=None):
         p = UserProfile(profileName=profile_name, description=description, isActive=True)
-        db.session.add(p); db.session.commit(); return p
+        db.session.add(p)
+        RoleMap.changed()
+        db.session.commit()
+        dashboard_stats.invalidate(dashboard_stats.USER_TOTALS)
+        return p
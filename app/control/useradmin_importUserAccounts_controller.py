@@ -0,0 +1,193 @@
+"""
+User Story:
+As a user admin, I want to import many user accounts from a file so that a partner
+organisation can be onboarded at once.
+
+Pipeline: parse rows (CSV or JSON Lines) -> validate every row in memory (profiles
+and existing emails are each loaded with one query) -> hash the passwords of valid
+rows across a process pool -> insert in executemany batches.
+The pool's workers are spawned rather than forked: the web process runs other
+threads (view-count flusher, report jobs) whose locks a fork could copy while held.
+Emails are lowercased before validation, so "Foo@x.com" and "foo@x.com" are the
+same address in the existing/duplicate checks. A row that fails validation is
+reported and skipped; the rest are imported. If a batch insert hits a constraint
+(e.g. an email created concurrently), that batch is retried row by row so only
+the offending rows are reported; any other database error rolls the import back
+and propagates.
+"""
+import csv
+import io
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from sqlalchemy import func, insert
+from sqlalchemy.exc import IntegrityError
+from functools import partial
+from werkzeug.security import generate_password_hash
+from app import db
+from app.entity.user_account import UserAccount
+from app.entity.user_profile import UserProfile
+from app.control import dashboard_stats, data_version
+from app.control.password_policy import get_password_policy
+
+FIELDS = ("name", "email", "password", "age", "phoneNumber", "profileID")
+FORMATS = ("csv", "jsonl")
+
+# keeps the email lookup below SQLite's bound-parameter limit
+EMAIL_LOOKUP_CHUNK = 10000
+
+
+def _hash(password: str, method: str) -> str:
+    # module-level so the process pool can pickle it
+    return generate_password_hash(password, method=method)
+
+
+def format_for_filename(filename: str) -> str:
+    """'users.csv' -> 'csv', 'users.jsonl' / '.ndjson' -> 'jsonl' (ValueError otherwise)."""
+    ext = os.path.splitext(filename or "")[1].lower()
+    if ext == ".csv":
+        return "csv"
+    if ext in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError("Upload a .csv or .jsonl file.")
+
+
+class UserAdminImportUserAccountsController:
+    def __init__(self, hash_workers: int = None, batch_size: int = 1000):
+        # hash_workers: processes for password hashing (None = CPU count, 0 = hash in this process)
+        self.hash_workers = os.cpu_count() if hash_workers is None else hash_workers
+        self.batch_size = batch_size
+
+    def parseFile(self, stream, fmt: str) -> list:
+        """Reads an uploaded/opened file (bytes or text) into a list of row dicts."""
+        if fmt not in FORMATS:
+            raise ValueError("Unsupported import format.")
+        text = io.TextIOWrapper(stream, encoding="utf-8-sig") if not isinstance(stream, io.TextIOBase) else stream
+        if fmt == "csv":
+            return list(csv.DictReader(text))
+        rows = []
+        for line_no, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                rows.append(json.loads(line))
+            except json.JSONDecodeError:
+                rows.append({"_error": f"Line {line_no} is not valid JSON."})
+        return rows
+
+    def importUserAccounts(self, rows: list) -> dict:
+        """
+        Creates accounts for the valid rows.
+        Returns {"created": int, "errors": [{"row": n, "email": str, "error": str}, ...]}
+        where n is the 1-based data row number.
+        """
+        errors = []
+        valid = self._validate(rows, errors)
+
+        hashes = self._hashAll([r["password"] for _, r in valid])
+        records = []
+        for (row_no, r), hashed in zip(valid, hashes):
+            records.append((row_no, {
+                "name": r["name"], "email": r["email"], "password": hashed, "age": r["age"],
+                "phoneNumber": r["phoneNumber"], "profileID": r["profileID"], "isActive": True,
+            }))
+
+        created = 0
+        try:
+            for start in range(0, len(records), self.batch_size):
+                created += self._insertBatch(records[start:start + self.batch_size], errors)
+        except Exception:
+            db.session.rollback()
+            raise
+
+        if created:
+            data_version.bump(data_version.REPORT_DATA)
+            db.session.commit()
+            dashboard_stats.invalidate(dashboard_stats.USER_TOTALS)
+
+        errors.sort(key=lambda e: e["row"])
+        return {"created": created, "errors": errors}
+
+    def _validate(self, rows, errors) -> list:
+        profiles = {
+            str(pid): pid
+            for pid, in db.session.query(UserProfile.profileID).filter(UserProfile.isActive.is_(True))
+        }
+        candidates = []
+        for row_no, raw in enumerate(rows, start=1):
+            try:
+                candidates.append((row_no, self._clean(raw, profiles)))
+            except ValueError as e:
+                errors.append({"row": row_no, "email": (raw or {}).get("email"), "error": str(e)})
+
+        # existing emails: one query (per EMAIL_LOOKUP_CHUNK addresses)
+        emails = list({r["email"] for _, r in candidates})
+        taken = set()
+        for start in range(0, len(emails), EMAIL_LOOKUP_CHUNK):
+            chunk = emails[start:start + EMAIL_LOOKUP_CHUNK]
+            taken.update(
+                e for e, in db.session.query(func.lower(UserAccount.email))
+                .filter(func.lower(UserAccount.email).in_(chunk))
+            )
+
+        valid, seen = [], set()
+        for row_no, r in candidates:
+            if r["email"] in taken:
+                errors.append({"row": row_no, "email": r["email"], "error": f"Email '{r['email']}' already exists."})
+            elif r["email"] in seen:
+                errors.append({"row": row_no, "email": r["email"], "error": "Duplicate email in this file."})
+            else:
+                seen.add(r["email"])
+                valid.append((row_no, r))
+        return valid
+
+    @staticmethod
+    def _clean(raw, profiles) -> dict:
+        if not isinstance(raw, dict):
+            raise ValueError("Row is not an object.")
+        if raw.get("_error"):
+            raise ValueError(raw["_error"])
+        r = {f: (str(raw.get(f)).strip() if raw.get(f) not in (None, "") else None) for f in FIELDS}
+        if not (r["name"] and r["email"] and r["password"]):
+            raise ValueError("Name, email and password are required.")
+        r["email"] = r["email"].lower()
+        if "@" not in r["email"]:
+            raise ValueError(f"Invalid email '{r['email']}'.")
+        if r["profileID"] not in profiles:
+            raise ValueError(f"Profile ID '{r['profileID']}' not found or inactive.")
+        r["profileID"] = profiles[r["profileID"]]
+        if r["age"] is not None:
+            try:
+                r["age"] = int(r["age"])
+            except ValueError:
+                raise ValueError(f"Invalid age '{r['age']}'.")
+        return r
+
+    def _hashAll(self, passwords: list) -> list:
+        hash_one = partial(_hash, method=get_password_policy().method)
+        if self.hash_workers <= 1 or len(passwords) < 2:
+            return [hash_one(p) for p in passwords]
+        chunksize = max(1, len(passwords) // (self.hash_workers * 4))
+        with ProcessPoolExecutor(max_workers=self.hash_workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            return list(pool.map(hash_one, passwords, chunksize=chunksize))
+
+    def _insertBatch(self, batch, errors) -> int:
+        table = UserAccount.__table__
+        try:
+            with db.session.begin_nested():
+                db.session.execute(insert(table), [values for _, values in batch])
+            return len(batch)
+        except IntegrityError:
+            pass
+
+        # something in this batch conflicts: insert row by row to isolate it
+        created = 0
+        for row_no, values in batch:
+            try:
+                with db.session.begin_nested():
+                    db.session.execute(insert(table), [values])
+                created += 1
+            except IntegrityError as e:
+                errors.append({"row": row_no, "email": values["email"], "error": f"Insert failed: {e.orig}"})
+        return created
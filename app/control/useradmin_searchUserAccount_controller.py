@@ -2,15 +2,39 @@
 User Story:
 As a user admin, I want to search user account by name so that I can find the user quickly.
 """
+from app import db
 from app.entity.user_account import UserAccount
+from app.entity.user_profile import UserProfile
+from app.control.pagination import paginate
+from app.control.loading_profiles import USER_ROW
+from app.control.export import Export, stream_query
 
 class UserAdminSearchUserAccountController:
-    def searchUserAccountByName(self, userName: str):
-        """Searches for user accounts by name (case-insensitive). Returns a list."""
+    def searchUserAccountByName(self, userName: str, page: int = 1, per_page: int = 10):
+        """Searches for user accounts by name (case-insensitive). Returns a page of results."""
         like_pattern = f"%{userName.strip()}%" if userName else "%"
-        return (
+        q = (
             UserAccount.query
             .filter(UserAccount.name.ilike(like_pattern))
+            .options(*USER_ROW)
             .order_by(UserAccount.userID)
-            .all()
+        )
+        return paginate(q, page, per_page)
+
+    def exportUserAccounts(self, userName: str = None):
+        """Every matching account (with its profile name) as a streamed Export."""
+        like_pattern = f"%{userName.strip()}%" if userName else "%"
+        q = (
+            db.session.query(
+                UserAccount.userID, UserAccount.name, UserAccount.email, UserAccount.age,
+                UserAccount.phoneNumber, UserProfile.profileName, UserAccount.isActive,
+            )
+            .outerjoin(UserProfile, UserAccount.profileID == UserProfile.profileID)
+            .filter(UserAccount.name.ilike(like_pattern))
+            .order_by(UserAccount.userID)
+        )
+        return Export(
+            "user_accounts",
+            ("userID", "name", "email", "age", "phoneNumber", "profile", "isActive"),
+            stream_query(q),
         )
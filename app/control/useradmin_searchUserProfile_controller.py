@@ -4,15 +4,18 @@ As a user admin, I want to search for users by user profile so that I can easily
 """
 from app.entity.user_account import UserAccount
 from app.entity.user_profile import UserProfile
+from app.control.pagination import paginate
+from app.control.loading_profiles import USER_ROW
 
 class UserAdminSearchUserProfileController:
-    def searchUserByProfile(self, profileID: int):
-        """Search users belonging to a specific profile ID. Returns list of UserAccount."""
+    def searchUserByProfile(self, profileID: int, page: int = 1, per_page: int = 10):
+        """Search users belonging to a specific profile ID. Returns a page of UserAccount."""
         if not profileID:
-            return []
+            raise ValueError("Profile ID is required.")
         
         profile = UserProfile.query.get(profileID)
         if not profile:
             raise ValueError(f"Profile ID '{profileID}' not found.")
         
-        return UserAccount.query.filter_by(profileID=profileID).order_by(UserAccount.userID).all()
+        q = UserAccount.query.filter_by(profileID=profileID).options(*USER_ROW).order_by(UserAccount.userID)
+        return paginate(q, page, per_page)
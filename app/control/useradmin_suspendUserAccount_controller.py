@@ -4,6 +4,8 @@ As a user admin, I want to suspend user account so that I can maintain user acce
 """
 from app import db
 from app.entity.user_account import UserAccount
+from app.control.session_user_cache import SessionUserCache, get_session_user_cache
+from app.control import dashboard_stats
 
 class UserAdminSuspendUserAccountController:
     def suspendUserAccount(self, userID: int) -> bool:
@@ -14,7 +16,10 @@ class UserAdminSuspendUserAccountController:
 
         user.isActive = False
         try:
+            SessionUserCache.changed()
             db.session.commit()
+            get_session_user_cache().invalidate(userID)
+            dashboard_stats.invalidate(dashboard_stats.USER_TOTALS)
             return True
         except Exception as e:
             db.session.rollback()
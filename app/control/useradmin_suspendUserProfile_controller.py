@@ -4,6 +4,8 @@ As a user admin, I want to suspend user profiles so that invalid user profiles a
 """
 from app import db
 from app.entity.user_profile import UserProfile
+from app.control.role_map import RoleMap
+from app.control.session_user_cache import get_session_user_cache
 
 class UserAdminSuspendUserProfileController:
     def suspendUserProfile(self, profile_id: int):
@@ -12,7 +14,9 @@ class UserAdminSuspendUserProfileController:
             raise ValueError("Profile not found.")
         # Match the template's field name
         p.isActive = False
+        RoleMap.changed()
         db.session.commit()
+        get_session_user_cache().invalidateProfile(profile_id)
         return True
 
     # Keep this alias ONLY if some code elsewhere calls snake_case:
@@ -4,6 +4,7 @@ As a user admin, I want to update user account so that I can ensure information
 """
 from app import db
 from app.entity.user_account import UserAccount
+from app.control.session_user_cache import SessionUserCache, get_session_user_cache
 from app.entity.user_profile import UserProfile
 
 class UserAdminUpdateUserAccountController:
@@ -37,7 +38,9 @@ class UserAdminUpdateUserAccountController:
             user.password = password
 
         try:
+            SessionUserCache.changed()
             db.session.commit()
+            get_session_user_cache().invalidate(userID)
             return True
         except Exception as e:
             db.session.rollback()
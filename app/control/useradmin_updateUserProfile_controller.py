@@ -4,6 +4,8 @@ As a user admin, I want to update user profile so that I can ensure information
 """
 from app import db
 from app.entity.user_profile import UserProfile
+from app.control.role_map import RoleMap
+from app.control.session_user_cache import get_session_user_cache
 from app.control.useradmin_activateUserProfile_controller import UserAdminActivateUserProfileController
 from app.control.useradmin_suspendUserProfile_controller import UserAdminSuspendUserProfileController
 
@@ -28,7 +30,9 @@ class UserAdminUpdateUserProfileController:
             p.description = description  # allow empty string
 
         try:
+            RoleMap.changed()
             db.session.commit()
+            get_session_user_cache().invalidateProfile(profileID)
             return True
         except Exception as e:
             db.session.rollback()
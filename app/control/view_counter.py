@@ -0,0 +1,114 @@
+"""
+Write-behind view counter for service requests.
+Views are counted in memory (thread-safe) and written out in batches as atomic
+`UPDATE requests SET viewCount = viewCount + n`, so a page view no longer costs
+a read-modify-write transaction. Pending counts are flushed every
+VIEW_COUNT_FLUSH_INTERVAL seconds, once VIEW_COUNT_FLUSH_THRESHOLD views are
+buffered, and at interpreter exit.
+"""
+import atexit
+import threading
+import time
+from collections import defaultdict
+from flask import current_app
+from sqlalchemy import bindparam, func, update
+from app import db
+from app.entity.request import Request
+
+
+class ViewCounter:
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        self._pending = defaultdict(int)
+        self._pending_total = 0
+        self._flusher = None
+        self.app = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("VIEW_COUNT_FLUSH_INTERVAL", 5.0)
+        app.config.setdefault("VIEW_COUNT_FLUSH_THRESHOLD", 500)
+        self.app = app
+        self.interval = app.config["VIEW_COUNT_FLUSH_INTERVAL"]
+        self.threshold = app.config["VIEW_COUNT_FLUSH_THRESHOLD"]
+        app.extensions["view_counter"] = self
+        atexit.register(self._flush_at_exit)
+
+    def increment(self, request_id: int, n: int = 1):
+        """Buffers `n` views for a request; flushes inline once the threshold is reached."""
+        with self._lock:
+            self._pending[request_id] += n
+            self._pending_total += n
+            due = self._pending_total >= self.threshold
+        if due:
+            try:
+                self._flush_in_context()
+            except Exception as e:
+                # the views stay buffered; a failed flush must not fail the page view
+                self.app.logger.warning("View counter flush failed: %s", e)
+        elif self._flusher is None and self.interval > 0:
+            self._start_flusher()
+
+    def pending(self, request_id: int) -> int:
+        """Views counted in this process but not yet written to the database."""
+        with self._lock:
+            return self._pending.get(request_id, 0)
+
+    def flush(self) -> int:
+        """Writes all buffered views in one batched UPDATE. Returns the number of rows touched."""
+        with self._lock:
+            batch, self._pending = self._pending, defaultdict(int)
+            self._pending_total = 0
+        if not batch:
+            return 0
+
+        stmt = (
+            update(Request.__table__)
+            .where(Request.__table__.c.requestID == bindparam("rid"))
+            .values(viewCount=func.coalesce(Request.__table__.c.viewCount, 0) + bindparam("n"))
+        )
+        try:
+            # own connection, so flushing never commits the caller's session
+            with db.engine.begin() as conn:
+                conn.execute(stmt, [{"rid": rid, "n": n} for rid, n in batch.items()])
+        except Exception:
+            # keep the views for the next attempt instead of dropping them
+            with self._lock:
+                for rid, n in batch.items():
+                    self._pending[rid] += n
+                    self._pending_total += n
+            raise
+        return len(batch)
+
+    def _start_flusher(self):
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(target=self._run, name="view-counter-flush", daemon=True)
+        self._flusher.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self._flush_in_context()
+            except Exception as e:
+                self.app.logger.warning("View counter flush failed: %s", e)
+
+    def _flush_in_context(self):
+        with self.app.app_context():
+            self.flush()
+
+    def _flush_at_exit(self):
+        if not self._pending:
+            return
+        try:
+            self._flush_in_context()
+        except Exception as e:
+            self.app.logger.warning("View counter flush at exit failed: %s", e)
+
+
+def get_view_counter() -> ViewCounter:
+    """Returns the view counter bound to the current app."""
+    return current_app.extensions["view_counter"]
@@ -0,0 +1,13 @@
+# app/entity/cache_version.py
+from app import db
+
+class CacheVersion(db.Model):
+    """
+    Change counter for data that workers cache in memory (e.g. "categories").
+    Writers bump `version` in the same transaction as their change; each worker
+    reloads its copy when the stored version differs from the one it cached.
+    """
+    __tablename__ = "cache_versions"
+
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
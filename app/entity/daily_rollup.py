@@ -0,0 +1,25 @@
+# app/entity/daily_rollup.py
+from datetime import date
+from app import db
+
+ALL_DAYS = date(1, 1, 1)  # sentinel day of the all-time total rows
+
+class DailyRollup(db.Model):
+    """
+    Per-day report counters for one category and status.
+    requestCount: requests created that day that are currently in `status`.
+    matchCount:   match records completed that day with match status `status`.
+    Rows with day == ALL_DAYS hold the same counters summed over every day, so
+    all-time totals read one row per (category, status).
+    """
+    __tablename__ = "daily_rollups"
+    __table_args__ = (
+        db.UniqueConstraint("day", "categoryID", "status", name="uq_daily_rollup_key"),
+    )
+
+    rollupID = db.Column(db.Integer, primary_key=True)
+    day = db.Column(db.Date, nullable=False)
+    categoryID = db.Column(db.Integer, db.ForeignKey("categories.categoryID"), nullable=False)
+    status = db.Column(db.String(30), nullable=False)
+    requestCount = db.Column(db.Integer, nullable=False, default=0)
+    matchCount = db.Column(db.Integer, nullable=False, default=0)
@@ -0,0 +1,18 @@
+# app/entity/login_attempt.py
+from app import db
+
+
+class LoginAttempt(db.Model):
+    """
+    A failed login, keyed by "email:<address>" or "ip:<address>".
+    Used by the "database" store of the login rate limiter so every worker
+    sees the same counts; rows older than the limiter window are pruned.
+    """
+    __tablename__ = "login_attempts"
+    __table_args__ = (
+        db.Index("ix_login_attempts_key_time", "key", "attemptedAt"),
+    )
+
+    attemptID = db.Column(db.Integer, primary_key=True)
+    key = db.Column(db.String(200), nullable=False)
+    attemptedAt = db.Column(db.Float, nullable=False)  # unix time, comparable across workers
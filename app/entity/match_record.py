@@ -3,6 +3,15 @@ from app import db
 
 class MatchRecord(db.Model):
     __tablename__ = "match_records"
+    __table_args__ = (
+        # CSR history: completed matches by date
+        db.Index("ix_match_records_csr_status_completed", "csrRepID", "status", "completedAt"),
+        # PIN match records and dashboard counts
+        db.Index("ix_match_records_pin_status", "pinID", "status"),
+        db.Index("ix_match_records_request", "requestID"),
+        # report windows and rollup rebuilds
+        db.Index("ix_match_records_completed", "completedAt"),
+    )
 
     matchRecordID = db.Column(db.Integer, primary_key=True)
     requestID = db.Column(db.Integer, db.ForeignKey("requests.requestID", ondelete="CASCADE"), nullable=False)
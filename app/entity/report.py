@@ -2,6 +2,10 @@ from app import db
 
 class Report(db.Model):
     __tablename__ = "reports"
+    __table_args__ = (
+        # stored-report lookup by the generators (latest per type and period)
+        db.Index("ix_reports_type_period", "reportType", "period", "reportID"),
+    )
     reportID    = db.Column(db.Integer, primary_key=True)
     reportTitle = db.Column(db.String(255), nullable=False)
     reportType  = db.Column(db.String(50), nullable=False)
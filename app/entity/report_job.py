@@ -0,0 +1,37 @@
+# app/entity/report_job.py
+from app import db
+
+ACTIVE_JOB_STATES = ("queued", "running")
+
+
+class ReportJob(db.Model):
+    """
+    One report generation run, executed in the background by ReportJobRunner.
+    status: queued -> running -> done | failed; progress is 0-100.
+    At most one queued/running job exists per (reportType, period).
+    """
+    __tablename__ = "report_jobs"
+    __table_args__ = (
+        db.Index(
+            "uq_report_jobs_active", "reportType", "period", unique=True,
+            sqlite_where=db.text("status IN ('queued', 'running')"),
+            postgresql_where=db.text("status IN ('queued', 'running')"),
+        ),
+    )
+
+    jobID = db.Column(db.Integer, primary_key=True)
+    reportType = db.Column(db.String(50), nullable=False)
+    period = db.Column(db.String(50), nullable=False)
+    requestedBy = db.Column(db.Integer, db.ForeignKey("user_accounts.userID"), nullable=False)
+    force = db.Column(db.Boolean, nullable=False, default=False)  # recompute even if a stored report is current
+    status = db.Column(db.String(20), nullable=False, default="queued")
+    progress = db.Column(db.Integer, nullable=False, default=0)
+    reportID = db.Column(db.Integer, db.ForeignKey("reports.reportID"))
+    error = db.Column(db.Text)
+    createdAt = db.Column(db.DateTime, default=db.func.now(), nullable=False)
+    startedAt = db.Column(db.DateTime)
+    finishedAt = db.Column(db.DateTime)
+
+    @property
+    def isActive(self) -> bool:
+        return self.status in ACTIVE_JOB_STATES
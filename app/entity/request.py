@@ -3,6 +3,13 @@ from app import db
 
 class Request(db.Model):
     __tablename__ = "requests"
+    __table_args__ = (
+        # CSR feed: open requests per category, newest first
+        db.Index("ix_requests_status_category_id", "status", "categoryID", "requestID"),
+        # PIN dashboard / "my requests" by status
+        db.Index("ix_requests_pin_status", "pinID", "status"),
+        db.Index("ix_requests_category", "categoryID"),
+    )
 
     requestID = db.Column(db.Integer, primary_key=True)
     pinID = db.Column(db.Integer, db.ForeignKey("user_accounts.userID"), nullable=False)
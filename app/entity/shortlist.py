@@ -3,6 +3,12 @@ from app import db
 
 class Shortlist(db.Model):
     __tablename__ = "shortlists"
+    __table_args__ = (
+        # one shortlist entry per CSR and request; lets saves be a single conditional insert
+        db.Index("uq_shortlist_csr_request", "csrRepID", "requestID", unique=True),
+        # counter reconciliation and cascade deletes by request
+        db.Index("ix_shortlists_request", "requestID"),
+    )
 
     shortlistID = db.Column(db.Integer, primary_key=True)
     requestID = db.Column(db.Integer, db.ForeignKey("requests.requestID", ondelete="CASCADE"), nullable=False)
@@ -1,6 +1,6 @@
 from app import db, login_manager
 from flask_login import UserMixin
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import check_password_hash
 
 
 class UserAccount(UserMixin, db.Model):
@@ -13,7 +13,7 @@ class UserAccount(UserMixin, db.Model):
     age = db.Column(db.Integer)
     phoneNumber = db.Column(db.String(20))
     isActive = db.Column(db.Boolean, default=True)
-    profileID = db.Column(db.Integer, db.ForeignKey("user_profiles.profileID"), nullable=False)
+    profileID = db.Column(db.Integer, db.ForeignKey("user_profiles.profileID"), nullable=False, index=True)
 
     profile = db.relationship("UserProfile", back_populates="users", lazy=True)
 
@@ -28,12 +28,21 @@ class UserAccount(UserMixin, db.Model):
 
     @password.setter
     def password(self, raw):
-        self._password = generate_password_hash(raw)
+        # algorithm and cost from the app's hashing policy
+        from app.control.password_policy import get_password_policy
+        self._password = get_password_policy().hash(raw)
 
     def check_password(self, raw):
         return check_password_hash(self._password, raw)
 
+    def password_needs_rehash(self):
+        # stored hash is of another kind or cheaper than the current policy
+        from app.control.password_policy import get_password_policy
+        return get_password_policy().needsRehash(self._password)
+
 
 @login_manager.user_loader
 def load_user(user_id):
-    return UserAccount.query.get(int(user_id))
+    # account + profile snapshot, cached briefly; None for suspended accounts
+    from app.control.session_user_cache import get_session_user_cache
+    return get_session_user_cache().get(int(user_id))
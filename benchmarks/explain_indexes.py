@@ -0,0 +1,173 @@
+"""
+EXPLAIN QUERY PLAN (SQLite) for the hot search/dashboard queries, before and after
+the model indexes are created, with median execution times.
+
+    python benchmarks/explain_indexes.py [--requests 20000] [--runs 5]
+
+Builds a throwaway database in a temp dir: tables without the new indexes
+(as an existing database would be), synthetic rows, then the plans are captured
+from the real search controllers and DashboardStats, indexes are added with
+IndexMaintenance, and the same statements are explained and timed again.
+Statements that still plan a SCAN afterwards are listed at the end. The CSR
+feed pages are among them: they walk requests in rowid (requestID) order and
+stop at the page LIMIT, so no index beats the table scan there; the whole-table
+counts of the dashboards scan a covering index at best.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import event, text
+from app import create_app, db
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.entity.category import Category
+from app.entity.request import Request
+from app.entity.shortlist import Shortlist
+from app.entity.match_record import MatchRecord
+from app.control.index_maintenance import IndexMaintenance
+
+# indexes that existed before the index set was declared
+BASELINE_INDEXES = {"ix_user_accounts_email"}
+
+
+def seed(n_requests: int):
+    rnd = random.Random(42)
+    profile = UserProfile(profileName="Bench")
+    db.session.add(profile)
+    db.session.flush()
+    n_users = max(n_requests // 20, 10)
+    db.session.execute(UserAccount.__table__.insert(), [
+        {"name": f"user {i}", "email": f"u{i}@bench", "password": "x", "profileID": profile.profileID, "isActive": True}
+        for i in range(n_users)
+    ])
+    db.session.execute(Category.__table__.insert(), [
+        {"categoryName": f"Category {i}", "isActive": True} for i in range(50)
+    ])
+    statuses = ["open"] * 6 + ["closed", "draft", "completed"]
+    now = datetime(2025, 10, 31)
+    db.session.execute(Request.__table__.insert(), [
+        {"pinID": rnd.randint(1, n_users), "categoryID": rnd.randint(1, 50), "title": f"request {i}",
+         "status": rnd.choice(statuses), "viewCount": 0, "shortlistCount": 0,
+         "createdAt": now - timedelta(minutes=i)}
+        for i in range(n_requests)
+    ])
+    db.session.execute(MatchRecord.__table__.insert(), [
+        {"requestID": rnd.randint(1, n_requests), "csrRepID": rnd.randint(1, n_users), "pinID": rnd.randint(1, n_users),
+         "categoryID": rnd.randint(1, 50), "status": "completed", "matchedAt": now,
+         "completedAt": now - timedelta(hours=rnd.randint(0, 24 * 365))}
+        for _ in range(n_requests // 2)
+    ])
+    db.session.execute(Shortlist.__table__.insert(), [
+        {"csrRepID": u, "requestID": r}
+        for u, r in {(rnd.randint(1, n_users), rnd.randint(1, n_requests)) for _ in range(n_requests // 2)}
+    ])
+    db.session.commit()
+
+
+def hot_queries():
+    """Runs the controller/route queries once and returns the statements they issued."""
+    from app.control.csr_searchRequest_controller import CsrSearchRequestController
+    from app.control.csr_searchHistory_controller import CsrSearchHistoryController
+    from app.control.csr_searchShortlist_controller import CsrSearchShortlistController
+    from app.control.pin_searchRequest_controller import PinSearchRequestController
+    from app.control.pin_searchMatchRecord_controller import PinSearchMatchRecordController
+    from app.control import dashboard_stats
+    from app.control.dashboard_stats import DashboardStats
+
+    scenarios = {
+        "csr feed (page 50)": lambda: CsrSearchRequestController().searchRequest(None, page=50),
+        "csr feed by category": lambda: CsrSearchRequestController().searchRequest("Category 7"),
+        "csr history": lambda: CsrSearchHistoryController().searchHistory(3, None, "2025-01-01", "2025-06-30"),
+        "csr shortlist": lambda: CsrSearchShortlistController().searchShortlistByCategory(3, 7),
+        "pin requests": lambda: PinSearchRequestController().searchRequests(3),
+        "pin match records": lambda: PinSearchMatchRecordController().searchMatchRecord(3),
+        "csr dashboard": lambda: DashboardStats().csrStats(3),
+        "pin dashboard": lambda: DashboardStats().pinStats(3),
+        "admin dashboard": lambda: DashboardStats().adminStats(),
+        "pm dashboard": lambda: DashboardStats().platformStats(),
+    }
+    captured = {}
+    for name, run in scenarios.items():
+        dashboard_stats.invalidate(dashboard_stats.OPEN_REQUESTS, dashboard_stats.USER_TOTALS)  # force the queries
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            run()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+        db.session.rollback()
+        captured[name] = statements
+    return captured
+
+
+def explain(captured, runs: int):
+    conn = db.session.connection()
+    report = {}
+    for name, statements in captured.items():
+        plans, timings = [], []
+        for statement, params in statements:
+            rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, params).fetchall()
+            plans.append([r[-1] for r in rows])
+            samples = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                conn.exec_driver_sql(statement, params).fetchall()
+                samples.append(time.perf_counter() - start)
+            timings.append(statistics.median(samples))
+        report[name] = (plans, sum(timings))
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(tmp, 'bench.db')}"})
+        with app.app_context():
+            for table in db.metadata.sorted_tables:
+                for index in table.indexes:
+                    if index.name not in BASELINE_INDEXES:
+                        db.session.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+            db.session.commit()
+            seed(args.requests)
+
+            captured = hot_queries()
+            before = explain(captured, args.runs)
+            created = IndexMaintenance().createMissingIndexes()
+            db.session.execute(text("ANALYZE"))
+            db.session.commit()
+            after = explain(captured, args.runs)
+
+    print(f"{args.requests} requests; created indexes: {', '.join(created)}\n")
+    for name in captured:
+        (plans_before, t_before), (plans_after, t_after) = before[name], after[name]
+        print(f"== {name}: {t_before * 1000:.2f} ms -> {t_after * 1000:.2f} ms")
+        for b, a in zip(plans_before, plans_after):
+            print("   before: " + " | ".join(b))
+            print("   after:  " + " | ".join(a))
+        print()
+
+    scans = [(name, line) for name, (plans, _) in after.items() for plan in plans for line in plan
+             if line.startswith("SCAN") and "sqlite_" not in line and "CONSTANT ROW" not in line]
+    print("Still scanning after the indexes:" if scans else "No table or index scans left.")
+    for name, line in scans:
+        print(f"   {name}: {line}")
+
+
+if __name__ == "__main__":
+    main()
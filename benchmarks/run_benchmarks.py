@@ -0,0 +1,256 @@
+"""
+Route and controller benchmarks over a synthetic database, with query counts,
+JSON results and regression checks against a stored baseline.
+
+    python benchmarks/run_benchmarks.py [--scale small] [--runs 20] [--output results.json]
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --save-baseline benchmarks/baseline.json
+
+Each scenario is run once to warm caches, then `--runs` times; the median and
+p95 wall time and the number of SQL statements of one run are recorded.
+Route scenarios go through the Flask test client logged in as the scenario's
+role; controller scenarios call the controller directly inside an app context.
+With --baseline, a scenario regresses when it issues more queries than the
+baseline, or when its median is more than --tolerance (default 25%) and
+--min-delta-ms (default 1 ms) slower. The exit status is 1 if anything
+regressed, so the command can gate CI.
+Timings only compare across runs on the same host and scale; query counts
+compare anywhere.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import event
+from app import create_app, db
+from benchmarks.synthetic_data import ADMIN, CSR, PASSWORD, PIN, PM, SCALES, generate, scale_for, user_email
+
+# user IDs of the first account of each role (see synthetic_data)
+ROLE_USERS = {"useradmin": ADMIN, "csr": CSR, "pin": PIN, "platform": PM}
+
+
+@contextmanager
+def count_queries():
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+
+
+def route_scenarios(ids: dict) -> dict:
+    """name -> (role, url). `ids` holds row IDs looked up after seeding."""
+    return {
+        "admin dashboard": ("useradmin", "/admin/dashboard"),
+        "admin users": ("useradmin", "/admin/users"),
+        "admin users search": ("useradmin", "/admin/users?search=Bench+User+1"),
+        "admin users by profile": ("useradmin", f"/admin/search/users-by-profile?profile_id={CSR}"),
+        "admin profiles": ("useradmin", "/admin/profiles"),
+        "csr dashboard": ("csr", "/csr/dashboard"),
+        "csr feed": ("csr", "/csr/requests"),
+        "csr feed page 20": ("csr", "/csr/requests?page=20"),
+        "csr feed by category": ("csr", "/csr/requests?category=Category+3"),
+        "csr feed keyword": ("csr", "/csr/requests?search=groceries+clinic"),
+        "csr request detail": ("csr", f"/csr/requests/{ids['open_request']}"),
+        "csr shortlist": ("csr", "/csr/shortlist"),
+        "csr history": ("csr", "/csr/matches?start_date=2025-01-01&end_date=2025-06-30"),
+        "pin dashboard": ("pin", "/pin/dashboard"),
+        "pin requests": ("pin", "/pin/requests"),
+        "pin request detail": ("pin", f"/pin/requests/{ids['pin_request']}"),
+        "pin match records": ("pin", "/pin/match-records?start_date=2025-01-01"),
+        "pm dashboard": ("platform", "/pm/dashboard"),
+        "pm categories": ("platform", "/pm/categories"),
+        "pm reports": ("platform", "/pm/reports"),
+        "pm report view": ("platform", f"/pm/reports/{ids['report']}"),
+    }
+
+
+def controller_scenarios(ids: dict) -> dict:
+    """name -> zero-argument callable run inside the app context."""
+    from app.control.csr_searchRequest_controller import CsrSearchRequestController
+    from app.control.csr_searchHistory_controller import CsrSearchHistoryController
+    from app.control.csr_searchShortlist_controller import CsrSearchShortlistController
+    from app.control.csr_viewRequest_controller import CsrViewRequestController
+    from app.control.pin_searchRequest_controller import PinSearchRequestController
+    from app.control.pin_searchMatchRecord_controller import PinSearchMatchRecordController
+    from app.control.useradmin_searchUserAccount_controller import UserAdminSearchUserAccountController
+    from app.control.platform_generateMonthlyReport_controller import PlatformGenerateMonthlyReportController
+    from app.control.dashboard_stats import DashboardStats
+    from app.control.export import encode
+
+    return {
+        "CsrSearchRequest.searchRequest": lambda: CsrSearchRequestController().searchRequest(None, page=5),
+        "CsrSearchRequest.searchRequest keyword":
+            lambda: CsrSearchRequestController().searchRequest(None, keyword="repair meal"),
+        "CsrSearchRequest.searchRequestByCursor": lambda: CsrSearchRequestController().searchRequestByCursor(None),
+        "CsrViewRequest.viewRequestDetails": lambda: CsrViewRequestController().viewRequestDetails(ids["open_request"]),
+        "CsrSearchHistory.searchHistory":
+            lambda: CsrSearchHistoryController().searchHistory(CSR, None, "2025-01-01", "2025-06-30"),
+        "CsrSearchShortlist.searchShortlistByCategory":
+            lambda: CsrSearchShortlistController().searchShortlistByCategory(CSR),
+        "PinSearchRequest.searchRequests": lambda: PinSearchRequestController().searchRequests(PIN),
+        "PinSearchMatchRecord.searchMatchRecord": lambda: PinSearchMatchRecordController().searchMatchRecord(PIN),
+        "UserAdminSearchUserAccount.searchUserAccountByName":
+            lambda: UserAdminSearchUserAccountController().searchUserAccountByName("Bench User 1"),
+        "DashboardStats.pinStats": lambda: DashboardStats().pinStats(PIN),
+        "DashboardStats.csrStats": lambda: DashboardStats().csrStats(CSR),
+        "DashboardStats.platformStats": lambda: DashboardStats().platformStats(),
+        "PlatformGenerateMonthlyReport (forced)":
+            lambda: PlatformGenerateMonthlyReportController().generateMonthlyReport(PM, "2025-06", True),
+        "UserAdminSearchUserAccount.exportUserAccounts (csv)":
+            lambda: sum(1 for _ in encode(UserAdminSearchUserAccountController().exportUserAccounts(), "csv")),
+    }
+
+
+def _measure(run, runs: int) -> dict:
+    run()  # warm-up: caches, compiled statements
+    with count_queries() as statements:
+        run()
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        "queries": len(statements),
+    }
+
+
+def _lookup_ids() -> dict:
+    from app.entity.request import Request
+    from app.control.platform_generateMonthlyReport_controller import PlatformGenerateMonthlyReportController
+    return {
+        "open_request": db.session.query(Request.requestID).filter_by(status="open").order_by(Request.requestID).first()[0],
+        "pin_request": db.session.query(Request.requestID).filter_by(pinID=PIN).order_by(Request.requestID).first()[0],
+        "report": PlatformGenerateMonthlyReportController().generateMonthlyReport(PM, "2025-06").reportID,
+    }
+
+
+def run_suite(app, runs: int, only: str = None) -> dict:
+    """Runs every scenario (or those whose name contains `only`) against the app's seeded database."""
+    results = {}
+    with app.app_context():
+        ids = _lookup_ids()
+        db.session.commit()
+        for name, run in controller_scenarios(ids).items():
+            if only and only not in name:
+                continue
+
+            def call():
+                run()
+                db.session.rollback()  # nothing carries over between runs
+
+            results[name] = {"kind": "controller", **_measure(call, runs)}
+
+    clients = {}
+    for name, (role, url) in route_scenarios(ids).items():
+        if only and only not in name:
+            continue
+        if role not in clients:
+            client = clients[role] = app.test_client()
+            resp = client.post("/login", data={"email": user_email(ROLE_USERS[role]), "password": PASSWORD})
+            if resp.status_code != 302:
+                raise RuntimeError(f"Benchmark login as {role} failed ({resp.status_code}).")
+        client = clients[role]
+
+        def get():
+            resp = client.get(url)
+            if resp.status_code != 200:
+                raise RuntimeError(f"{url} returned {resp.status_code}.")
+
+        with app.app_context():
+            results[name] = {"kind": "route", "url": url, **_measure(get, runs)}
+
+    with app.app_context():
+        app.extensions["view_counter"].flush()  # before the temporary database goes away
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float = 0.25, min_delta_ms: float = 1.0) -> list:
+    """Regressions of `results` against `baseline` scenarios, as readable lines."""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if current["queries"] > base["queries"]:
+            regressions.append(f"{name}: {base['queries']} -> {current['queries']} queries")
+        slower = current["median_ms"] - base["median_ms"]
+        if slower > min_delta_ms and current["median_ms"] > base["median_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: median {base['median_ms']:.2f} -> {current['median_ms']:.2f} ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--requests", type=int, help="Override the scale with a request count.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--only", help="Run only scenarios whose name contains this text.")
+    parser.add_argument("--output", help="Write results JSON here (default: stdout summary only).")
+    parser.add_argument("--baseline", help="Compare against this results JSON; exit 1 on regression.")
+    parser.add_argument("--save-baseline", help="Write the results as the new baseline here.")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--min-delta-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    scale = scale_for(args.requests) if args.requests else SCALES[args.scale]
+    with tempfile.TemporaryDirectory() as tmp:
+        app = create_app({
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+            "REPORT_JOB_WORKERS": 0,
+            "WTF_CSRF_ENABLED": False,
+        })
+        with app.app_context():
+            counts = generate(scale, args.seed)
+        results = run_suite(app, args.runs, args.only)
+
+    output = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "seed": args.seed,
+            "runs": args.runs,
+            "rows": counts,
+        },
+        "scenarios": results,
+    }
+    width = max(len(n) for n in results)
+    for name, r in results.items():
+        print(f"{name:<{width}}  {r['median_ms']:9.2f} ms  p95 {r['p95_ms']:9.2f} ms  {r['queries']:3d} queries")
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w") as f:
+            json.dump(output, f, indent=2)
+            f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline["meta"].get("rows") != counts:
+            print("\nwarning: baseline was recorded at another scale; timings are not comparable.")
+        regressions = compare(results, baseline["scenarios"], args.tolerance, args.min_delta_ms)
+        print("\nRegressions:\n  " + "\n  ".join(regressions) if regressions else "\nNo regressions.")
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Seeded synthetic data for benchmarks: profiles, accounts, categories, requests,
+shortlists and match records at a named scale or explicit row counts.
+
+    python benchmarks/synthetic_data.py --scale medium --db /tmp/bench.db
+    python benchmarks/synthetic_data.py --requests 2000000 --db /tmp/big.db
+
+Rows are generated lazily and inserted with executemany in batches, so memory
+stays flat up to millions of rows. The same seed always produces the same
+database. Derived data (shortlist counters, report rollups, the search index,
+the category cache version) is rebuilt afterwards with the app's own
+maintenance controllers, so every page sees consistent data.
+
+Accounts: the first four are admin0 / csr1 / pin2 / pm3 "@bench.test" (one
+per role); the rest alternate CSR / PIN. Every password is PASSWORD.
+"""
+import argparse
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import NamedTuple
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import insert
+from app import create_app, db
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.entity.category import Category
+from app.entity.request import Request
+from app.entity.shortlist import Shortlist
+from app.entity.match_record import MatchRecord
+
+PASSWORD = "bench-password"
+NOW = datetime(2025, 10, 31, 12, 0)
+HISTORY_DAYS = 365
+BATCH_SIZE = 10000
+
+# one profile per role, named as role_map recognises them
+PROFILES = ("User Admin", "CSR Rep", "Person In Need", "Platform Manager")
+ADMIN, CSR, PIN, PM = range(1, 5)  # their profile IDs
+ROLE_PREFIX = {ADMIN: "admin", CSR: "csr", PIN: "pin", PM: "pm"}
+REQUEST_STATUSES = ["open"] * 6 + ["draft", "closed", "completed"]
+
+
+class Scale(NamedTuple):
+    users: int
+    categories: int
+    requests: int
+    shortlists: int
+    match_records: int
+
+
+SCALES = {
+    "tiny": Scale(users=40, categories=8, requests=400, shortlists=200, match_records=200),
+    "small": Scale(users=500, categories=20, requests=10000, shortlists=5000, match_records=5000),
+    "medium": Scale(users=5000, categories=50, requests=200000, shortlists=100000, match_records=100000),
+    "large": Scale(users=50000, categories=100, requests=2000000, shortlists=1000000, match_records=1000000),
+}
+
+
+def scale_for(requests: int) -> Scale:
+    """Scale proportioned like the named ones around a given request count."""
+    return Scale(
+        users=max(requests // 40, 10),
+        categories=min(max(requests // 2000, 8), 200),
+        requests=requests,
+        shortlists=requests // 2,
+        match_records=requests // 2,
+    )
+
+
+def user_email(user_id: int) -> str:
+    profile = _profile_for(user_id)
+    return f"{ROLE_PREFIX[profile]}{user_id - 1}@bench.test"
+
+
+def _profile_for(user_id: int) -> int:
+    if user_id <= len(PROFILES):
+        return user_id  # admin0, csr1, pin2, pm3
+    return CSR if user_id % 2 else PIN
+
+
+def _batched(rows, size):
+    it = iter(rows)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _insert(model, rows, batch_size):
+    count = 0
+    for batch in _batched(rows, batch_size):
+        db.session.execute(insert(model.__table__), batch)
+        count += len(batch)
+    return count
+
+
+def generate(scale: Scale, seed: int = 42, batch_size: int = BATCH_SIZE) -> dict:
+    """Fills the (empty) database of the current app. Returns the row count per table."""
+    from app.control.category_registry import CategoryRegistry
+    from app.control.report_rollup import ReportRollup
+    from app.control.request_search import get_search_backend
+    from app.control.shortlist_maintenance import ShortlistMaintenance
+    from app.control.password_policy import get_password_policy
+
+    rnd = random.Random(seed)
+    hashed = get_password_policy().hash(PASSWORD)  # one hash shared by every account
+    user_ids = range(1, max(scale.users, len(PROFILES)) + 1)
+    csr_ids = [u for u in user_ids if _profile_for(u) == CSR]
+    pin_ids = [u for u in user_ids if _profile_for(u) == PIN]
+    category_ids = range(1, scale.categories + 1)
+    counts = {}
+
+    counts["user_profiles"] = _insert(UserProfile, (
+        {"profileID": i, "profileName": name, "description": f"{name} (benchmark)", "isActive": True}
+        for i, name in enumerate(PROFILES, start=1)
+    ), batch_size)
+
+    counts["user_accounts"] = _insert(UserAccount, (
+        {"userID": u, "name": f"Bench User {u}", "email": user_email(u), "password": hashed,
+         "age": 18 + u % 60, "phoneNumber": f"555{u:07d}", "profileID": _profile_for(u), "isActive": True}
+        for u in user_ids
+    ), batch_size)
+
+    counts["categories"] = _insert(Category, (
+        {"categoryID": c, "categoryName": f"Category {c}", "description": f"Synthetic category {c}", "isActive": True}
+        for c in category_ids
+    ), batch_size)
+
+    words = ("ride", "groceries", "clinic", "repair", "tutoring", "meal", "laundry", "shopping", "visit", "move")
+
+    def requests():
+        for r in range(1, scale.requests + 1):
+            status = rnd.choice(REQUEST_STATUSES)
+            created = NOW - timedelta(minutes=rnd.randint(0, HISTORY_DAYS * 24 * 60))
+            yield {
+                "requestID": r, "pinID": rnd.choice(pin_ids), "categoryID": rnd.choice(category_ids),
+                "csrRepID": rnd.choice(csr_ids) if status != "open" else None,
+                "title": f"{rnd.choice(words)} {rnd.choice(words)} #{r}",
+                "description": " ".join(rnd.choice(words) for _ in range(12)),
+                "status": status, "viewCount": rnd.randint(0, 200), "shortlistCount": 0,
+                "createdAt": created, "closedAt": created + timedelta(days=2) if status == "completed" else None,
+            }
+    counts["requests"] = _insert(Request, requests(), batch_size)
+
+    # unique (csr, request) pairs: the j-th shortlist of a CSR is request offset+j
+    offsets = [rnd.randrange(scale.requests) for _ in csr_ids]
+    per_csr = min(scale.shortlists // max(len(csr_ids), 1) + 1, scale.requests)
+
+    def shortlists():
+        k = 0
+        for j in range(per_csr):
+            for c, csr in enumerate(csr_ids):
+                if k == scale.shortlists:
+                    return
+                yield {"csrRepID": csr, "requestID": 1 + (offsets[c] + j) % scale.requests,
+                       "createdAt": NOW - timedelta(minutes=rnd.randint(0, HISTORY_DAYS * 24 * 60))}
+                k += 1
+    counts["shortlists"] = _insert(Shortlist, shortlists(), batch_size)
+
+    def match_records():
+        for _ in range(scale.match_records):
+            matched = NOW - timedelta(minutes=rnd.randint(0, HISTORY_DAYS * 24 * 60))
+            yield {
+                "requestID": rnd.randint(1, scale.requests), "csrRepID": rnd.choice(csr_ids),
+                "pinID": rnd.choice(pin_ids), "categoryID": rnd.choice(category_ids), "status": "completed",
+                "matchedAt": matched, "completedAt": matched + timedelta(hours=rnd.randint(1, 72)),
+            }
+    counts["match_records"] = _insert(MatchRecord, match_records(), batch_size)
+    db.session.commit()
+
+    ShortlistMaintenance().reconcile()
+    ReportRollup().rebuild()
+    get_search_backend().rebuild()
+    CategoryRegistry.changed()
+    db.session.commit()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", required=True, help="SQLite file to create (must not exist).")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--requests", type=int, help="Override the scale with a request count.")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    if os.path.exists(args.db):
+        parser.error(f"{args.db} already exists.")
+
+    scale = scale_for(args.requests) if args.requests else SCALES[args.scale]
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.abspath(args.db)}", "REPORT_JOB_WORKERS": 0})
+    with app.app_context():
+        counts = generate(scale, args.seed)
+    for table, n in counts.items():
+        print(f"{table:>15}: {n}")
+
+
+if __name__ == "__main__":
+    main()
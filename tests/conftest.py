@@ -19,3 +19,23 @@ def app():
 @pytest.fixture()
 def client(app): # dummy web for GET/POST
     return app.test_client()
+
+@pytest.fixture()
+def count_queries(app):
+    # with count_queries() as queries: ...  -> queries holds every SQL statement run inside the block
+    from contextlib import contextmanager
+    from sqlalchemy import event
+
+    @contextmanager
+    def counter():
+        statements = []
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+    return counter
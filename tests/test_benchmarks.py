@@ -0,0 +1,47 @@
+import pytest
+from app import create_app, db
+from app.entity.request import Request
+from app.entity.shortlist import Shortlist
+from benchmarks.synthetic_data import SCALES, generate
+from benchmarks.run_benchmarks import compare, run_suite
+
+@pytest.fixture()
+def app():
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+        "REPORT_JOB_WORKERS": 0,
+    })
+    with app.app_context():
+        db.create_all()
+        counts = generate(SCALES["tiny"], seed=7, batch_size=64)
+        app.seeded = counts
+    yield app
+
+def test_generator_is_seeded_and_consistent(app):
+    scale = SCALES["tiny"]
+    assert app.seeded["requests"] == scale.requests and app.seeded["shortlists"] == scale.shortlists
+    with app.app_context():
+        first = [r.title for r in Request.query.order_by(Request.requestID).limit(5)]
+        # shortlist counters were reconciled from the generated rows
+        assert sum(r.shortlistCount for r in Request.query) == Shortlist.query.count()
+    other = create_app({"TESTING": True, "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:", "REPORT_JOB_WORKERS": 0})
+    with other.app_context():
+        db.create_all()
+        generate(scale, seed=7)
+        assert [r.title for r in Request.query.order_by(Request.requestID).limit(5)] == first
+
+def test_suite_records_timings_and_query_counts(app):
+    results = run_suite(app, runs=2)
+    assert results["csr feed"]["kind"] == "route" and results["csr feed"]["queries"] >= 1
+    assert results["DashboardStats.pinStats"]["kind"] == "controller"
+    assert all(r["median_ms"] >= 0 for r in results.values())
+
+def test_compare_flags_regressions():
+    baseline = {"a": {"median_ms": 10.0, "queries": 2}, "b": {"median_ms": 1.0, "queries": 1}}
+    current = {
+        "a": {"median_ms": 20.0, "queries": 3},   # slower and more queries
+        "b": {"median_ms": 1.6, "queries": 1},    # +60% but under the 1 ms noise floor
+        "c": {"median_ms": 99.0, "queries": 9},   # new scenario, no baseline
+    }
+    assert compare(current, baseline) == ["a: 2 -> 3 queries", "a: median 10.00 -> 20.00 ms"]
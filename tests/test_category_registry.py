@@ -0,0 +1,48 @@
+import pytest
+from app import create_app, db
+from app.entity.category import Category
+from app.control.category_registry import CategoryRecord, CategoryRegistry, active_categories
+from app.control.platform_createCategory_controller import PlatformCreateCategoryController
+from app.control.platform_suspendCategory_controller import PlatformSuspendCategoryController
+from app.control.platform_updateCategory_controller import PlatformUpdateCategoryController
+
+@pytest.fixture()
+def app():
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+        "CATEGORY_CACHE_CHECK_INTERVAL": 3600,
+    })
+    with app.app_context():
+        db.create_all()
+        db.session.add_all([Category(categoryName="Transport"), Category(categoryName="Old", isActive=False)])
+        db.session.commit()
+    yield app
+
+def test_active_categories_are_cached_records(app, count_queries):
+    with app.app_context():
+        first = active_categories()
+        assert first == (CategoryRecord(1, "Transport", None),)
+        with count_queries() as queries:
+            assert active_categories() is first
+        assert queries == []
+
+def test_write_controllers_invalidate(app):
+    with app.app_context():
+        active_categories()
+        health = PlatformCreateCategoryController().create_category("Health", "Clinic visits")
+        assert [c.categoryName for c in active_categories()] == ["Transport", "Health"]
+        PlatformUpdateCategoryController().updateCategory(1, "Rides", None)
+        PlatformSuspendCategoryController().suspendCategory(health.categoryID)
+        assert [c.categoryName for c in active_categories()] == ["Rides"]
+
+def test_other_workers_follow_the_version_stamp(app):
+    with app.app_context():
+        other = CategoryRegistry(check_interval=0)  # a second worker's registry
+        assert len(other.active()) == 1
+        PlatformCreateCategoryController().create_category("Health")
+        assert len(other.active()) == 2
+        # a stale copy is kept while the stored version is unchanged
+        db.session.add(Category(categoryName="Unannounced"))
+        db.session.commit()
+        assert len(other.active()) == 2
@@ -0,0 +1,65 @@
+import pytest
+from app import create_app, db
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.entity.category import Category
+from app.entity.request import Request
+from app.control.dashboard_stats import DashboardStats
+from app.control.pin_createRequest_controller import PinCreateRequestController
+from app.control.useradmin_suspendUserAccount_controller import UserAdminSuspendUserAccountController
+
+@pytest.fixture()
+def app():
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+        "DASHBOARD_CACHE_TTL": 3600,
+    })
+    with app.app_context():
+        db.create_all()
+        profile = UserProfile(profileName="Person in Need")
+        db.session.add(profile)
+        db.session.flush()
+        pin = UserAccount(name="Pin", email="pin@test.com", profileID=profile.profileID)
+        pin.password = "12345"
+        cat = Category(categoryName="Transport")
+        db.session.add_all([pin, cat])
+        db.session.flush()
+        for status in ["Draft", "open", "OPEN", "completed", "matched"]:
+            db.session.add(Request(pinID=pin.userID, categoryID=cat.categoryID, title="t", status=status))
+        db.session.commit()
+    yield app
+
+def test_pin_stats_group_statuses_case_insensitively(app, count_queries):
+    with app.app_context():
+        pin_id = UserAccount.query.first().userID
+        with count_queries() as queries:
+            stats = DashboardStats().pinStats(pin_id)
+        assert stats == {"total": 5, "draft": 1, "open": 2, "completed": 1}
+        assert len(queries) == 1
+
+def test_open_count_is_cached_until_a_write_invalidates_it(app):
+    with app.app_context():
+        pin = UserAccount.query.first()
+        # exact match, as the CSR route always counted: "OPEN" is not included
+        assert DashboardStats().csrStats(pin.userID)["open_requests_count"] == 1
+
+        # a write that bypasses the controllers is not seen while the entry is fresh
+        db.session.add(Request(pinID=pin.userID, categoryID=1, title="raw", status="open"))
+        db.session.commit()
+        assert DashboardStats().openRequestCount() == 1
+
+        PinCreateRequestController().createRequest(userID=pin.userID, categoryID=1, title="x", description="y")
+        assert DashboardStats().openRequestCount() == 3
+
+def test_admin_totals_follow_suspension(app, count_queries):
+    with app.app_context():
+        with count_queries() as queries:
+            assert DashboardStats().adminStats() == {
+                "total_users": 1, "active_users": 1, "suspended_users": 0, "total_profiles": 1,
+            }
+            DashboardStats().adminStats()
+        assert len(queries) == 1
+
+        UserAdminSuspendUserAccountController().suspendUserAccount(UserAccount.query.first().userID)
+        assert DashboardStats().adminStats()["suspended_users"] == 1
@@ -0,0 +1,109 @@
+import json
+import pytest
+from flask import g
+from sqlalchemy import event, text
+from app import create_app, db
+from app.entity.user_profile import UserProfile
+from app.entity.category import Category
+from app.control import data_version
+from app.control.db_engine import get_replica_engine, pool_stats, read_replica
+from app.control.csr_searchRequest_controller import CsrSearchRequestController
+from app.control.platform_generateMonthlyReport_controller import PlatformGenerateMonthlyReportController
+
+def _make_app(**config):
+    app = create_app({"TESTING": True, "REPORT_JOB_WORKERS": 0, **config})
+    with app.app_context():
+        db.create_all()
+    return app
+
+def test_sqlite_pragmas_on_connect(tmp_path):
+    app = _make_app(SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'app.db'}", SQLITE_CACHE_SIZE=None)
+    with app.app_context():
+        conn = db.session.connection()
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA cache_size")).scalar() == -2000  # skipped: SQLite default
+
+def test_pool_options(tmp_path):
+    app = _make_app(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'app.db'}",
+        DB_POOL_SIZE=3,
+        SQLALCHEMY_ENGINE_OPTIONS={"max_overflow": 1},
+    )
+    assert app.config["SQLALCHEMY_ENGINE_OPTIONS"]["pool_size"] == 3
+    with app.app_context():
+        assert pool_stats(db)["primary"]["capacity"] == 4  # explicit max_overflow wins over DB_MAX_OVERFLOW
+
+    replica = _make_app(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'app.db'}",
+        DATABASE_REPLICA_URL=f"sqlite:///{tmp_path / 'replica.db'}",
+        DB_POOL_SIZE=3,
+        DB_MAX_OVERFLOW=2,
+    )
+    with replica.app_context():
+        assert {name: s["capacity"] for name, s in pool_stats(db).items()} == {"primary": 5, "replica": 5}
+
+    memory = _make_app(SQLALCHEMY_DATABASE_URI="sqlite:///:memory:")
+    assert "pool_size" not in memory.config["SQLALCHEMY_ENGINE_OPTIONS"]
+
+def test_replica_routing(tmp_path):
+    path = tmp_path / "app.db"
+    app = _make_app(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{path}",
+        DATABASE_REPLICA_URL=f"sqlite:///file:{path}?mode=ro&uri=true",  # read-only view of the same file
+    )
+    with app.app_context():
+        db.session.add(Category(categoryName="Transport"))
+        db.session.commit()
+        replica = get_replica_engine()
+        statements = []
+        record = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(replica, "before_cursor_execute", record)
+        try:
+            CsrSearchRequestController().searchRequest(None)
+            assert statements, "search should read from the replica"
+            statements.clear()
+
+            with read_replica():
+                # writes and flushes inside the block still go to the primary
+                db.session.add(UserProfile(profileName="CSR Rep"))
+                db.session.commit()
+                assert UserProfile.query.count() == 1
+            assert not any(s.lstrip().upper().startswith("INSERT") for s in statements)
+            statements.clear()
+
+            assert Category.query.count() == 1
+            assert statements == []  # outside the block: primary
+        finally:
+            event.remove(replica, "before_cursor_execute", record)
+
+        assert set(pool_stats(db)) == {"primary", "replica"}
+    metrics = app.test_client().get("/metrics").get_data(as_text=True)
+    assert 'db_pool_connections{bind="replica",state="size"}' in metrics
+
+def test_replica_reads_are_instrumented(tmp_path):
+    path = tmp_path / "app.db"
+    app = _make_app(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{path}",
+        DATABASE_REPLICA_URL=f"sqlite:///file:{path}?mode=ro&uri=true",
+    )
+    with app.test_request_context():
+        app.preprocess_request()
+        CsrSearchRequestController().searchRequest(None)
+        assert g.sql_queries.count > 0
+
+def test_report_is_stamped_with_the_version_of_the_database_it_read(tmp_path):
+    app = _make_app(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'app.db'}",
+        DATABASE_REPLICA_URL=f"sqlite:///{tmp_path / 'replica.db'}",  # a replica that never catches up
+    )
+    with app.app_context():
+        db.metadata.create_all(get_replica_engine())
+        data_version.bump(data_version.REPORT_DATA)  # a write the replica has not received
+        db.session.commit()
+        first = PlatformGenerateMonthlyReportController().generateMonthlyReport(1, "2025-10")
+        assert json.loads(first.reportData)["data_version"].startswith("0.0@")  # the replica's, not the primary's
+        # the stale totals are not reused under the primary's newer version
+        second = PlatformGenerateMonthlyReportController().generateMonthlyReport(1, "2025-10")
+        assert second.reportID != first.reportID
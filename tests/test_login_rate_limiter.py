@@ -0,0 +1,99 @@
+import pytest
+from app import create_app, db
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.entity.login_attempt import LoginAttempt
+from app.control.login_rate_limiter import (
+    DatabaseAttemptStore, LoginRateLimiter, MemoryAttemptStore, get_login_limiter
+)
+
+def _make_app(**config):
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+        "REPORT_JOB_WORKERS": 0,
+        "LOGIN_LIMIT_PER_EMAIL": 3,
+        "LOGIN_LIMIT_PER_IP": 5,
+        **config,
+    })
+    with app.app_context():
+        db.create_all()
+        profile = UserProfile(profileName="CSR Rep")
+        db.session.add(profile)
+        db.session.flush()
+        for email in ("a@test.com", "b@test.com"):
+            u = UserAccount(name="U", email=email, profileID=profile.profileID)
+            u.password = "12345"
+            db.session.add(u)
+        db.session.commit()
+    return app
+
+@pytest.fixture(params=["memory", "database"])
+def app(request):
+    yield _make_app(LOGIN_LIMIT_STORE=request.param)
+
+def _post(client, email, password, ip="10.0.0.1"):
+    return client.post("/login", data={"email": email, "password": password},
+                       environ_base={"REMOTE_ADDR": ip})
+
+def test_email_limit_blocks_before_user_query(app, count_queries):
+    client = app.test_client()
+    for _ in range(3):
+        assert _post(client, "a@test.com", "wrong").status_code == 401
+    with count_queries() as queries:
+        resp = _post(client, "a@test.com", "12345")
+    assert resp.status_code == 429
+    assert int(resp.headers["Retry-After"]) > 0
+    assert not any("user_accounts" in q for q in queries)
+    # other accounts are unaffected
+    assert _post(client, "b@test.com", "12345").status_code == 302
+
+def test_success_resets_email_counter(app):
+    client = app.test_client()
+    for _ in range(2):
+        _post(client, "a@test.com", "wrong")
+    assert _post(client, "a@test.com", "12345").status_code == 302
+    client.get("/logout")
+    for _ in range(2):
+        assert _post(client, "a@test.com", "wrong").status_code == 401
+
+def test_ip_limit_across_emails(app):
+    client = app.test_client()
+    for i in range(5):
+        _post(client, f"nobody{i}@test.com", "x")
+    assert _post(client, "b@test.com", "12345").status_code == 429
+    assert _post(client, "b@test.com", "12345", ip="10.0.0.2").status_code == 302
+
+def test_window_expiry():
+    limiter = LoginRateLimiter(MemoryAttemptStore(), per_email=1, per_ip=0, window=60)
+    limiter.store.add(["email:x@test.com"], 0.0, 60)  # long ago
+    assert limiter.check("X@test.com", "1.2.3.4") == 0
+    limiter.recordFailure("x@test.com", "1.2.3.4")
+    assert 0 < limiter.check("X@test.com", "1.2.3.4") <= 61
+
+def test_database_store_is_shared():
+    app = _make_app(LOGIN_LIMIT_STORE="database")
+    with app.app_context():
+        first = LoginRateLimiter(DatabaseAttemptStore(), per_email=2, per_ip=0)
+        second = LoginRateLimiter(DatabaseAttemptStore(), per_email=2, per_ip=0)
+        first.recordFailure("a@test.com", None)
+        second.recordFailure("a@test.com", None)
+        assert first.check("a@test.com", None) > 0
+        assert LoginAttempt.query.count() == 2
+
+def test_database_store_is_the_default():
+    app = _make_app()
+    with app.app_context():
+        assert isinstance(get_login_limiter().store, DatabaseAttemptStore)
+
+def test_clients_behind_a_trusted_proxy_get_their_own_ip_bucket():
+    client = _make_app(PROXY_FIX_X_FOR=1).test_client()
+
+    def via_proxy(email, password, client_ip):
+        return client.post("/login", data={"email": email, "password": password},
+                           headers={"X-Forwarded-For": client_ip}, environ_base={"REMOTE_ADDR": "10.0.0.254"})
+
+    for i in range(5):
+        via_proxy(f"nobody{i}@test.com", "x", "203.0.113.7")
+    assert via_proxy("b@test.com", "12345", "203.0.113.7").status_code == 429
+    assert via_proxy("b@test.com", "12345", "198.51.100.9").status_code == 302
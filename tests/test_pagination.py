@@ -0,0 +1,133 @@
+import pytest
+from app import create_app, db
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.entity.category import Category
+from app.entity.request import Request
+from app.entity.match_record import MatchRecord
+from datetime import datetime
+from app.control.csr_searchRequest_controller import CsrSearchRequestController
+from app.control.pin_searchRequest_controller import PinSearchRequestController
+from app.control.csr_searchHistory_controller import CsrSearchHistoryController
+
+@pytest.fixture()
+def app():
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+        "WTF_CSRF_ENABLED": False,
+    })
+    with app.app_context():
+        db.create_all()
+        _seed()
+    yield app
+
+@pytest.fixture()
+def client(app):
+    return app.test_client()
+
+def _seed():
+    # one CSR, one PIN, one category and 20 open requests
+    csr_profile = UserProfile(profileName="CSR Rep")
+    pin_profile = UserProfile(profileName="PIN")
+    db.session.add_all([csr_profile, pin_profile])
+    db.session.flush()
+
+    csr = UserAccount(name="Csr", email="csr@test.com", profileID=csr_profile.profileID)
+    csr.password = "12345"
+    pin = UserAccount(name="Pin", email="pin@test.com", profileID=pin_profile.profileID)
+    pin.password = "12345"
+    cat = Category(categoryName="Transport")
+    db.session.add_all([csr, pin, cat])
+    db.session.flush()
+
+    for i in range(20):
+        db.session.add(Request(pinID=pin.userID, categoryID=cat.categoryID,
+                               title=f"Request {i}", description="desc", status="open"))
+    db.session.commit()
+
+def test_search_request_returns_sql_page(app):
+    with app.app_context():
+        page = CsrSearchRequestController().searchRequest(None, page=2, per_page=9)
+        assert page.total == 20
+        assert page.pages == 3
+        assert len(page.items) == 9
+        # newest first, so page 2 starts at the 10th newest request
+        assert page.items[0].title == "Request 10"
+
+def test_out_of_range_page_is_empty(app):
+    with app.app_context():
+        pin = UserAccount.query.filter_by(email="pin@test.com").first()
+        page = PinSearchRequestController().searchRequests(pin.userID, page=5, per_page=9)
+        assert page.items == []
+        assert page.total == 20
+        assert not page.has_next
+
+def test_csr_requests_route_renders_one_page(app, client):
+    client.post("/login", data={"email": "csr@test.com", "password": "12345"})
+    resp = client.get("/csr/requests?page=3")
+    assert resp.status_code == 200
+    body = resp.get_data(as_text=True)
+    assert "Page 3 of 3" in body
+    assert "Request 1<" in body and "Request 2<" not in body
+
+def test_cursor_feed_walks_forward_and_back(app):
+    with app.app_context():
+        ctrl = CsrSearchRequestController()
+        first = ctrl.searchRequestByCursor(None, per_page=9)
+        second = ctrl.searchRequestByCursor(None, after=first.next_cursor, per_page=9)
+        third = ctrl.searchRequestByCursor(None, after=second.next_cursor, per_page=9)
+        seen = [r.requestID for p in (first, second, third) for r in p.items]
+        assert seen == sorted(seen, reverse=True) and len(seen) == 20
+        assert not first.has_prev and not third.has_next
+
+        back = ctrl.searchRequestByCursor(None, before=third.prev_cursor, per_page=9)
+        assert [r.requestID for r in back.items] == [r.requestID for r in second.items]
+        assert back.has_prev and back.has_next
+
+def test_cursor_history_handles_ties_and_missing_dates(app):
+    with app.app_context():
+        csr = UserAccount.query.filter_by(email="csr@test.com").first()
+        pin = UserAccount.query.filter_by(email="pin@test.com").first()
+        same_day = datetime(2025, 10, 1, 12, 0)
+        for i, req in enumerate(Request.query.order_by(Request.requestID).limit(7).all()):
+            db.session.add(MatchRecord(requestID=req.requestID, csrRepID=csr.userID, pinID=pin.userID,
+                                       categoryID=req.categoryID,
+                                       completedAt=None if i == 6 else same_day))
+        db.session.commit()
+
+        ctrl = CsrSearchHistoryController()
+        ids, cursor = [], None
+        while True:
+            page = ctrl.searchHistoryByCursor(csr.userID, after=cursor, per_page=2)
+            ids += [m.matchRecordID for m in page.items]
+            if not page.has_next:
+                break
+            cursor = page.next_cursor
+        offset_ids = [m.matchRecordID for m in ctrl.searchHistory(csr.userID, per_page=10).items]
+        assert ids == offset_ids and len(ids) == 7
+
+def test_tampered_cursor_falls_back_to_first_page(app, client):
+    client.post("/login", data={"email": "csr@test.com", "password": "12345"})
+    resp = client.get("/csr/requests?after=not-a-cursor")
+    assert resp.status_code == 200
+    assert "Invalid page cursor." in resp.get_data(as_text=True)
+
+def test_history_date_filter_is_inclusive_half_open(app):
+    with app.app_context():
+        csr = UserAccount.query.filter_by(email="csr@test.com").first()
+        pin = UserAccount.query.filter_by(email="pin@test.com").first()
+        req = Request.query.first()
+        for ts in (datetime(2025, 10, 1, 0, 0), datetime(2025, 10, 3, 23, 59, 59), datetime(2025, 10, 4, 0, 0)):
+            db.session.add(MatchRecord(requestID=req.requestID, csrRepID=csr.userID, pinID=pin.userID,
+                                       categoryID=req.categoryID, completedAt=ts))
+        db.session.commit()
+
+        page = CsrSearchHistoryController().searchHistory(csr.userID, None, "2025-10-01", "2025-10-03")
+        assert [m.completedAt.day for m in page.items] == [3, 1]
+
+def test_bad_history_date_is_flashed(app, client):
+    client.post("/login", data={"email": "csr@test.com", "password": "12345"})
+    resp = client.get("/csr/matches?start_date=2025-13-40")
+    assert resp.status_code == 200
+    assert "Invalid start date" in resp.get_data(as_text=True)
@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from werkzeug.security import generate_password_hash
+from app import create_app, db
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.control.password_policy import PasswordPolicy, benchmark
+
+CHEAP = {"PASSWORD_HASH_ALGORITHM": "pbkdf2", "PASSWORD_PBKDF2_ITERATIONS": 2000}
+
+@pytest.fixture()
+def app():
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+        "REPORT_JOB_WORKERS": 0,
+        **CHEAP,
+    })
+    with app.app_context():
+        db.create_all()
+        profile = UserProfile(profileName="CSR Rep")
+        db.session.add(profile)
+        db.session.flush()
+        user = UserAccount(name="Old", email="old@test.com", profileID=profile.profileID)
+        user._password = generate_password_hash("12345", method="pbkdf2:sha256:1000")
+        db.session.add(user)
+        db.session.commit()
+    yield app
+
+def test_policy_from_config(app):
+    with app.app_context():
+        user = UserAccount.query.first()
+        user.password = "new"
+        assert user._password.startswith("pbkdf2:sha256:2000$")
+    with pytest.raises(ValueError):
+        PasswordPolicy.fromConfig({"PASSWORD_HASH_ALGORITHM": "md5"})
+
+def test_needs_rehash():
+    policy = PasswordPolicy(algorithm="scrypt", scrypt_n=2 ** 14)
+    assert not policy.needsRehash("scrypt:16384:8:1$salt$hash")
+    assert not policy.needsRehash("scrypt:32768:8:1$salt$hash")
+    assert policy.needsRehash("scrypt:8192:8:1$salt$hash")
+    assert policy.needsRehash("pbkdf2:sha256:600000$salt$hash")
+    pbkdf2 = PasswordPolicy(algorithm="pbkdf2", pbkdf2_iterations=600000)
+    assert pbkdf2.needsRehash("pbkdf2:sha256:260000$salt$hash")
+    assert pbkdf2.needsRehash("pbkdf2:sha1:600000$salt$hash")
+    assert pbkdf2.needsRehash("pbkdf2$salt$hash")
+
+def test_login_rehashes_weaker_hash(app):
+    client = app.test_client()
+    resp = client.post("/login", data={"email": "old@test.com", "password": "12345"})
+    assert resp.status_code == 302
+    with app.app_context():
+        user = UserAccount.query.filter_by(email="old@test.com").one()
+        assert user._password.startswith("pbkdf2:sha256:2000$")
+        assert user.check_password("12345")
+
+def test_login_survives_a_failed_rehash_write(app, monkeypatch):
+    commit = Session.commit
+
+    def locked_commit(session):
+        if any(isinstance(obj, UserAccount) for obj in session.dirty):
+            raise OperationalError("UPDATE user_accounts", {}, Exception("database is locked"))
+        return commit(session)
+
+    monkeypatch.setattr(Session, "commit", locked_commit)
+    client = app.test_client()
+    resp = client.post("/login", data={"email": "old@test.com", "password": "12345"})
+    monkeypatch.undo()
+    assert resp.status_code == 302 and resp.headers["Location"].endswith("/csr/dashboard")
+    with app.app_context():
+        assert UserAccount.query.first()._password.startswith("pbkdf2:sha256:1000$")
+
+def test_failed_login_keeps_hash(app):
+    client = app.test_client()
+    client.post("/login", data={"email": "old@test.com", "password": "wrong"})
+    with app.app_context():
+        assert UserAccount.query.first()._password.startswith("pbkdf2:sha256:1000$")
+
+def test_benchmark_command(app):
+    assert [cost for cost, _ in benchmark(PasswordPolicy(algorithm="pbkdf2", pbkdf2_iterations=4000), rounds=1)] \
+        == [1000, 2000, 4000, 8000, 16000]
+    result = app.test_cli_runner().invoke(args=["benchmark-hashing", "--rounds", "1"])
+    assert result.exit_code == 0, result.output
+    assert "pbkdf2:sha256:2000" in result.output and "<- configured" in result.output
@@ -0,0 +1,88 @@
+import pytest
+from datetime import datetime
+from app import create_app, db
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.entity.category import Category
+from app.entity.request import Request
+from app.entity.shortlist import Shortlist
+from app.entity.match_record import MatchRecord
+from app.control.category_registry import CategoryRegistry
+
+@pytest.fixture()
+def app():
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+    })
+    with app.app_context():
+        db.create_all()
+        profile = UserProfile(profileName="CSR Rep")
+        db.session.add(profile)
+        db.session.flush()
+        csr = UserAccount(name="Csr", email="csr@test.com", profileID=profile.profileID)
+        csr.password = "12345"
+        admin_profile = UserProfile(profileName="User Admin")
+        db.session.add_all([csr, admin_profile])
+        db.session.flush()
+        admin = UserAccount(name="Admin", email="admin@test.com", profileID=admin_profile.profileID)
+        admin.password = "12345"
+        pin_profile = UserProfile(profileName="Person in Need")
+        db.session.add_all([admin, pin_profile])
+        db.session.flush()
+        pin = UserAccount(name="Pin", email="pin@test.com", profileID=pin_profile.profileID)
+        pin.password = "12345"
+        db.session.add(pin)
+        db.session.commit()
+    yield app
+
+@pytest.fixture()
+def client(app):
+    return app.test_client()
+
+def _add_rows(n, owner_email="csr@test.com"):
+    # each row gets its own other party (PIN or CSR) and category so lazy loads could not hit the identity map
+    owner = UserAccount.query.filter_by(email=owner_email).first()
+    for i in range(n):
+        tag = f"{Request.query.count()}-{i}"
+        other = UserAccount(name=f"User {tag}", email=f"user{tag}@test.com", profileID=owner.profileID)
+        other.password = "x"
+        cat = Category(categoryName=f"Cat {tag}")
+        db.session.add_all([other, cat])
+        db.session.flush()
+        csr, pin = (other, owner) if owner_email == "pin@test.com" else (owner, other)
+        req = Request(pinID=pin.userID, categoryID=cat.categoryID, title=f"Req {tag}", status="open")
+        db.session.add(req)
+        db.session.flush()
+        db.session.add(Shortlist(csrRepID=csr.userID, requestID=req.requestID))
+        db.session.add(MatchRecord(requestID=req.requestID, csrRepID=csr.userID, pinID=pin.userID,
+                                   categoryID=cat.categoryID, completedAt=datetime(2025, 10, 1)))
+    CategoryRegistry.changed()  # new categories, as the platform controllers would announce them
+    db.session.commit()
+
+@pytest.mark.parametrize("url", [
+    "/csr/requests",
+    "/csr/requests?mode=cursor",
+    "/csr/shortlist",
+    "/csr/matches",
+    "/admin/users",
+    "/pin/requests",
+    "/pin/match-records",
+])
+def test_listing_query_count_does_not_grow_with_rows(app, client, count_queries, url):
+    owner = "pin@test.com" if url.startswith("/pin/") else "csr@test.com"
+    email = "admin@test.com" if url.startswith("/admin") else owner
+    client.post("/login", data={"email": email, "password": "12345"})
+    client.get(url)  # warm the session-user cache so both measured requests start alike
+
+    with app.app_context():
+        _add_rows(1, owner)
+    with count_queries() as one_row:
+        assert client.get(url).status_code == 200
+
+    with app.app_context():
+        _add_rows(8, owner)
+    with count_queries() as many_rows:
+        assert client.get(url).status_code == 200
+
+    assert len(many_rows) == len(one_row)
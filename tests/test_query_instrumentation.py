@@ -0,0 +1,84 @@
+import json
+import logging
+import pytest
+from app import create_app, db
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.control.query_instrumentation import RequestQueries, redact
+
+def _make_app(**config):
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+        "REPORT_JOB_WORKERS": 0,
+        **config,
+    })
+    with app.app_context():
+        db.create_all()
+        profile = UserProfile(profileName="User Admin")
+        db.session.add(profile)
+        db.session.flush()
+        u = UserAccount(name="Admin", email="admin@test.com", profileID=profile.profileID)
+        u.password = "12345"
+        db.session.add(u)
+        db.session.commit()
+    return app
+
+def _admin(app):
+    client = app.test_client()
+    client.post("/login", data={"email": "admin@test.com", "password": "12345"})
+    return client
+
+def test_redact_hides_literals_and_parameters():
+    sql = "SELECT * FROM user_accounts AS ua_1 WHERE email = 'bob@x.com' AND age > 30 AND name = ?"
+    assert redact(sql, ("secret",)) == \
+        "SELECT * FROM user_accounts AS ua_1 WHERE email = '?' AND age > ? AND name = ? [1 parameters redacted]"
+
+def test_keeps_only_slowest_statements():
+    queries = RequestQueries(top=2)
+    for i, seconds in enumerate((0.001, 0.005, 0.002, 0.004)):
+        queries.add(f"SELECT {i}", None, seconds)
+    assert queries.count == 4 and round(queries.total, 3) == 0.012
+    assert queries.slowest() == [(5.0, "SELECT ?"), (4.0, "SELECT ?")]
+
+def test_request_summary_header_and_buffer():
+    app = _make_app(SQL_SERVER_TIMING=True)
+    client = _admin(app)
+    resp = client.get("/admin/users")
+    assert resp.headers["Server-Timing"].startswith("db;dur=")
+    record = app.extensions["query_instrumentation"].recentRequests()[0]
+    assert record["path"] == "/admin/users" and record["queries"] >= 1
+    assert f'desc="{record["queries"]} queries"' in resp.headers["Server-Timing"]
+    assert all("[" in sql or "?" in sql for _, sql in record["slowest"])
+
+    page = client.get("/admin/sql-stats")
+    assert page.status_code == 200 and b"/admin/users" in page.data
+
+def test_failed_statements_leave_no_state_on_the_connection():
+    from sqlalchemy import text
+    from flask import g
+    app = _make_app()
+    with app.test_request_context():
+        g.sql_queries = RequestQueries(3)
+        with db.engine.connect() as conn:
+            for _ in range(3):
+                with pytest.raises(Exception):
+                    conn.execute(text("SELECT * FROM no_such_table"))
+            conn.execute(text("SELECT 1"))
+            assert not conn.info.get("query_start")
+        assert g.sql_queries.count == 1
+
+def test_threshold_logs_structured_warning(caplog):
+    app = _make_app(SQL_QUERY_COUNT_WARN=1)
+    client = _admin(app)
+    with caplog.at_level(logging.WARNING, logger="app.sql"):
+        client.get("/admin/users")
+    record = json.loads(caplog.records[-1].getMessage())
+    assert record["endpoint"] == "boundary.admin_users" and "query_count" in record["flags"]
+    assert app.extensions["query_instrumentation"].recentRequests(flagged_only=True)
+
+def test_disabled():
+    app = _make_app(SQL_INSTRUMENTATION=False, SQL_SERVER_TIMING=True)
+    resp = _admin(app).get("/admin/users")
+    assert "Server-Timing" not in resp.headers
+    assert app.extensions["query_instrumentation"].recentRequests() == []
@@ -0,0 +1,107 @@
+import time
+import pytest
+from datetime import datetime, timedelta
+from app import create_app, db
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.entity.category import Category
+from app.entity.report import Report
+from app.entity.report_job import ReportJob
+from app.control.report_jobs import get_report_jobs
+
+def _make_app(uri, workers):
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": uri,
+        "REPORT_JOB_WORKERS": workers,
+    })
+    with app.app_context():
+        db.create_all()
+        profile = UserProfile(profileName="Platform Manager")
+        db.session.add(profile)
+        db.session.flush()
+        pm = UserAccount(name="Pm", email="pm@test.com", profileID=profile.profileID)
+        pm.password = "12345"
+        db.session.add_all([pm, Category(categoryName="Transport")])
+        db.session.commit()
+    return app
+
+@pytest.fixture()
+def app():
+    yield _make_app("sqlite:///:memory:", 0)  # jobs run inline
+
+def test_inline_job_stores_report(app):
+    with app.app_context():
+        job = get_report_jobs().submit(1, "monthly", "2025-10")
+        status = get_report_jobs().status(job.jobID)
+        assert status["status"] == "done" and status["progress"] == 100
+        assert db.session.get(Report, status["reportID"]).period == "2025-10"
+
+def test_bad_period_is_rejected_before_queueing(app):
+    with app.app_context():
+        with pytest.raises(ValueError):
+            get_report_jobs().submit(1, "monthly", "October")
+        with pytest.raises(ValueError):
+            get_report_jobs().submit(1, "yearly", "2025")
+        assert ReportJob.query.count() == 0
+
+def test_identical_active_job_is_reused_unless_stale(app):
+    with app.app_context():
+        # queued long ago but started just now: staleness counts from the start
+        running = ReportJob(reportType="daily", period="2025-10-21", requestedBy=1, status="running",
+                            createdAt=datetime.now() - timedelta(hours=1), startedAt=datetime.now())
+        db.session.add(running)
+        db.session.commit()
+        assert get_report_jobs().submit(1, "daily", "2025-10-21").jobID == running.jobID
+
+        running.startedAt = datetime.now() - timedelta(hours=1)
+        db.session.commit()
+        fresh = get_report_jobs().submit(1, "daily", "2025-10-21")
+        assert fresh.jobID != running.jobID and fresh.status == "done"
+        assert db.session.get(ReportJob, running.jobID).status == "failed"
+
+def test_listing_leaves_stale_jobs_out_without_writing(app):
+    with app.app_context():
+        stale = ReportJob(reportType="weekly", period="2025-10-20", requestedBy=1,
+                          status="queued", createdAt=datetime.now() - timedelta(hours=1))
+        live = ReportJob(reportType="daily", period="2025-10-21", requestedBy=1,
+                         status="running", createdAt=datetime.now(), startedAt=datetime.now())
+        db.session.add_all([stale, live])
+        db.session.commit()
+        assert [job.jobID for job in get_report_jobs().activeJobs()] == [live.jobID]
+        assert db.session.get(ReportJob, stale.jobID).status == "queued"
+
+        assert get_report_jobs().reapStale() == 1
+        assert db.session.get(ReportJob, stale.jobID).status == "failed"
+
+def test_reaped_job_is_not_overwritten_by_its_late_finish(app):
+    with app.app_context():
+        job = ReportJob(reportType="daily", period="2025-10-21", requestedBy=1, status="running",
+                        createdAt=datetime.now() - timedelta(hours=2), startedAt=datetime.now() - timedelta(hours=1))
+        db.session.add(job)
+        db.session.commit()
+        get_report_jobs().reapStale()
+        assert get_report_jobs()._finish(job.jobID, "done", report_id=None) is False
+        assert get_report_jobs().status(job.jobID)["status"] == "failed"
+
+def test_pages_queue_then_show_the_report(app):
+    client = app.test_client()
+    client.post("/login", data={"email": "pm@test.com", "password": "12345"})
+    resp = client.post("/pm/reports/generate", data={"report_type": "weekly", "period": "2025-10-20"})
+    job_url = resp.headers["Location"]
+    assert "/pm/reports/jobs/" in job_url
+    assert client.get(job_url + "/status").get_json()["status"] == "done"
+    assert client.get(job_url).status_code == 302  # done -> report page
+    assert client.get("/pm/reports").status_code == 200
+
+def test_background_worker_finishes_job(tmp_path):
+    app = _make_app(f"sqlite:///{tmp_path / 'jobs.db'}", 1)
+    with app.app_context():
+        job_id = get_report_jobs().submit(1, "daily", "2025-10-21").jobID
+        deadline = time.time() + 10
+        while time.time() < deadline:
+            db.session.expire_all()
+            if get_report_jobs().status(job_id)["status"] not in ("queued", "running"):
+                break
+            time.sleep(0.05)
+        assert get_report_jobs().status(job_id)["status"] == "done"
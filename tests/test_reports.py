@@ -0,0 +1,175 @@
+import json
+import pytest
+from datetime import datetime, timedelta
+from app import create_app, db
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.entity.category import Category
+from app.entity.request import Request
+from app.entity.match_record import MatchRecord
+from app.control.platform_generateDailyReport_controller import PlatformGenerateDailyReportController
+from app.control.platform_generateWeeklyReport_controller import PlatformGenerateWeeklyReportController
+from app.control.platform_generateMonthlyReport_controller import PlatformGenerateMonthlyReportController
+from app.control.pin_createRequest_controller import PinCreateRequestController
+from app.control.pin_updateRequest_controller import PinUpdateRequestController
+from app.control.pin_deleteRequest_controller import PinDeleteRequestController
+from app.control.report_rollup import ReportRollup
+from app.entity.daily_rollup import DailyRollup
+
+@pytest.fixture()
+def app():
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+    })
+    with app.app_context():
+        db.create_all()
+        _seed()
+    yield app
+
+def _seed():
+    # 2 categories (one unused), 5 requests, 2 completed matches
+    profile = UserProfile(profileName="PIN")
+    db.session.add(profile)
+    db.session.flush()
+    pin = UserAccount(name="Pin", email="pin@test.com", profileID=profile.profileID)
+    pin.password = "12345"
+    csr = UserAccount(name="Csr", email="csr@test.com", profileID=profile.profileID)
+    csr.password = "12345"
+    transport = Category(categoryName="Transport")
+    health = Category(categoryName="Health")
+    db.session.add_all([pin, csr, transport, health])
+    db.session.flush()
+
+    for status in ("open", "open", "closed", "draft"):
+        db.session.add(Request(pinID=pin.userID, categoryID=transport.categoryID, title="t", status=status))
+    r = Request(pinID=pin.userID, categoryID=transport.categoryID, title="t", status="completed")
+    db.session.add(r)
+    db.session.flush()
+
+    for completed in (datetime(2025, 10, 21, 9, 0), datetime.utcnow() - timedelta(days=60)):
+        db.session.add(MatchRecord(requestID=r.requestID, csrRepID=csr.userID, pinID=pin.userID,
+                                   categoryID=transport.categoryID, completedAt=completed))
+    db.session.commit()
+
+    # rows above were written directly, so backfill the rollups like an existing database
+    ReportRollup().rebuild()
+
+def test_daily_report_summary_and_breakdown(app):
+    with app.app_context():
+        report = PlatformGenerateDailyReportController().generateDailyReport(1, "2025-10-21")
+        data = json.loads(report.reportData)
+        assert data["summary"] == {
+            "total_users": 2,
+            "total_requests": 5,
+            "open_requests": 2,
+            "closed_requests": 1,
+            "total_matches": 2,
+            "recent_matches_30_days": 0,
+        }
+        assert data["category_breakdown"] == {
+            "Transport": {"total_requests": 5, "open_requests": 2, "closed_requests": 1},
+            "Health": {"total_requests": 0, "open_requests": 0, "closed_requests": 0},
+        }
+
+def test_weekly_report_counts_matches_in_week(app):
+    with app.app_context():
+        report = PlatformGenerateWeeklyReportController().generateWeeklyReport(1, "2025-10-20")
+        summary = json.loads(report.reportData)["summary"]
+        assert summary["matches_completed_this_week"] == 1
+        assert summary["week_end"] == "2025-10-27"
+        assert report.period == "2025-10-20"
+
+def test_monthly_report_persists_row(app):
+    with app.app_context():
+        report = PlatformGenerateMonthlyReportController().generateMonthlyReport(1, "2025-10")
+        assert report.reportID is not None
+        assert report.reportType == "monthly"
+        assert json.loads(report.reportData)["summary"]["total_requests"] == 5
+
+def _rollup_snapshot():
+    return sorted(
+        (r.day, r.categoryID, r.status, r.requestCount, r.matchCount)
+        for r in DailyRollup.query.all()
+        if r.requestCount or r.matchCount
+    )
+
+def test_write_controllers_keep_rollups_in_sync(app):
+    with app.app_context():
+        pin = UserAccount.query.filter_by(email="pin@test.com").first()
+        health = Category.query.filter_by(categoryName="Health").first()
+
+        PinCreateRequestController().createRequest(userID=pin.userID, categoryID=health.categoryID,
+                                                   title="new", description="d")
+        created = Request.query.order_by(Request.requestID.desc()).first()
+        PinUpdateRequestController().updateRequest(created.requestID, None, pin.userID,
+                                                   None, None, None, status="closed")
+        victim = Request.query.filter_by(status="completed").first()
+        PinDeleteRequestController().deleteRequest(victim.requestID, pin.userID)
+
+        incremental = _rollup_snapshot()
+        ReportRollup().rebuild()
+        assert incremental == _rollup_snapshot()
+
+        report = PlatformGenerateDailyReportController().generateDailyReport(1, "2025-10-21")
+        data = json.loads(report.reportData)
+        assert data["category_breakdown"]["Health"] == {
+            "total_requests": 1, "open_requests": 0, "closed_requests": 1,
+        }
+        assert data["summary"]["total_matches"] == 0
+
+def test_unchanged_data_reuses_the_stored_report(app):
+    with app.app_context():
+        daily = PlatformGenerateDailyReportController()
+        first = daily.generateDailyReport(1, "2025-10-21")
+        assert daily.generateDailyReport(1, "2025-10-21").reportID == first.reportID
+        assert daily.generateDailyReport(1, "2025-10-21", force=True).reportID != first.reportID
+
+        pin = UserAccount.query.filter_by(email="pin@test.com").first()
+        PinCreateRequestController().createRequest(userID=pin.userID, categoryID=1, title="new", description="d")
+        fresh = daily.generateDailyReport(1, "2025-10-21")
+        assert json.loads(fresh.reportData)["summary"]["total_requests"] == 6
+
+        weekly = PlatformGenerateWeeklyReportController()
+        week = weekly.generateWeeklyReport(1, "2025-10-20")
+        assert weekly.generateWeeklyReport(1, "2025-10-20").reportID == week.reportID
+        assert weekly.generateWeeklyReport(1, "2025-10-27").reportID != week.reportID
+
+def test_reports_backfill_an_empty_rollup_table(app):
+    with app.app_context():
+        DailyRollup.query.delete()
+        db.session.commit()
+        report = PlatformGenerateDailyReportController().generateDailyReport(1, "2025-10-21")
+        assert json.loads(report.reportData)["summary"]["total_requests"] == 5
+        assert DailyRollup.query.count() > 0
+
+def test_match_completion_updates_rollups(app):
+    from app.control import data_version
+    with app.app_context():
+        r = Request.query.filter_by(status="completed").first()
+        pending = MatchRecord(requestID=r.requestID, csrRepID=2, pinID=1, categoryID=r.categoryID)
+        db.session.add(pending)
+        db.session.commit()
+
+        before = data_version.current(data_version.REPORT_DATA)[0]
+        pending.completedAt = datetime.utcnow()
+        db.session.commit()
+        assert data_version.current(data_version.REPORT_DATA)[0] == before + 1
+
+        incremental = _rollup_snapshot()
+        ReportRollup().rebuild()
+        assert incremental == _rollup_snapshot()
+
+        summary = json.loads(PlatformGenerateDailyReportController()
+                             .generateDailyReport(1, "2025-10-21").reportData)["summary"]
+        assert summary["total_matches"] == 3  # every match record, completed or not
+        assert summary["recent_matches_30_days"] == 1
+
+def test_one_version_bump_per_write(app):
+    from app.control import data_version
+    with app.app_context():
+        victim = Request.query.filter_by(status="open").first()
+        before = data_version.current(data_version.REPORT_DATA)[0]
+        PinUpdateRequestController().updateRequest(victim.requestID, None, victim.pinID,
+                                                   2, None, None, status="closed")
+        assert data_version.current(data_version.REPORT_DATA)[0] == before + 1
@@ -0,0 +1,96 @@
+import threading
+import pytest
+from sqlalchemy.pool import QueuePool
+from app import create_app, db
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.control.db_engine import pool_status
+from app.control.request_metrics import RequestMetrics
+
+@pytest.fixture()
+def app():
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+        "REPORT_JOB_WORKERS": 0,
+    })
+    with app.app_context():
+        db.create_all()
+        profile = UserProfile(profileName="User Admin")
+        db.session.add(profile)
+        db.session.flush()
+        u = UserAccount(name="Admin", email="admin@test.com", profileID=profile.profileID)
+        u.password = "12345"
+        db.session.add(u)
+        db.session.commit()
+    yield app
+
+def test_histogram_merges_thread_shards():
+    metrics = RequestMetrics()
+    metrics.buckets = (0.1, 1.0)
+    metrics.observe("boundary.a", 200, 0.05, 0.01)
+    worker = threading.Thread(target=lambda: [metrics.observe("boundary.a", 500, 0.5) for _ in range(2)])
+    worker.start()
+    worker.join()
+    metrics.observe("boundary.a", 200, 3.0)
+
+    merged = metrics.snapshot()["boundary.a"]
+    assert merged.count == 4 and merged.errors == 2
+    assert merged.buckets == [1, 2] and merged.statuses == {"2xx": 2, "5xx": 2}
+    text = metrics.render()
+    assert 'http_request_duration_seconds_bucket{endpoint="boundary.a",le="0.1"} 1' in text
+    assert 'http_request_duration_seconds_bucket{endpoint="boundary.a",le="1"} 3' in text
+    assert 'http_request_duration_seconds_bucket{endpoint="boundary.a",le="+Inf"} 4' in text
+    assert 'http_request_errors_total{endpoint="boundary.a"} 2' in text
+
+def test_finished_thread_shards_are_folded():
+    metrics = RequestMetrics()
+    metrics.buckets = (0.1, 1.0)
+    for _ in range(50):  # one thread per request, as in the threaded dev server
+        worker = threading.Thread(target=metrics.observe, args=("boundary.a", 200, 0.05))
+        worker.start()
+        worker.join()
+    assert len(metrics._shards) <= 1
+    assert metrics.snapshot()["boundary.a"].count == 50
+    assert metrics._shards == {}
+    assert metrics.snapshot()["boundary.a"].count == 50  # folding does not count twice
+
+def test_metrics_endpoint_labels_by_endpoint(app):
+    client = app.test_client()
+    client.post("/login", data={"email": "admin@test.com", "password": "12345"})
+    client.get("/admin/users")
+    client.get("/no-such-page")
+    text = client.get("/metrics").get_data(as_text=True)
+    assert 'http_requests_total{endpoint="boundary.admin_users",status="2xx"} 1' in text
+    assert 'http_requests_total{endpoint="boundary.login",status="3xx"} 1' in text
+    assert 'http_requests_total{endpoint="unmatched",status="4xx"} 1' in text
+    assert 'http_request_db_seconds_total{endpoint="boundary.admin_users"}' in text
+
+def test_metrics_token(app):
+    app.config["METRICS_TOKEN"] = "s3cret"
+    client = app.test_client()
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer s3cret"}).status_code == 200
+
+def test_health_readiness(app):
+    client = app.test_client()
+    assert client.get("/health").get_json() == {"status": "ok"}
+    resp = client.get("/health?ready=1")
+    assert resp.status_code == 200 and resp.get_json()["database"] == "ok"
+
+def test_readiness_fails_when_pool_saturated(tmp_path):
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'pool.db'}",
+        "SQLALCHEMY_ENGINE_OPTIONS": {"poolclass": QueuePool, "pool_size": 2, "max_overflow": 0},
+        "REPORT_JOB_WORKERS": 0,
+    })
+    with app.app_context():
+        held = [db.engine.connect() for _ in range(2)]
+        assert pool_status(db.engine, max_overflow=0)["saturation"] == 1.0
+    try:
+        resp = app.test_client().get("/health?ready=1")
+    finally:
+        for conn in held:
+            conn.close()
+    assert resp.status_code == 503 and resp.get_json()["pools"]["primary"]["checked_out"] == 2
@@ -0,0 +1,91 @@
+import cProfile
+import os
+import pstats
+import pytest
+from app import create_app, db
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.control.request_profiler import collapsed_stacks
+
+def _make_app(tmp_path, **config):
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+        "REPORT_JOB_WORKERS": 0,
+        "PROFILE_DIR": str(tmp_path / "profiles"),
+        **config,
+    })
+    with app.app_context():
+        db.create_all()
+        profiles = [UserProfile(profileName=n) for n in ("User Admin", "CSR Rep")]
+        db.session.add_all(profiles)
+        db.session.flush()
+        for email, profile in (("admin", profiles[0]), ("csr", profiles[1])):
+            u = UserAccount(name=email, email=f"{email}@test.com", profileID=profile.profileID)
+            u.password = "12345"
+            db.session.add(u)
+        db.session.commit()
+    return app
+
+def _login(app, who):
+    client = app.test_client()
+    client.post("/login", data={"email": f"{who}@test.com", "password": "12345"})
+    return client
+
+def test_disabled_registers_nothing(tmp_path):
+    app = _make_app(tmp_path)
+    resp = _login(app, "admin").get("/admin/users?_profile=1")
+    assert "X-Profile-Capture" not in resp.headers
+    assert not os.path.exists(tmp_path / "profiles")
+    assert _login(app, "admin").get("/admin/profiling").status_code == 200
+
+def test_admin_flag_captures_pstats_and_stacks(tmp_path):
+    app = _make_app(tmp_path, PROFILING_ENABLED=True)
+    admin = _login(app, "admin")
+    assert "X-Profile-Capture" not in admin.get("/admin/users").headers
+    resp = admin.get("/admin/users", headers={"X-Profile": "1"})
+    name = resp.headers["X-Profile-Capture"]
+    assert "_boundary.admin_users_" in name
+    files = sorted(os.listdir(tmp_path / "profiles"))
+    assert files == [name + ".collapsed", name + ".pstats"]
+    pstats.Stats(str(tmp_path / "profiles" / (name + ".pstats")))  # loadable
+    stacks = (tmp_path / "profiles" / (name + ".collapsed")).read_text().splitlines()
+    assert any("admin_users" in line for line in stacks)
+
+    listing = admin.get("/admin/profiling")
+    assert name.encode() in listing.data
+    assert admin.get(f"/admin/profiling/{name}").status_code == 200
+    assert admin.get(f"/admin/profiling/{name}/collapsed").status_code == 200
+    assert admin.get("/admin/profiling/../../etc/passwd/pstats").status_code == 404
+
+def test_flag_ignored_for_non_admins(tmp_path):
+    app = _make_app(tmp_path, PROFILING_ENABLED=True)
+    resp = _login(app, "csr").get("/csr/dashboard?_profile=1")
+    assert "X-Profile-Capture" not in resp.headers
+
+def test_sampling_and_rotation(tmp_path):
+    app = _make_app(tmp_path, PROFILING_ENABLED=True, PROFILE_SAMPLE_RATE=1.0, PROFILE_MAX_FILES=3)
+    client = app.test_client()
+    for _ in range(5):
+        assert "X-Profile-Capture" in client.get("/login").headers
+    with app.app_context():
+        captures = app.extensions["request_profiler"].captures()
+    assert len(captures) == 3 and len(os.listdir(tmp_path / "profiles")) == 6
+
+def _leaf():
+    return sum(range(20000))
+
+def _middle():
+    return _leaf() + _leaf()
+
+def test_collapsed_stacks_follow_callers():
+    profile = cProfile.Profile()
+    profile.enable()
+    _middle()
+    profile.disable()
+    stacks = dict(line.rsplit(" ", 1) for line in collapsed_stacks(pstats.Stats(profile)))
+    leaf = [stack for stack in stacks if stack.endswith("builtins.sum>")]
+    assert len(leaf) == 1 and leaf[0].split(";")[-3:-1] == [
+        f"_middle (test_request_profiler.py:{_middle.__code__.co_firstlineno})",
+        f"_leaf (test_request_profiler.py:{_leaf.__code__.co_firstlineno})",
+    ]
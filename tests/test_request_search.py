@@ -0,0 +1,81 @@
+import pytest
+from app import create_app, db
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.entity.category import Category
+from app.entity.request import Request
+from app.control.request_search import get_search_backend
+from app.control.pin_createRequest_controller import PinCreateRequestController
+from app.control.pin_updateRequest_controller import PinUpdateRequestController
+from app.control.pin_deleteRequest_controller import PinDeleteRequestController
+from app.control.pin_searchRequest_controller import PinSearchRequestController
+from app.control.csr_searchRequest_controller import CsrSearchRequestController
+
+@pytest.fixture(params=["fts5", "like"])
+def app(request):
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+        "REQUEST_SEARCH_BACKEND": request.param,
+    })
+    with app.app_context():
+        db.create_all()
+        profile = UserProfile(profileName="Person in Need")
+        db.session.add(profile)
+        db.session.flush()
+        pin = UserAccount(name="Pin", email="pin@test.com", profileID=profile.profileID)
+        pin.password = "12345"
+        cat = Category(categoryName="Transport")
+        db.session.add_all([pin, cat])
+        db.session.commit()
+        create = PinCreateRequestController()
+        create.createRequest(userID=pin.userID, categoryID=cat.categoryID,
+                             title="Wheelchair transport", description="Ride to the clinic on Monday")
+        create.createRequest(userID=pin.userID, categoryID=cat.categoryID,
+                             title="Groceries", description="Weekly shopping, no transport needed")
+        create.createRequest(userID=pin.userID, categoryID=cat.categoryID,
+                             title="Tutoring", description="Math homework help")
+    yield app
+
+def _pin_id():
+    return UserAccount.query.filter_by(email="pin@test.com").first().userID
+
+def _titles(pagination):
+    return [r.title for r in pagination.items]
+
+def test_matches_title_and_description(app):
+    with app.app_context():
+        found = PinSearchRequestController().searchRequests(_pin_id(), keyword="transport")
+        assert sorted(_titles(found)) == ["Groceries", "Wheelchair transport"]
+        found = CsrSearchRequestController().searchRequest(None, keyword="clinic")
+        assert _titles(found) == ["Wheelchair transport"]
+
+def test_fts_ranks_and_matches_prefixes(app):
+    if app.extensions["request_search"].name != "fts5":
+        pytest.skip("ranking/prefix semantics are FTS5-only")
+    with app.app_context():
+        # title hit on a short field outranks a description hit
+        found = PinSearchRequestController().searchRequests(_pin_id(), keyword="transport")
+        assert _titles(found)[0] == "Wheelchair transport"
+        assert _titles(CsrSearchRequestController().searchRequest(None, keyword="tutor")) == ["Tutoring"]
+        assert _titles(CsrSearchRequestController().searchRequest(None, keyword="!!")) == []
+
+def test_index_follows_update_and_delete(app):
+    with app.app_context():
+        pin_id = _pin_id()
+        tutoring = Request.query.filter_by(title="Tutoring").first()
+        PinUpdateRequestController().updateRequest(tutoring.requestID, None, pin_id, None,
+                                                   "Science tutoring", "Physics revision")
+        assert _titles(PinSearchRequestController().searchRequests(pin_id, keyword="physics")) == ["Science tutoring"]
+        assert _titles(PinSearchRequestController().searchRequests(pin_id, keyword="math")) == []
+
+        PinDeleteRequestController().deleteRequest(tutoring.requestID, pin_id)
+        assert _titles(PinSearchRequestController().searchRequests(pin_id, keyword="physics")) == []
+
+def test_rebuild_picks_up_direct_inserts(app):
+    with app.app_context():
+        db.session.add(Request(pinID=_pin_id(), categoryID=Category.query.first().categoryID,
+                               title="Dog walking", description="Evening walks", status="open"))
+        db.session.commit()
+        get_search_backend().rebuild()
+        assert _titles(CsrSearchRequestController().searchRequest(None, keyword="walking")) == ["Dog walking"]
@@ -0,0 +1,100 @@
+import pytest
+from app import create_app, db
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.control.role_map import CSR, PIN, get_role_map, role_for_name
+from app.control.useradmin_updateUserProfile_controller import UserAdminUpdateUserProfileController
+
+@pytest.fixture()
+def app():
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+    })
+    with app.app_context():
+        db.create_all()
+        profile = UserProfile(profileName="Person in Need")
+        db.session.add(profile)
+        db.session.flush()
+        pin = UserAccount(name="Pin", email="pin@test.com", profileID=profile.profileID)
+        pin.password = "12345"
+        db.session.add(pin)
+        db.session.commit()
+    yield app
+
+@pytest.fixture()
+def client(app):
+    return app.test_client()
+
+@pytest.mark.parametrize("name, role", [
+    ("CSR Rep", "csr"), ("csr representative", "csr"), ("person-in-need", "pin"),
+    ("UserAdmin", "useradmin"), ("Platform Manager", "platform"), ("Volunteer", None),
+])
+def test_profile_names_normalize_to_roles(name, role):
+    assert role_for_name(name) == role
+
+def test_login_stores_role_and_routes_check_it(app, client, count_queries):
+    resp = client.post("/login", data={"email": "pin@test.com", "password": "12345"})
+    assert resp.headers["Location"].endswith("/pin/dashboard")
+    with client.session_transaction() as sess:
+        assert sess["role"] == PIN
+
+    client.get("/pin/dashboard")
+    with count_queries() as queries:
+        assert client.get("/csr/dashboard").status_code == 403
+    # only the session user's cache_versions stamp check; the role comes from the session
+    assert len(queries) == 1 and "FROM cache_versions" in queries[0]
+
+def test_profile_rename_refreshes_the_map(app):
+    with app.app_context():
+        UserAdminUpdateUserProfileController().updateUserProfile(1, profileName="CSR Rep")
+        assert get_role_map().roleFor(1) == CSR
+
+def _add_admin(app):
+    with app.app_context():
+        admin_profile = UserProfile(profileName="UserAdmin")
+        csr_profile = UserProfile(profileName="CSR Rep")
+        db.session.add_all([admin_profile, csr_profile])
+        db.session.flush()
+        admin = UserAccount(name="Admin", email="admin@test.com", profileID=admin_profile.profileID)
+        admin.password = "12345"
+        db.session.add(admin)
+        db.session.commit()
+        return admin.userID, admin_profile.profileID, csr_profile.profileID
+
+def test_demoted_user_loses_the_old_role_in_the_same_session(app, client):
+    from app.control.useradmin_updateUserAccount_controller import UserAdminUpdateUserAccountController
+    user_id, _, csr_profile = _add_admin(app)
+    client.post("/login", data={"email": "admin@test.com", "password": "12345"})
+    assert client.get("/admin/users").status_code == 200
+
+    with app.app_context():
+        UserAdminUpdateUserAccountController().updateUserAccount(user_id, profileID=csr_profile)
+    assert client.get("/admin/users").status_code == 403
+    assert client.get("/csr/requests").status_code == 200
+
+def test_suspended_profile_has_no_role(app, client):
+    from app.control.useradmin_suspendUserProfile_controller import UserAdminSuspendUserProfileController
+    _, admin_profile, _ = _add_admin(app)
+    client.post("/login", data={"email": "admin@test.com", "password": "12345"})
+    assert client.get("/admin/users").status_code == 200
+
+    with app.app_context():
+        UserAdminSuspendUserProfileController().suspendUserProfile(admin_profile)
+    assert client.get("/admin/users").status_code == 403
+
+def test_profile_change_in_another_worker_is_picked_up(app, client):
+    from app.control import data_version
+    _, admin_profile, _ = _add_admin(app)
+    client.post("/login", data={"email": "admin@test.com", "password": "12345"})
+    assert client.get("/admin/users").status_code == 200
+
+    # another worker renames the profile: only the stored version moves, this worker's table is untouched
+    with app.app_context():
+        db.session.get(UserProfile, admin_profile).profileName = "csr representative"
+        data_version.bump(data_version.PROFILES)
+        db.session.commit()
+    assert client.get("/admin/users").status_code == 200  # within the check interval
+    app.extensions["role_map"].check_interval = 0
+    assert client.get("/admin/users").status_code == 403
+    assert client.get("/csr/requests").status_code == 200
@@ -0,0 +1,75 @@
+import pytest
+from app import create_app, db
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.control.useradmin_suspendUserAccount_controller import UserAdminSuspendUserAccountController
+from app.control.useradmin_updateUserProfile_controller import UserAdminUpdateUserProfileController
+from app.control.session_user_cache import SessionUserCache, get_session_user_cache
+
+@pytest.fixture()
+def app():
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+        "SESSION_USER_CACHE_TTL": 3600,
+    })
+    with app.app_context():
+        db.create_all()
+        profile = UserProfile(profileName="Person in Need")
+        db.session.add(profile)
+        db.session.flush()
+        pin = UserAccount(name="Pin", email="pin@test.com", profileID=profile.profileID)
+        pin.password = "12345"
+        db.session.add(pin)
+        db.session.commit()
+    yield app
+
+@pytest.fixture()
+def client(app):
+    c = app.test_client()
+    c.post("/login", data={"email": "pin@test.com", "password": "12345"})
+    return c
+
+def test_cached_user_costs_no_query(app, client, count_queries):
+    client.get("/pin/requests")  # warm the cache
+    with count_queries() as queries:
+        assert client.get("/pin/requests").status_code == 200
+    assert not any("FROM user_accounts" in q or "FROM user_profiles" in q for q in queries)
+    assert sum("FROM cache_versions" in q for q in queries) == 1
+
+def test_suspension_ends_the_session_at_once(app, client):
+    client.get("/pin/requests")
+    with app.app_context():
+        UserAdminSuspendUserAccountController().suspendUserAccount(1)
+    assert client.get("/pin/requests").status_code == 302
+
+def test_profile_update_refreshes_snapshot(app, client):
+    assert b"(Person in Need)" in client.get("/pin/requests").data
+    with app.app_context():
+        UserAdminUpdateUserProfileController().updateUserProfile(1, profileName="PIN")
+    assert b"(PIN)" in client.get("/pin/requests").data
+
+def test_suspension_in_another_worker_ends_the_session(app, client):
+    client.get("/pin/requests")
+    with app.app_context():
+        # another worker's write: the counter moves, this worker's entry is left in place
+        UserAccount.query.get(1).isActive = False
+        SessionUserCache.changed()
+        db.session.commit()
+        assert get_session_user_cache()._entries
+    assert client.get("/pin/requests").status_code == 302
+
+def test_load_overlapping_an_invalidation_is_not_stored(app, monkeypatch):
+    with app.app_context():
+        cache = get_session_user_cache()
+        load = cache._load
+
+        def racing_load(user_id):
+            user = load(user_id)  # read before the suspension commits
+            UserAdminSuspendUserAccountController().suspendUserAccount(user_id)
+            return user
+
+        monkeypatch.setattr(cache, "_load", racing_load)
+        assert cache.get(1) is not None
+        monkeypatch.setattr(cache, "_load", load)
+        assert cache.get(1) is None
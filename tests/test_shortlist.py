@@ -0,0 +1,73 @@
+import pytest
+from sqlalchemy import text
+from app import create_app, db
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.entity.category import Category
+from app.entity.request import Request
+from app.entity.shortlist import Shortlist
+from app.control.csr_saveToShortlist_controller import CsrSaveToShortlistController
+from app.control.csr_removeShortlist_controller import CsrRemoveShortlistController
+from app.control.shortlist_maintenance import ShortlistMaintenance
+
+@pytest.fixture()
+def app():
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+    })
+    with app.app_context():
+        db.create_all()
+        profile = UserProfile(profileName="CSR Rep")
+        db.session.add(profile)
+        db.session.flush()
+        csr = UserAccount(name="Csr", email="csr@test.com", profileID=profile.profileID)
+        csr.password = "12345"
+        cat = Category(categoryName="Transport")
+        db.session.add_all([csr, cat])
+        db.session.flush()
+        db.session.add(Request(pinID=csr.userID, categoryID=cat.categoryID, title="t"))
+        db.session.commit()
+    yield app
+
+def _ids():
+    return UserAccount.query.first().userID, Request.query.first().requestID
+
+def test_save_is_idempotent_and_counts_once(app):
+    with app.app_context():
+        csr_id, req_id = _ids()
+        assert CsrSaveToShortlistController().saveToShortlist(req_id, csr_id) is True
+        assert CsrSaveToShortlistController().saveToShortlist(req_id, csr_id) is False
+        assert Shortlist.query.count() == 1
+        assert db.session.get(Request, req_id).shortlistCount == 1
+
+def test_save_unknown_request_raises(app):
+    with app.app_context():
+        csr_id, _ = _ids()
+        with pytest.raises(ValueError):
+            CsrSaveToShortlistController().saveToShortlist(999, csr_id)
+
+def test_remove_decrements_and_rejects_missing(app):
+    with app.app_context():
+        csr_id, req_id = _ids()
+        CsrSaveToShortlistController().saveToShortlist(req_id, csr_id)
+        assert CsrRemoveShortlistController().removeFromShortlist(csr_id, req_id) is True
+        assert db.session.get(Request, req_id).shortlistCount == 0
+        with pytest.raises(ValueError):
+            CsrRemoveShortlistController().removeFromShortlist(csr_id, req_id)
+
+def test_reconcile_repairs_duplicates_and_drift(app):
+    with app.app_context():
+        csr_id, req_id = _ids()
+        # simulate a legacy table: no unique index, duplicate rows, drifted counter
+        db.session.execute(text("DROP INDEX uq_shortlist_csr_request"))
+        for _ in range(3):
+            db.session.add(Shortlist(csrRepID=csr_id, requestID=req_id))
+        db.session.get(Request, req_id).shortlistCount = 7
+        db.session.commit()
+
+        result = ShortlistMaintenance().reconcile()
+        assert result == {"duplicates_removed": 2, "counters_fixed": 1}
+        db.session.expire_all()
+        assert db.session.get(Request, req_id).shortlistCount == 1
+        assert CsrSaveToShortlistController().saveToShortlist(req_id, csr_id) is False
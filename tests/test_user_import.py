@@ -0,0 +1,146 @@
+import io
+import json
+import pytest
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from app import create_app, db
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.control.useradmin_importUserAccounts_controller import (
+    UserAdminImportUserAccountsController, format_for_filename
+)
+
+@pytest.fixture()
+def app():
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+        "REPORT_JOB_WORKERS": 0,
+        "USER_IMPORT_HASH_WORKERS": 0,
+    })
+    with app.app_context():
+        db.create_all()
+        admin_profile = UserProfile(profileName="User Admin")
+        csr_profile = UserProfile(profileName="CSR Rep")
+        db.session.add_all([admin_profile, csr_profile])
+        db.session.flush()
+        admin = UserAccount(name="Admin", email="admin@test.com", profileID=admin_profile.profileID)
+        admin.password = "12345"
+        db.session.add(admin)
+        db.session.commit()
+        app.csr_profile_id = csr_profile.profileID
+    yield app
+
+def _csv(rows):
+    lines = ["name,email,password,age,phoneNumber,profileID"] + [",".join(map(str, r)) for r in rows]
+    return ("\n".join(lines) + "\n").encode()
+
+def test_csv_import_reports_bad_rows_and_imports_the_rest(app):
+    pid = app.csr_profile_id
+    data = _csv([
+        ("Ann", "ann@x.com", "pw1", 30, "", pid),
+        ("Dup", "admin@test.com", "pw2", "", "", pid),   # existing email
+        ("Ann2", "ann@x.com", "pw3", "", "", pid),       # duplicate in file
+        ("Bob", "bob@x.com", "pw4", "", "", 999),        # unknown profile
+        ("Cat", "cat@x.com", "pw5", "old", "", pid),     # bad age
+        ("Dan", "dan@x.com", "pw6", "", "555", pid),
+    ])
+    with app.app_context():
+        controller = UserAdminImportUserAccountsController(hash_workers=0, batch_size=1)
+        result = controller.importUserAccounts(controller.parseFile(io.BytesIO(data), "csv"))
+        assert result["created"] == 2
+        assert [e["row"] for e in result["errors"]] == [2, 3, 4, 5]
+        ann = UserAccount.query.filter_by(email="ann@x.com").one()
+        assert ann.age == 30 and ann.isActive
+        assert ann.check_password("pw1")
+
+def test_emails_are_compared_lowercased(app):
+    pid = app.csr_profile_id
+    data = _csv([
+        ("Ann", "Ann@X.com", "pw1", "", "", pid),
+        ("Ann2", "ann@x.com", "pw2", "", "", pid),       # same address, other case
+        ("Dup", "ADMIN@test.com", "pw3", "", "", pid),   # existing email, other case
+    ])
+    with app.app_context():
+        controller = UserAdminImportUserAccountsController(hash_workers=0)
+        result = controller.importUserAccounts(controller.parseFile(io.BytesIO(data), "csv"))
+        assert result["created"] == 1
+        assert [(e["row"], e["error"]) for e in result["errors"]] == [
+            (2, "Duplicate email in this file."), (3, "Email 'admin@test.com' already exists."),
+        ]
+        assert UserAccount.query.filter_by(email="ann@x.com").count() == 1
+
+def test_batch_conflict_is_retried_row_by_row(app, monkeypatch):
+    pid = app.csr_profile_id
+    rows = [{"name": f"U{i}", "email": f"u{i}@x.com", "password": "pw", "profileID": pid} for i in range(3)]
+    with app.app_context():
+        controller = UserAdminImportUserAccountsController(hash_workers=0)
+        validate = controller._validate
+
+        def racing_validate(rows, errors):
+            valid = validate(rows, errors)
+            # another admin creates u1 between validation and insert
+            db.session.add(UserAccount(name="Raced", email="u1@x.com", profileID=pid, _password="x"))
+            db.session.flush()
+            return valid
+
+        monkeypatch.setattr(controller, "_validate", racing_validate)
+        result = controller.importUserAccounts(rows)
+        assert result["created"] == 2
+        assert [e["row"] for e in result["errors"]] == [2]
+        assert "UNIQUE" in result["errors"][0]["error"]
+
+def test_other_insert_errors_roll_back_and_propagate(app, monkeypatch):
+    rows = [{"name": "Ann", "email": "ann@x.com", "password": "pw", "profileID": app.csr_profile_id}]
+    execute = Session.execute
+
+    def lost_connection(session, statement, *args, **kwargs):
+        if getattr(statement, "is_insert", False):
+            raise OperationalError("INSERT INTO user_accounts", {}, Exception("disk I/O error"))
+        return execute(session, statement, *args, **kwargs)
+
+    with app.app_context():
+        monkeypatch.setattr(Session, "execute", lost_connection)
+        with pytest.raises(OperationalError):  # not retried row by row or reported per row
+            UserAdminImportUserAccountsController(hash_workers=0).importUserAccounts(rows)
+        monkeypatch.undo()
+        assert UserAccount.query.filter_by(email="ann@x.com").count() == 0
+
+def test_jsonl_import_reports_invalid_lines(app):
+    pid = app.csr_profile_id
+    data = "\n".join([
+        json.dumps({"name": "Eve", "email": "eve@x.com", "password": "pw", "profileID": pid}),
+        "{not json",
+        json.dumps({"name": "Fay", "email": "fay@x.com", "profileID": pid}),  # no password
+    ]).encode()
+    with app.app_context():
+        controller = UserAdminImportUserAccountsController(hash_workers=0)
+        result = controller.importUserAccounts(controller.parseFile(io.BytesIO(data), "jsonl"))
+        assert result["created"] == 1
+        assert [e["row"] for e in result["errors"]] == [2, 3]
+
+def test_process_pool_hashing(app):
+    pid = app.csr_profile_id
+    rows = [{"name": f"U{i}", "email": f"u{i}@x.com", "password": f"pw{i}", "profileID": pid} for i in range(4)]
+    with app.app_context():
+        result = UserAdminImportUserAccountsController(hash_workers=2).importUserAccounts(rows)
+        assert result == {"created": 4, "errors": []}
+        u = UserAccount.query.filter_by(email="u3@x.com").one()
+        assert u.check_password("pw3")
+
+def test_format_for_filename():
+    assert format_for_filename("a.CSV") == "csv"
+    assert format_for_filename("a.ndjson") == "jsonl"
+    with pytest.raises(ValueError):
+        format_for_filename("a.xlsx")
+
+def test_import_route(app):
+    client = app.test_client()
+    client.post("/login", data={"email": "admin@test.com", "password": "12345"})
+    data = _csv([("Gus", "gus@x.com", "pw", "", "", app.csr_profile_id), ("Bad", "bad", "pw", "", "", app.csr_profile_id)])
+    resp = client.post("/admin/users/import", data={"file": (io.BytesIO(data), "users.csv")},
+                       content_type="multipart/form-data")
+    assert resp.status_code == 200
+    assert b"Invalid email" in resp.data
+    with app.app_context():
+        assert UserAccount.query.filter_by(email="gus@x.com").count() == 1
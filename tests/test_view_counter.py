@@ -0,0 +1,66 @@
+import threading
+import pytest
+from app import create_app, db
+from app.entity.user_profile import UserProfile
+from app.entity.user_account import UserAccount
+from app.entity.category import Category
+from app.entity.request import Request
+from app.control.csr_viewRequest_controller import CsrViewRequestController
+from app.control.pin_trackViews_controller import PinTrackViewsController
+from app.control.view_counter import get_view_counter
+
+@pytest.fixture()
+def app():
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+        "VIEW_COUNT_FLUSH_INTERVAL": 0,      # no timer thread; flush explicitly
+        "VIEW_COUNT_FLUSH_THRESHOLD": 1000,
+    })
+    with app.app_context():
+        db.create_all()
+        profile = UserProfile(profileName="PIN")
+        db.session.add(profile)
+        db.session.flush()
+        pin = UserAccount(name="Pin", email="pin@test.com", profileID=profile.profileID)
+        pin.password = "12345"
+        cat = Category(categoryName="Transport")
+        db.session.add_all([pin, cat])
+        db.session.flush()
+        db.session.add(Request(pinID=pin.userID, categoryID=cat.categoryID, title="t", viewCount=3))
+        db.session.commit()
+    yield app
+
+def test_views_are_buffered_then_flushed(app):
+    with app.app_context():
+        req_id = Request.query.first().requestID
+        for _ in range(5):
+            CsrViewRequestController().viewRequestDetails(req_id)
+
+        # not written yet, but the PIN still sees persisted + pending
+        assert db.session.get(Request, req_id).viewCount == 3
+        assert PinTrackViewsController().trackViews(req_id) == 8
+
+        assert get_view_counter().flush() == 1
+        db.session.expire_all()
+        assert db.session.get(Request, req_id).viewCount == 8
+        assert PinTrackViewsController().trackViews(req_id) == 8
+
+def test_concurrent_views_are_not_lost(app):
+    with app.app_context():
+        req_id = Request.query.first().requestID
+        counter = get_view_counter()
+
+    def view_many():
+        for _ in range(200):
+            counter.increment(req_id)
+
+    threads = [threading.Thread(target=view_many) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    with app.app_context():
+        counter.flush()
+        assert db.session.get(Request, req_id).viewCount == 3 + 8 * 200